@@ -0,0 +1,34 @@
+"""
+تراکنش‌هایی که پس از خواندن می‌نویسند
+
+SQLite تراکنش عادی (DEFERRED) را با قفل خواندن شروع می‌کند و هنگام اولین نوشتن آن را ارتقا
+می‌دهد. اگر در این فاصله پردازه یا نخ دیگری (مثلا نویسنده گزارش تغییرات) نوشته باشد، ارتقا بدون
+انتظار با «database is locked» شکست می‌خورد. immediate_atomic فقط برای همین بخش‌ها قفل نوشتن
+را از ابتدا (BEGIN IMMEDIATE) می‌گیرد تا تراکنش‌های فقط خواندنی بقیه برنامه قفل نگیرند.
+"""
+from contextlib import ExitStack, contextmanager
+
+from django.db import transaction
+
+
+@contextmanager
+def immediate_atomic(using=None):
+    """
+    مانند transaction.atomic؛ در SQLite تراکنش بیرونی با BEGIN IMMEDIATE شروع می‌شود و در
+    پایگاه‌های دیگر یا داخل تراکنش موجود تفاوتی ندارد. به صورت @immediate_atomic() هم قابل استفاده است.
+    """
+    connection = transaction.get_connection(using)
+    if connection.vendor != 'sqlite' or connection.in_atomic_block:
+        with transaction.atomic(using=using):
+            yield
+        return
+    connection.ensure_connection()
+    mode = connection.transaction_mode
+    connection.transaction_mode = 'IMMEDIATE'
+    with ExitStack() as stack:
+        try:
+            stack.enter_context(transaction.atomic(using=using))
+        finally:
+            # BEGIN در ورود به atomic اجرا شده است
+            connection.transaction_mode = mode
+        yield
@@ -0,0 +1,114 @@
+"""
+آماده‌سازی پردازه پیش از شروع پاسخ‌گویی
+
+با سرورهای pre-fork (مثلا gunicorn --preload) این کار یک بار در پردازه اصلی انجام می‌شود و
+پردازه‌های فرزند حافظه آماده را به صورت copy-on-write به اشتراک می‌گذارند؛ در غیر این صورت هر
+کارگر پیش از اولین درخواست خودش را آماده می‌کند. بدون آن، اولین درخواست هر کارگر جدید باید
+مسیرهای URL را بسازد، قالب‌ها را کامپایل کند و ماژول‌هایی را که Django با تأخیر بارگذاری می‌کند
+وارد کند.
+"""
+import gc
+import logging
+import os
+import time
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connections
+from django.template import TemplateSyntaxError, engines
+from django.urls import NoReverseMatch, get_resolver, reverse
+
+logger = logging.getLogger(__name__)
+
+# ماژول‌هایی که Django فقط هنگام اولین درخواست به صفحات مدیریت بارگذاری می‌کند
+LAZY_MODULES = [
+    'django.contrib.admin.views.main',
+    'django.contrib.admin.views.autocomplete',
+    'django.contrib.admin.templatetags.admin_list',
+    'django.contrib.admin.templatetags.admin_modify',
+    'django.contrib.admin.templatetags.admin_urls',
+    'django.contrib.admin.templatetags.log',
+    'django.contrib.auth.views',
+    'django.contrib.messages.storage.fallback',
+    'django.contrib.sessions.backends.cached_db',
+    'django.contrib.sessions.serializers',
+]
+
+
+def warm_urls(resolver=None, namespace=''):
+    """
+    ساخت جدول‌های reverse ریشه و resolver هر namespace؛ Django resolver یک namespace را
+    هنگام اولین reverse با نام آن namespace (مثلا admin:index) می‌سازد
+    """
+    resolver = resolver or get_resolver()
+    names = [key for key in resolver.reverse_dict if isinstance(key, str)]
+    if namespace and names:
+        try:
+            reverse(f"{namespace}:{names[0]}")
+        except NoReverseMatch:
+            pass
+    for child, (_, child_resolver) in resolver.namespace_dict.items():
+        warm_urls(child_resolver, f"{namespace}:{child}" if namespace else child)
+
+
+def warm_models():
+    for model in apps.get_models(include_auto_created=True):
+        opts = model._meta
+        opts.get_fields()
+        opts.fields_map
+        opts.related_objects
+        opts._property_names
+
+
+def template_dirs(engine):
+    """
+    پوشه‌هایی که loaderهای موتور در آن‌ها جستجو می‌کنند؛ engine.template_dirs فقط DIRS (و با
+    APP_DIRS پوشه templates اپ‌ها) است و loaderهای صریح، مثل cached loader تنظیمات، را نمی‌بیند
+    """
+    dirs = [str(directory) for directory in engine.template_dirs]
+    for loader in getattr(getattr(engine, 'engine', None), 'template_loaders', []):
+        for child in getattr(loader, 'loaders', [loader]):
+            if hasattr(child, 'get_dirs'):
+                dirs.extend(str(directory) for directory in child.get_dirs())
+    return list(dict.fromkeys(dirs))
+
+
+def warm_templates():
+    """
+    کامپایل همه قالب‌های پروژه و اپ‌ها تا در cached loader قرار بگیرند
+    """
+    count = 0
+    for engine in engines.all():
+        seen = set()
+        for directory in template_dirs(engine):
+            for root, _, files in os.walk(directory):
+                for file_name in files:
+                    if not file_name.endswith(('.html', '.txt')):
+                        continue
+                    name = os.path.relpath(os.path.join(root, file_name), directory).replace(os.sep, '/')
+                    # قالب هم‌نامی که در پوشه بعدی است با همان نام پیدا نمی‌شود
+                    if name in seen:
+                        continue
+                    seen.add(name)
+                    try:
+                        engine.get_template(name)
+                    except TemplateSyntaxError:
+                        # قالب‌هایی که فقط با برچسب‌های اپ‌های نصب نشده کار می‌کنند
+                        continue
+                    count += 1
+    return count
+
+
+def warm_up():
+    started = time.perf_counter()
+    for module in LAZY_MODULES:
+        import_module(module)
+    warm_urls()
+    warm_models()
+    templates = warm_templates()
+    # اتصال‌های پایگاه داده نباید بین پردازه‌های فرزند مشترک باشند
+    connections.close_all()
+    # اشیای آماده به نسل دائمی gc منتقل می‌شوند تا gc در فرزندها صفحات حافظه را کپی نکند
+    gc.collect()
+    gc.freeze()
+    logger.info("Preloaded %s templates in %.0fms", templates, (time.perf_counter() - started) * 1000)
@@ -12,10 +12,14 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# اجرای تست‌ها با manage.py test؛ کارهای پس‌زمینه در این حالت همزمان انجام می‌شوند
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.0/howto/deployment/checklist/
@@ -42,6 +46,13 @@ INSTALLED_APPS = [
     # My Apps
     'Home',
     'account',
+    'audit',
+    'search',
+    'payroll',
+    'scheduler',
+    'timetable',
+    'backfill',
+    'documents',
 ]
 
 MIDDLEWARE = [
@@ -50,6 +61,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'audit.middleware.AuditUserMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -61,8 +73,14 @@ TEMPLATES = [
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / 'templates']
         ,
-        'APP_DIRS': True,
         'OPTIONS': {
+            # قالب‌ها (از جمله Home/templates) یک بار کامپایل و در حافظه هر پردازه نگه داشته می‌شوند
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -83,10 +101,54 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # بخش‌هایی که پس از خواندن می‌نویسند از Amoozeshyar.db.immediate_atomic استفاده می‌کنند
+        'OPTIONS': {
+            'timeout': 20,
+            # در حالت WAL خواندن‌ها هنگام backfill و ساخت ایندکس متوقف نمی‌شوند
+            'init_command': 'PRAGMA journal_mode=WAL;',
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# برای اجرای تک پردازه‌ای (runserver) cache حافظه کافی است. در اجرای چند پردازه‌ای همه پردازه‌ها
+# باید یک cache مشترک ببینند: AMOOZESHYAR_CACHE=file یک cache مشترک روی دیسک بدون نیاز به سرور
+# است و AMOOZESHYAR_CACHE=redis از سرور REDIS_URL استفاده می‌کند.
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.cache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ.get('REDIS_URL', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+CACHES = {
+    'default': CACHE_BACKENDS[os.environ.get('AMOOZESHYAR_CACHE', 'locmem')],
+}
+
+# Sessions and authentication
+# نشست‌ها از cache خوانده و فقط هنگام تغییر در پایگاه داده نوشته می‌شوند؛ برای حذف کامل کوئری
+# نشست می‌توان از 'django.contrib.sessions.backends.signed_cookies' استفاده کرد.
+# کاربر و مجوزهای او در هر پردازه حداکثر AUTH_CACHE_TTL ثانیه cache می‌شوند؛ تغییراتی که با
+# QuerySet.update انجام شوند (مثلا غیرفعال کردن دسته‌ای کاربران) تا همین مدت دیده نمی‌شوند.
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
+AUTHENTICATION_BACKENDS = ['account.backends.CachedModelBackend']
+AUTH_CACHE_SIZE = 1000
+AUTH_CACHE_TTL = 300
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -125,10 +187,90 @@ STATIC_URL = 'assets/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'assets')
 ]
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+
+# collectstatic نام فایل‌ها را هش می‌کند، تصاویر PNG/JPEG را به قالب‌های زیر (به ترتیب ترجیح در <picture>)
+# تبدیل و فایل‌های متنی بزرگ‌تر از STATIC_COMPRESS_MIN_SIZE بایت را با brotli (در صورت نصب بودن) و gzip
+# از پیش فشرده می‌کند؛ فایل‌های هش شده با Cache-Control immutable تحویل داده می‌شوند
+STATIC_IMAGE_FORMATS = ['avif', 'webp']
+STATIC_IMAGE_QUALITY = 80
+STATIC_COMPRESS_MIN_SIZE = 256
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR/'media'
 
+# تحویل فایل‌های media پس از بررسی دسترسی به وب سرور جلویی سپرده می‌شود:
+# 'x-accel-redirect' برای nginx (با location داخلی MEDIA_ACCEL_PREFIX که به MEDIA_ROOT اشاره می‌کند)،
+# 'x-sendfile' برای Apache/lighttpd و None برای ارسال مستقیم با FileResponse
+MEDIA_ACCEL_BACKEND = None
+MEDIA_ACCEL_PREFIX = '/protected-media/'
+
+# فایل‌های آپلودی بر اساس هش محتوا و بدون نسخه تکراری ذخیره می‌شوند
+STORAGES = {
+    'default': {
+        'BACKEND': 'account.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'Home.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+# تست‌ها بدون collectstatic اجرا می‌شوند و manifest ندارند
+if TESTING:
+    STORAGES['staticfiles'] = {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Audit log
+# تغییرات در حافظه جمع شده و به صورت دسته‌ای در پس‌زمینه نوشته می‌شوند. در تست‌ها بافری نیست
+# تا رکوردها پس از حذف پایگاه داده تست (در atexit) به فایل پشتیبان واقعی نوشته نشوند
+
+AUDIT_ASYNC = not TESTING
+AUDIT_BATCH_SIZE = 200
+AUDIT_FLUSH_INTERVAL_MS = 2000
+AUDIT_FALLBACK_FILE = BASE_DIR / 'audit_fallback.jsonl'
+
+# Payroll
+# افزایش حقوق به ازای هر سال کامل از آخرین ترفیع (به واحد صدم درصد)
+
+PAYROLL_PROMOTION_STEP_BASIS_POINTS = 250
+PAYROLL_MAX_PROMOTION_STEPS = 5
+PAYROLL_CONTRACT_STATUSES = ('Contract', 'Temporary')
+
+# Scheduled staff alerts
+# کارها با دستور run_scheduler اجرا می‌شوند؛ بدون گیرنده ایمیل به ADMINS ارسال می‌شود و اگر آن هم
+# خالی باشد کار ناموفق ثبت می‌شود. هر موعد فقط یک بار (اولین روز ورود به بازه) اعلام می‌شود
+
+CONTRACT_EXPIRY_ALERT_DAYS = 30
+PROMOTION_REVIEW_YEARS = 4
+PROMOTION_REVIEW_ALERT_DAYS = 30
+STAFF_ALERT_BATCH_SIZE = 200
+STAFF_ALERT_RECIPIENTS = []
+
+# Registration
+# حداقل نمره قبولی در یک درس (از 20)
+
+PASSING_GRADE = 10
+
+# Timetable
+# تعداد روزهای آموزشی هفته (از شنبه) و زنگ‌های هر روز
+
+TIMETABLE_DAYS = 6
+TIMETABLE_PERIODS = 5
+
+# Online backfills
+# اندازه اولیه دسته، مدت هدف هر تراکنش و مکث بین دسته‌ها
+
+BACKFILL_BATCH_SIZE = 1000
+BACKFILL_CHUNK_TARGET_MS = 200
+BACKFILL_PAUSE_MS = 50
+
+# Transcripts and certificates
+# ساخت PDF با دستور run_document_worker؛ کار نیمه‌کاره پس از DOCUMENT_JOB_TIMEOUT ثانیه دوباره در صف قرار می‌گیرد
+
+DOCUMENT_WORKER_PROCESSES = 2
+DOCUMENT_JOB_TIMEOUT = 300
+DOCUMENT_JOB_MAX_ATTEMPTS = 3
+DOCUMENT_FONT_DIR = BASE_DIR / 'assets' / 'fonts'
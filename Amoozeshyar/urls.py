@@ -16,10 +16,15 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.conf.urls.static import static
 from django.conf import settings
+from account.views import serveMedia
+from Home.views import serveStatic
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path("search/", include('search.urls')),
+    path("documents/", include('documents.urls')),
+    path(settings.MEDIA_URL.lstrip('/') + '<path:name>', serveMedia, name="media"),
+    path(settings.STATIC_URL.lstrip('/') + '<path:path>', serveStatic, name="static"),
     path("", include('Home.urls'))
-] + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+]
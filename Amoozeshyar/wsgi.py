@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Amoozeshyar.settings')
 
 application = get_wsgi_application()
+
+# با AMOOZESHYAR_PRELOAD=1 (همراه gunicorn --preload) پردازه پیش از fork آماده می‌شود
+if os.environ.get('AMOOZESHYAR_PRELOAD') == '1':
+    from .preload import warm_up
+
+    warm_up()
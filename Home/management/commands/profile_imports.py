@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+from collections import Counter
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# کدی که در یک پردازه تازه با python -X importtime اجرا می‌شود
+TARGETS = {
+    'wsgi': "import Amoozeshyar.wsgi",
+    'setup': "import django; django.setup()",
+    'manage': "import django; django.setup(); from django.core.management import get_commands; get_commands()",
+}
+
+
+def parse_importtime(output):
+    """
+    ردیف‌های (نام ماژول، زمان خود ماژول، زمان تجمعی) به میکروثانیه از خروجی -X importtime
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        own, cumulative, name = line[len('import time:'):].split('|')
+        if not own.strip().isdigit():
+            continue
+        rows.append((name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "گزارش کندترین ماژول‌ها در راه‌اندازی پردازه وب یا manage.py"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target', choices=sorted(TARGETS), default='wsgi')
+        parser.add_argument('--limit', type=int, default=25)
+        parser.add_argument('--sort', choices=['self', 'cumulative'], default='self')
+        parser.add_argument('--by-package', action='store_true', help="جمع زمان ماژول‌های هر بسته")
+        parser.add_argument('--preload', action='store_true', help="همراه با آماده‌سازی پیش از fork")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=settings.SETTINGS_MODULE)
+        if options['preload']:
+            env['AMOOZESHYAR_PRELOAD'] = '1'
+        code = f"import time; started = time.perf_counter(); {TARGETS[options['target']]}; " \
+               f"print(time.perf_counter() - started)"
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], env=env, cwd=settings.BASE_DIR,
+                                capture_output=True, text=True)
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        rows = parse_importtime(result.stderr)
+        elapsed = float(result.stdout.strip().splitlines()[-1]) * 1000
+        imports = sum(own for _, own, _ in rows) / 1000
+        self.stdout.write(f"{options['target']}: {elapsed:.0f}ms, {imports:.0f}ms importing {len(rows)} modules")
+
+        if options['by_package']:
+            packages = Counter()
+            for name, own, _ in rows:
+                packages[name.split('.')[0]] += own
+            for package, own in packages.most_common(options['limit']):
+                self.stdout.write(f"{own / 1000:8.1f}ms  {package}")
+            return
+
+        column = 1 if options['sort'] == 'self' else 2
+        for name, own, cumulative in sorted(rows, key=lambda row: row[column], reverse=True)[:options['limit']]:
+            self.stdout.write(f"{own / 1000:8.1f}ms {cumulative / 1000:8.1f}ms  {name}")
@@ -0,0 +1,163 @@
+"""
+ذخیره فایل‌های static با نام هش شده، نسخه‌های AVIF/WebP تصاویر و نسخه‌های فشرده gzip/brotli
+
+در collectstatic ابتدا برای هر تصویر PNG/JPEG نسخه‌های STATIC_IMAGE_FORMATS (اگر کوچک‌تر
+باشند) ساخته می‌شود، سپس ManifestStaticFilesStorage نام همه فایل‌ها (از جمله این نسخه‌ها)
+را هش و ارجاع‌های داخل CSS را بازنویسی می‌کند و در پایان کنار هر فایل متنی هش شده نسخه .br
+و .gz نوشته می‌شود. محتوای فایل هش شده هرگز تغییر نمی‌کند و با Cache-Control immutable تحویل
+داده می‌شود؛ وب سرور جلویی می‌تواند نسخه‌های فشرده را مستقیم بفرستد (gzip_static/brotli_static).
+"""
+import gzip
+import io
+import logging
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+from django.utils.functional import cached_property
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.svg', '.html', '.txt', '.json', '.xml', '.map',
+                           '.ttf', '.otf', '.eot', '.ico')
+logger = logging.getLogger(__name__)
+
+# پسوند -> (نام قالب در Pillow، نوع محتوا)؛ ترتیب ترجیح در <picture> از STATIC_IMAGE_FORMATS می‌آید
+IMAGE_FORMATS = {
+    'avif': ('AVIF', 'image/avif'),
+    'webp': ('WEBP', 'image/webp'),
+}
+# (کدگذاری، پسوند) به ترتیب ترجیح در مذاکره Accept-Encoding
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def configured_formats():
+    return [name for name in getattr(settings, 'STATIC_IMAGE_FORMATS', ['avif', 'webp']) if name in IMAGE_FORMATS]
+
+
+def available_encodings():
+    return [(encoding, suffix) for encoding, suffix in ENCODINGS if encoding != 'br' or brotli is not None]
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    # mtime ثابت تا خروجی هر بار collectstatic یکسان باشد
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+
+    def image_formats(self):
+        # Pillow فقط در collectstatic لازم است و در راه‌اندازی پردازه وب import نمی‌شود
+        try:
+            from PIL import features
+        except ImportError:
+            return []
+        return [name for name in configured_formats() if features.check(name)]
+
+    def post_process(self, paths, dry_run=False, **options):
+        if dry_run:
+            return
+        paths = dict(paths)
+        for name in [name for name in paths if name.lower().endswith(IMAGE_EXTENSIONS)]:
+            for variant in self._convert_image(name, paths):
+                paths[variant] = (self, variant)
+
+        for name, hashed_name, processed in super().post_process(paths, dry_run, **options):
+            yield name, hashed_name, processed
+            if isinstance(processed, Exception):
+                return
+
+        for name, hashed_name in self.hashed_files.items():
+            for compressed in self._compress(hashed_name):
+                yield name, compressed, True
+
+    def url_converter(self, name, hashed_files, template=None):
+        converter = super().url_converter(name, hashed_files, template)
+
+        def convert(matchobj):
+            # CSS بسته‌های جانبی (مثل تم datepicker) گاهی به تصاویری اشاره می‌کند که همراهشان نیامده است
+            try:
+                return converter(matchobj)
+            except ValueError as error:
+                logger.warning("%s: %s", name, error)
+                return matchobj['matched']
+
+        return convert
+
+    def _replace(self, name, content):
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(content))
+
+    def _convert_image(self, name, paths):
+        """
+        ساخت نسخه‌های AVIF/WebP یک تصویر؛ نسخه‌ای که در مبدا وجود دارد یا بزرگ‌تر از اصل است ساخته نمی‌شود
+        و نسخه‌ای که از collectstatic قبلی مانده و از تصویر اصلی جدیدتر است دوباره ساخته نمی‌شود
+        """
+        storage, path = paths[name]
+        modified = storage.get_modified_time(path)
+        root = os.path.splitext(name)[0]
+        image = data = None
+        for extension in self.image_formats():
+            variant = f"{root}.{extension}"
+            if variant in paths:
+                continue
+            if self.exists(variant) and self.get_modified_time(variant) >= modified:
+                yield variant
+                continue
+            if image is None:
+                from PIL import Image
+
+                with storage.open(path) as original:
+                    data = original.read()
+                image = Image.open(io.BytesIO(data))
+                image = image.convert('RGBA' if image.has_transparency_data else 'RGB')
+            buffer = io.BytesIO()
+            image.save(buffer, IMAGE_FORMATS[extension][0], quality=getattr(settings, 'STATIC_IMAGE_QUALITY', 80))
+            if buffer.tell() < len(data):
+                self._replace(variant, buffer.getvalue())
+                yield variant
+
+    def _compress(self, name):
+        if not name.lower().endswith(COMPRESSIBLE_EXTENSIONS):
+            return
+        data = None
+        for encoding, suffix in available_encodings():
+            # محتوای نام هش شده ثابت است، پس نسخه فشرده موجود از اجرای قبلی هنوز معتبر است
+            if self.exists(name + suffix):
+                yield name + suffix
+                continue
+            if data is None:
+                with self.open(name) as original:
+                    data = original.read()
+                if len(data) < getattr(settings, 'STATIC_COMPRESS_MIN_SIZE', 256):
+                    return
+            compressed = compress(data, encoding)
+            if len(compressed) < len(data):
+                self._replace(name + suffix, compressed)
+                yield name + suffix
+
+    @cached_property
+    def immutable_names(self):
+        """
+        نام‌های هش شده؛ فقط این فایل‌ها با Cache-Control immutable تحویل داده می‌شوند
+        """
+        return frozenset(self.hashed_files.values())
+
+    def image_variants(self, name):
+        """
+        (نام، نوع محتوا) نسخه‌های جایگزین یک تصویر که در manifest ثبت شده‌اند؛ در حالت DEBUG
+        مثل url() از manifest استفاده نمی‌شود و فهرست خالی است
+        """
+        if settings.DEBUG:
+            return []
+        root = os.path.splitext(name)[0]
+        return [(f"{root}.{extension}", IMAGE_FORMATS[extension][1]) for extension in configured_formats()
+                if f"{root}.{extension}" in self.hashed_files]
@@ -0,0 +1,22 @@
+from django import template
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.forms.utils import flatatt
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+register = template.Library()
+
+
+@register.simple_tag
+def picture(name, **attrs):
+    """
+    تصویر static داخل <picture> با نسخه‌های AVIF/WebP ساخته شده در collectstatic؛
+    مرورگری که این قالب‌ها را پشتیبانی نکند تصویر اصلی را می‌گیرد
+    """
+    variants = getattr(staticfiles_storage, 'image_variants', lambda name: [])(name)
+    image = format_html('<img src="{}"{}>', static(name), flatatt(attrs))
+    if not variants:
+        return image
+    sources = format_html_join('', '<source type="{}" srcset="{}">',
+                               ((content_type, static(variant)) for variant, content_type in variants))
+    return format_html('<picture>{}{}</picture>', sources, image)
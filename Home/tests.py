@@ -1,3 +1,110 @@
-from django.test import TestCase
+import gzip
+import json
+import os
+import tempfile
+import unittest
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from . import storage
+from .views import accepted_encodings
+
+CSS = b"body { color: #333; }\n" * 40
+HASHED = 'css/app.0123456789ab.css'
+MANIFEST_STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {'BACKEND': 'Home.storage.CompressedManifestStaticFilesStorage'},
+}
+
+
+class PagesTests(SimpleTestCase):
+
+    def test_pages_render_without_collectstatic(self):
+        for url in ('/', '/contactUs'):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertContains(response, '/assets/')
+
+
+class AcceptedEncodingsTests(SimpleTestCase):
+
+    def test_parse(self):
+        self.assertEqual(accepted_encodings('gzip, deflate, br;q=0.9'), {'gzip', 'deflate', 'br'})
+        self.assertEqual(accepted_encodings('br;q=0, GZIP;q=1.0'), {'gzip'})
+        self.assertEqual(accepted_encodings(''), {''})
+
+
+@override_settings(STORAGES=MANIFEST_STORAGES, DEBUG=False)
+class ServeStaticTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = directory.name
+        os.makedirs(os.path.join(root, 'css'))
+        for name in ('css/app.css', HASHED):
+            self.write(root, name, CSS)
+        self.write(root, HASHED + '.gz', gzip.compress(CSS, mtime=0))
+        if storage.brotli is not None:
+            self.write(root, HASHED + '.br', storage.compress(CSS, 'br'))
+        manifest = {'version': '1.1', 'hash': 'x', 'paths': {'css/app.css': HASHED}}
+        self.write(root, 'staticfiles.json', json.dumps(manifest).encode())
+        root_override = override_settings(STATIC_ROOT=root)
+        root_override.enable()
+        self.addCleanup(root_override.disable)
+
+    def write(self, root, name, data):
+        with open(os.path.join(root, name), 'wb') as file:
+            file.write(data)
+
+    def get(self, name, **headers):
+        response = self.client.get(f'/assets/{name}', headers=headers)
+        if response.status_code == 200:
+            response.body = b''.join(response.streaming_content)
+        return response
+
+    def test_identity_without_accept_encoding(self):
+        response = self.get(HASHED)
+        self.assertEqual(response.body, CSS)
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(response['Content-Type'], 'text/css')
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_gzip(self):
+        response = self.get(HASHED, accept_encoding='gzip, deflate')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.body), CSS)
+        self.assertEqual(response['Content-Type'], 'text/css')
+
+    @unittest.skipIf(storage.brotli is None, "brotli is not installed")
+    def test_brotli_is_preferred(self):
+        response = self.get(HASHED, accept_encoding='gzip, br')
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(storage.brotli.decompress(response.body), CSS)
+
+    def test_refused_encoding_is_not_sent(self):
+        response = self.get(HASHED, accept_encoding='br;q=0, gzip;q=0')
+        self.assertNotIn('Content-Encoding', response)
+
+    def test_missing_compressed_variant_falls_back_to_identity(self):
+        response = self.get('css/app.css', accept_encoding='gzip')
+        self.assertNotIn('Content-Encoding', response)
+        self.assertEqual(response.body, CSS)
+
+    def test_cache_control(self):
+        self.assertEqual(self.get(HASHED)['Cache-Control'], 'public, max-age=31536000, immutable')
+        self.assertEqual(self.get('css/app.css')['Cache-Control'], 'public, no-cache')
+
+    def test_not_modified(self):
+        response = self.get(HASHED, accept_encoding='gzip')
+        not_modified = self.get(HASHED, accept_encoding='gzip', if_none_match=response['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified['ETag'], response['ETag'])
+        self.assertEqual(not_modified['Cache-Control'], 'public, max-age=31536000, immutable')
+        # ETag هر کدگذاری جداست
+        self.assertEqual(self.get(HASHED, if_none_match=response['ETag']).status_code, 200)
+
+    def test_missing_and_outside_files(self):
+        self.assertEqual(self.get('css/missing.css').status_code, 404)
+        self.assertEqual(self.get('../settings.py').status_code, 404)
+        self.assertEqual(self.client.post(f'/assets/{HASHED}').status_code, 405)
@@ -1,9 +1,85 @@
+import mimetypes
+import os
+
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
 from django.shortcuts import render
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import conditional_page, require_safe
+
+from .storage import available_encodings
+
+# نام فایل‌های هش شده با تغییر محتوا عوض می‌شود، پس مرورگر هرگز لازم نیست دوباره بپرسد
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+MUTABLE_CACHE = "public, no-cache"
 
+
+# صفحات ثابت با ETag محتوا (پاسخ 304 در بازدید دوباره) و فشرده‌سازی gzip تحویل داده می‌شوند
+@gzip_page
+@conditional_page
+@cache_control(no_cache=True)
 def homePage(request):
     return render(request, 'Home/index.html', context={})
 
+@gzip_page
+@conditional_page
+@cache_control(no_cache=True)
 def contactUS(request):
     return render(request, 'Home/contactUs.html', context={})
 
-# Create your views here.
+
+def accepted_encodings(header):
+    """
+    کدگذاری‌های پذیرفته شده در Accept-Encoding (بدون مواردی که q=0 دارند)
+    """
+    encodings = set()
+    for item in header.split(','):
+        encoding, _, params = item.partition(';')
+        try:
+            if params and float(params.strip().removeprefix('q=')) == 0:
+                continue
+        except ValueError:
+            pass
+        encodings.add(encoding.strip().lower())
+    return encodings
+
+
+@require_safe
+def serveStatic(request, path):
+    """
+    تحویل فایل‌های collectstatic همراه با نسخه از پیش فشرده متناسب با Accept-Encoding؛
+    در production بهتر است وب سرور جلویی همین کار را مستقیم از STATIC_ROOT انجام دهد
+    """
+    try:
+        full_path = staticfiles_storage.path(path)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    immutable = path in getattr(staticfiles_storage, 'immutable_names', ())
+    accepted = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+    encoding = None
+    for candidate, suffix in available_encodings():
+        if candidate in accepted and os.path.isfile(full_path + suffix):
+            encoding, full_path = candidate, full_path + suffix
+            break
+
+    stat = os.stat(full_path)
+    etag = quote_etag(f"{int(stat.st_mtime)}-{stat.st_size}")
+    if request.headers.get('If-None-Match') in (etag, '*'):
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(open(full_path, 'rb'),
+                                content_type=mimetypes.guess_type(path)[0] or 'application/octet-stream')
+        response['Last-Modified'] = http_date(stat.st_mtime)
+        if encoding:
+            response['Content-Encoding'] = encoding
+    response['ETag'] = etag
+    response['Cache-Control'] = IMMUTABLE_CACHE if immutable else MUTABLE_CACHE
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
@@ -1,11 +1,16 @@
 from django.contrib import admin
 from .models import *
+from .archive import restore_students
+from audit.admin import AuditHistoryMixin
+from search.admin import FullTextSearchMixin
+from documents.admin import DocumentRequestMixin
 
 
 @admin.register(Professor)
-class ProfessorAdmin(admin.ModelAdmin):
+class ProfessorAdmin(AuditHistoryMixin, FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['first_Name', 'last_Name', 'gender', 'national_ID']
     search_fields = ['national_ID', 'personnel_code']
+    search_kind = 'professor'
     readonly_fields = ['created_at', 'updated_at']
     list_filter = ['blood_Type']
 
@@ -15,11 +20,13 @@ class ProfessorAdmin(admin.ModelAdmin):
 
 
 @admin.register(Student)
-class StudentAdmin(admin.ModelAdmin):
+class StudentAdmin(AuditHistoryMixin, FullTextSearchMixin, DocumentRequestMixin, admin.ModelAdmin):
     list_display = ['first_Name', 'last_Name', 'gender', 'national_ID']
     search_fields = ['national_ID', 'student_ID']
+    search_kind = 'student'
     readonly_fields = ['created_at', 'updated_at']
     list_filter = ['degree']
+    actions = ['request_transcripts', 'request_certificates']
 
     filter_horizontal = ()
     fieldsets = ()
@@ -61,9 +68,10 @@ class EmailAddressAdmin(admin.ModelAdmin):
     ordering = ()
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
+class CourseAdmin(AuditHistoryMixin, FullTextSearchMixin, admin.ModelAdmin):
     list_display = ['name', 'code', 'units', 'department']
     search_fields = ['code']
+    search_kind = 'course'
     readonly_fields = ['created_at', 'updated_at']
     list_filter = ['units']
 
@@ -93,3 +101,53 @@ class DepartmentAdmin(admin.ModelAdmin):
     filter_horizontal = ()
     fieldsets = ()
     ordering = ()
+
+
+@admin.register(Publication)
+class PublicationAdmin(admin.ModelAdmin):
+    list_display = ['title', 'venue', 'year', 'doi']
+    search_fields = ['doi', 'title']
+    readonly_fields = ['created_at', 'updated_at']
+    list_filter = ['year']
+
+    filter_horizontal = ('authors',)
+    fieldsets = ()
+    ordering = ()
+
+
+@admin.register(ArchivedStudent)
+class ArchivedStudentAdmin(DocumentRequestMixin, admin.ModelAdmin):
+    list_display = ['first_Name', 'last_Name', 'student_ID', 'degree', 'archived_at']
+    search_fields = ['national_ID', 'student_ID']
+    readonly_fields = ['archived_at']
+    list_filter = ['degree']
+    actions = ['restore', 'request_transcripts']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    @admin.action(description="بازگرداندن به دانشجویان فعلی", permissions=['delete'])
+    def restore(self, request, queryset):
+        restored = restore_students(list(queryset.values_list('student_ID', flat=True)))
+        self.message_user(request, f"{restored} دانشجو بازگردانده شد.")
+
+
+@admin.register(Enrollment)
+class EnrollmentAdmin(admin.ModelAdmin):
+    list_display = ['student', 'course', 'term', 'grade']
+    search_fields = ['student__student_ID', 'course__code']
+    readonly_fields = ['created_at', 'updated_at']
+    list_filter = ['term']
+    list_select_related = ['student', 'course']
+    raw_id_fields = ['student', 'course']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class AccountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'account'
+
+    def ready(self):
+        from . import backends, eligibility
+        backends.connect_signals()
+        eligibility.connect_signals()
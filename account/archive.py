@@ -0,0 +1,101 @@
+"""
+انتقال دانشجویان غیرفعال (همراه با دروس اخذ شده) به جدول بایگانی و بازگرداندن آن‌ها
+
+جدول Student فقط دانشجویان فعال (و غیرفعال‌هایی که هنوز بایگانی نشده‌اند) را نگه می‌دارد و
+ArchivedStudent بقیه را. جستجو بر اساس کد دانشجویی با student_records روی هر دو جدول انجام می‌شود.
+"""
+import time
+
+from django.db.models import BooleanField, OuterRef, Subquery, Value
+
+from Amoozeshyar.db import immediate_atomic
+
+from .models import ArchivedEnrollment, ArchivedStudent, Enrollment, Student, StudentBase
+
+STUDENT_FIELDS = [field.attname for field in Student._meta.concrete_fields]
+RECORD_FIELDS = [field.attname for field in StudentBase._meta.fields]
+ENROLLMENT_FIELDS = [field.attname for field in Enrollment._meta.concrete_fields if field.attname != 'id']
+ENROLLMENT_KEY = ['student_id', 'course_id', 'term']
+TIMESTAMP_FIELDS = ['created_at', 'updated_at']
+
+
+def _copy_timestamps(source, target, keys, fields=TIMESTAMP_FIELDS, **filters):
+    """
+    بازگرداندن زمان‌های ردیف‌های منتقل شده از روی ردیف مبدا؛ ذخیره (auto_now_add/auto_now) آن‌ها را
+    به زمان فعلی تغییر داده است. باید پیش از حذف ردیف‌های مبدا اجرا شود.
+    """
+    match = {key: OuterRef(key) for key in keys}
+    target.objects.filter(**filters).update(**{
+        field: Subquery(source.objects.filter(**match).values(field)[:1]) for field in fields
+    })
+
+
+def _move_enrollments(source, target, student_ids):
+    rows = list(source.objects.filter(student_id__in=student_ids).values(*ENROLLMENT_FIELDS))
+    target.objects.bulk_create([target(**row) for row in rows])
+    _copy_timestamps(source, target, ENROLLMENT_KEY, student_id__in=student_ids)
+    source.objects.filter(student_id__in=student_ids).delete()
+
+
+def archive_inactive_students(batch_size=500, pause=0, limit=None):
+    """
+    انتقال دانشجویان غیرفعال در دسته‌های batch_size؛ هر دسته یک تراکنش کوتاه است
+    تا قفل جدول اصلی طولانی نشود. تعداد دانشجویان منتقل شده برگردانده می‌شود.
+    """
+    moved = 0
+    while limit is None or moved < limit:
+        size = batch_size if limit is None else min(batch_size, limit - moved)
+        with immediate_atomic():
+            rows = list(Student.objects.filter(is_active=False).order_by('national_ID')
+                        .values(*STUDENT_FIELDS)[:size])
+            if not rows:
+                break
+            ids = [row['national_ID'] for row in rows]
+            ArchivedStudent.objects.bulk_create([ArchivedStudent(**row) for row in rows])
+            _copy_timestamps(Student, ArchivedStudent, ['national_ID'], national_ID__in=ids)
+            _move_enrollments(Enrollment, ArchivedEnrollment, ids)
+            Student.objects.filter(national_ID__in=ids).delete()
+        moved += len(rows)
+        if pause:
+            time.sleep(pause)
+    return moved
+
+
+@immediate_atomic()
+def restore_students(student_ids):
+    """
+    بازگرداندن دانشجویان بایگانی شده به جدول اصلی؛ ذخیره تک تک انجام می‌شود تا
+    سیگنال‌ها (گزارش تغییرات و ایندکس جستجو) هم اجرا شوند. دانشجوی بازگردانده فعال می‌شود
+    تا اجرای بعدی archive_inactive_students دوباره آن را به بایگانی نبرد؛ به همین دلیل فقط
+    created_at حفظ می‌شود و updated_at زمان بازگرداندن است.
+    """
+    archived = list(ArchivedStudent.objects.select_for_update().filter(student_ID__in=student_ids)
+                    .values(*STUDENT_FIELDS))
+    for row in archived:
+        Student(**{**row, 'is_active': True}).save(force_insert=True)
+    ids = [row['national_ID'] for row in archived]
+    _copy_timestamps(ArchivedStudent, Student, ['national_ID'], ['created_at'], national_ID__in=ids)
+    _move_enrollments(ArchivedEnrollment, Enrollment, ids)
+    ArchivedStudent.objects.filter(national_ID__in=ids).delete()
+    return len(archived)
+
+
+def student_records(**filters):
+    """
+    کوئری فقط خواندنی روی دانشجویان فعلی و بایگانی شده؛ هر رکورد دیکشنری با کلید archived است
+    """
+    hot = (Student.objects.filter(**filters)
+           .values(*RECORD_FIELDS, archived=Value(False, output_field=BooleanField())))
+    cold = (ArchivedStudent.objects.filter(**filters)
+            .values(*RECORD_FIELDS, archived=Value(True, output_field=BooleanField())))
+    return hot.union(cold, all=True)
+
+
+def get_student(student_ID):
+    """
+    یافتن دانشجو با کد دانشجویی؛ ابتدا جدول اصلی و سپس بایگانی (هر دو روی ایندکس یکتا)
+    """
+    student = Student.objects.filter(student_ID=student_ID).first()
+    if student is None:
+        student = ArchivedStudent.objects.filter(student_ID=student_ID).first()
+    return student
@@ -0,0 +1,122 @@
+"""
+backend احراز هویت با cache برای کاربر و مجوزهای او
+
+ModelBackend در هر درخواست کاربر را از جدول auth_user و مجوزهایش را با دو کوئری دیگر
+می‌خواند. این backend نتایج را در یک LRU داخل هر پردازه با عمر AUTH_CACHE_TTL ثانیه نگه
+می‌دارد. ذخیره یا حذف کاربران، گروه‌ها و مجوزها (با save/delete یا در صفحات مدیریت) شماره
+نسل مشترک (در cache پیش‌فرض) را افزایش می‌دهد و همه پردازه‌ها با دیدن نسل جدید مقادیر قبلی
+را کنار می‌گذارند؛ بنابراین در اجرای چند پردازه‌ای CACHES باید یک cache مشترک باشد.
+
+QuerySet.update و SQL مستقیم سیگنالی نمی‌فرستند: غیرفعال کردن یا تغییر مجوز کاربران به این
+روش (و هر تغییری در اجرای چند پردازه‌ای بدون cache مشترک) حداکثر پس از AUTH_CACHE_TTL ثانیه
+دیده می‌شود، مگر این‌که پس از آن invalidate() صدا زده شود.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.models import Group, Permission
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+GENERATION_KEY = 'auth:generation'
+MISSING = object()
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+class TTLCache:
+    """
+    LRU با حداکثر اندازه و عمر محدود برای هر مقدار
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.data = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, generation):
+        with self.lock:
+            entry = self.data.get(key)
+            if entry is None:
+                return MISSING
+            value, expires, entry_generation = entry
+            if expires < time.monotonic() or entry_generation != generation:
+                del self.data[key]
+                return MISSING
+            self.data.move_to_end(key)
+            return value
+
+    def set(self, key, value, generation):
+        with self.lock:
+            self.data[key] = (value, time.monotonic() + self.ttl, generation)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+lookups = TTLCache(get_setting('AUTH_CACHE_SIZE', 1000), get_setting('AUTH_CACHE_TTL', 300))
+
+
+def current_generation():
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, 1, timeout=None)
+        generation = cache.get(GENERATION_KEY, 1)
+    return generation
+
+
+def invalidate(**kwargs):
+    if kwargs.get('action', 'post_').startswith('pre_'):
+        return
+    # update_last_login در هر ورود فقط last_login را ذخیره می‌کند که در cache اهمیتی ندارد
+    if kwargs.get('update_fields') == {'last_login'}:
+        return
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.set(GENERATION_KEY, 1, timeout=None)
+    lookups.clear()
+
+
+class CachedModelBackend(ModelBackend):
+    def get_user(self, user_id):
+        generation = current_generation()
+        user = lookups.get(('user', user_id), generation)
+        if user is MISSING:
+            user = super().get_user(user_id)
+            lookups.set(('user', user_id), user, generation)
+        # هر درخواست یک نسخه جدا می‌گیرد تا تغییرات و cache مجوزهای یک درخواست به بقیه نرسد
+        return copy.copy(user)
+
+    def _get_permissions(self, user_obj, obj, from_name):
+        cache_name = f"_{from_name}_perm_cache"
+        if user_obj.is_active and not user_obj.is_anonymous and obj is None and not hasattr(user_obj, cache_name):
+            generation = current_generation()
+            key = ('perms', from_name, user_obj.pk)
+            perms = lookups.get(key, generation)
+            if perms is MISSING:
+                perms = super()._get_permissions(user_obj, obj, from_name)
+                lookups.set(key, perms, generation)
+            setattr(user_obj, cache_name, perms)
+        return super()._get_permissions(user_obj, obj, from_name)
+
+
+def connect_signals():
+    User = get_user_model()
+    for model in (User, Group, Permission):
+        post_save.connect(invalidate, sender=model, dispatch_uid=f'auth_cache:{model._meta.label}_saved')
+        post_delete.connect(invalidate, sender=model, dispatch_uid=f'auth_cache:{model._meta.label}_deleted')
+    for through in (User.groups.through, User.user_permissions.through, Group.permissions.through):
+        m2m_changed.connect(invalidate, sender=through, dispatch_uid=f'auth_cache:{through._meta.label}_changed')
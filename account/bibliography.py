@@ -0,0 +1,152 @@
+"""
+خواندن مقالات از فایل‌های BibTeX و CSV و متن آزاد و کلیدهای تشخیص مقاله تکراری
+
+این ماژول به مدل‌ها وابسته نیست تا مهاجرت‌های داده هم بتوانند از آن استفاده کنند.
+"""
+import csv
+import hashlib
+import re
+
+from .text import normalize
+
+DOI_PREFIX = re.compile(r'^(https?://(dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+DOI = re.compile(r'10\.\d{4,9}/\S+[^\s.,;]')
+YEAR = re.compile(r'\b(19\d{2}|20\d{2}|13\d{2}|14\d{2})\b')
+NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_doi(doi):
+    if not doi:
+        return None
+    doi = DOI_PREFIX.sub('', doi.strip()).lower()
+    return doi or None
+
+
+def title_hash(title):
+    return hashlib.sha1(NON_WORD.sub('', normalize(title)).encode('utf-8')).hexdigest()
+
+
+def _parse_year(value):
+    match = YEAR.search(str(value or ''))
+    return int(match.group(1)) if match else None
+
+
+def parse_text_blob(text):
+    """
+    تبدیل متن آزاد فیلد Professor.publications به رکورد؛ هر خط غیر خالی یک مقاله است
+    """
+    for line in (text or '').splitlines():
+        line = line.strip().lstrip('-*•0123456789.) ').strip()
+        if not line:
+            continue
+        doi = DOI.search(line)
+        yield {
+            'title': line[:500],
+            'venue': '',
+            'year': _parse_year(line),
+            'doi': doi.group(0) if doi else None,
+            'authors': [],
+        }
+
+
+def _split_bibtex_fields(body, macros=None):
+    """
+    جدا کردن فیلدهای name = {value} یا name = "value" یا name = 2020 از بدنه یک مدخل؛
+    مقدار بدون کروشه و گیومه اگر نام یک @string باشد با مقدار آن جایگزین می‌شود
+    """
+    fields = {}
+    i, length = 0, len(body)
+    while i < length:
+        equals = body.find('=', i)
+        if equals == -1:
+            break
+        name = body[i:equals].strip(' \t\r\n,').lower()
+        i = equals + 1
+        while i < length and body[i].isspace():
+            i += 1
+        if i >= length:
+            break
+        if body[i] == '{':
+            depth, start = 1, i + 1
+            i += 1
+            while i < length and depth:
+                if body[i] == '{':
+                    depth += 1
+                elif body[i] == '}':
+                    depth -= 1
+                i += 1
+            value = body[start:i - 1]
+        elif body[i] == '"':
+            start = i + 1
+            i = body.find('"', start)
+            i = length if i == -1 else i
+            value = body[start:i]
+            i += 1
+        else:
+            start = i
+            while i < length and body[i] != ',':
+                i += 1
+            value = body[start:i].strip()
+            value = (macros or {}).get(value.lower(), value)
+        fields[name] = re.sub(r'\s+', ' ', value.replace('{', '').replace('}', '')).strip()
+        comma = body.find(',', i)
+        i = length if comma == -1 else comma + 1
+    return fields
+
+
+def parse_bibtex(stream):
+    """
+    خواندن جریانی مدخل‌های BibTeX؛ هر بار فقط یک مدخل در حافظه نگه داشته می‌شود
+    """
+    entry, depth, macros = [], 0, {}
+    for line in stream:
+        if not entry:
+            start = line.find('@')
+            if start == -1:
+                continue
+            line = line[start:]
+        entry.append(line)
+        depth += line.count('{') - line.count('}')
+        if depth > 0:
+            continue
+        text = "".join(entry)
+        entry, depth = [], 0
+        kind, _, rest = text.partition('{')
+        kind = kind.strip().lower()
+        # فقط کروشه بسته مدخل حذف می‌شود؛ کروشه پایانی آخرین فیلد باید بماند
+        body = rest.rstrip()
+        if body.endswith('}'):
+            body = body[:-1]
+        if kind == '@string':
+            macros.update(_split_bibtex_fields(body, macros))
+            continue
+        if kind in ('@comment', '@preamble'):
+            continue
+        _, _, body = body.partition(',')
+        fields = _split_bibtex_fields(body, macros)
+        if not fields.get('title'):
+            continue
+        yield {
+            'title': fields['title'][:500],
+            'venue': (fields.get('journal') or fields.get('booktitle') or fields.get('publisher') or '')[:255],
+            'year': _parse_year(fields.get('year')),
+            'doi': fields.get('doi'),
+            'authors': [author.strip() for author in fields.get('author', '').split(' and ') if author.strip()],
+        }
+
+
+def parse_csv(stream):
+    """
+    خواندن جریانی CSV با ستون‌های title, venue, year, doi, authors (نویسندگان با ; جدا می‌شوند)
+    """
+    for row in csv.DictReader(stream):
+        title = (row.get('title') or '').strip()
+        if not title:
+            continue
+        yield {
+            'title': title[:500],
+            'venue': (row.get('venue') or '').strip()[:255],
+            'year': _parse_year(row.get('year')),
+            'doi': row.get('doi'),
+            'authors': [author.strip() for author in (row.get('authors') or '').split(';') if author.strip()],
+        }
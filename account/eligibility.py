@@ -0,0 +1,165 @@
+"""
+محاسبه دروس قابل اخذ هر دانشجو با bitset
+
+به هر درس یک شماره متوالی داده می‌شود و پیش‌نیازهای هر درس به صورت یک عدد صحیح
+(bitset) نگه داشته می‌شود. دروس گذرانده دانشجو هم یک bitset است و درسی قابل اخذ است که
+گذرانده نشده و (پیش‌نیازها & ~گذرانده‌ها) == 0 باشد. کاتالوگ با کلید نسخه در cache
+نگه داشته می‌شود و با هر تغییر دروس یا پیش‌نیازها نسخه جدید ساخته می‌شود؛ در اجرای
+چند پردازه‌ای CACHES باید یک cache مشترک باشد تا نسخه بین پردازه‌ها یکسان بماند.
+"""
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from .models import Course, Enrollment
+
+VERSION_KEY = 'eligibility:version'
+CATALOG_KEY = 'eligibility:catalog:%s'
+
+_local = {}
+
+logger = logging.getLogger(__name__)
+
+
+def blocked_positions(requirements):
+    """
+    شماره دروسی که در یک دور پیش‌نیازی هستند یا به چنین درسی وابسته‌اند و هرگز قابل اخذ
+    نمی‌شوند؛ دروس بدون دور با حذف تدریجی دروس بی‌پیش‌نیاز (الگوریتم Kahn) کنار می‌روند
+    """
+    dependents = [[] for _ in requirements]
+    missing = [mask.bit_count() for mask in requirements]
+    for position, mask in enumerate(requirements):
+        while mask:
+            low = mask & -mask
+            dependents[low.bit_length() - 1].append(position)
+            mask ^= low
+    ready = [position for position, count in enumerate(missing) if not count]
+    while ready:
+        for dependent in dependents[ready.pop()]:
+            missing[dependent] -= 1
+            if not missing[dependent]:
+                ready.append(dependent)
+    return [position for position, count in enumerate(missing) if count]
+
+
+class Catalog:
+    """
+    شماره‌گذاری دروس و bitset پیش‌نیازهای هر درس
+    """
+
+    def __init__(self, codes, requirements):
+        self.codes = codes
+        self.index = {code: position for position, code in enumerate(codes)}
+        self.requirements = requirements
+        # دروس بدون پیش‌نیاز یک bitset جدا دارند تا برای هر دانشجو یکجا اضافه شوند
+        self.open_mask = sum(1 << position for position, mask in enumerate(requirements) if not mask)
+        self.gated = [(position, mask) for position, mask in enumerate(requirements) if mask]
+        self.blocked = [codes[position] for position in blocked_positions(requirements)]
+
+    @classmethod
+    def build(cls):
+        codes = list(Course.objects.order_by('code').values_list('code', flat=True))
+        index = {code: position for position, code in enumerate(codes)}
+        requirements = [0] * len(codes)
+        for course, prerequisite in Course.prerequisites.through.objects.values_list('from_course_id', 'to_course_id'):
+            requirements[index[course]] |= 1 << index[prerequisite]
+        catalog = cls(codes, requirements)
+        if catalog.blocked:
+            logger.warning("Prerequisite cycles make %d courses permanently ineligible: %s. "
+                           "Run 'manage.py prerequisite_cycles' to review them.",
+                           len(catalog.blocked), ", ".join(catalog.blocked[:20]))
+        return catalog
+
+    def eligible_mask(self, passed):
+        eligible = self.open_mask
+        missing = ~passed
+        for position, requirement in self.gated:
+            if not requirement & missing:
+                eligible |= 1 << position
+        return eligible & missing
+
+    def codes_of(self, mask):
+        codes = []
+        while mask:
+            low = mask & -mask
+            codes.append(self.codes[low.bit_length() - 1])
+            mask ^= low
+        return codes
+
+
+def catalog_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 1, timeout=None)
+        version = cache.get(VERSION_KEY, 1)
+    return version
+
+
+def invalidate_catalog(**kwargs):
+    # ویرایش نام یک درس یا مراحل pre_* تغییر پیش‌نیازها کاتالوگ را تغییر نمی‌دهند
+    if not kwargs.get('created', True) or kwargs.get('action', 'post_').startswith('pre_'):
+        return
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 1, timeout=None)
+    _local.clear()
+
+
+def get_catalog():
+    version = catalog_version()
+    catalog = _local.get(version)
+    if catalog is None:
+        catalog = cache.get(CATALOG_KEY % version)
+        if catalog is None:
+            catalog = Catalog.build()
+            cache.set(CATALOG_KEY % version, catalog, timeout=None)
+        _local.clear()
+        _local[version] = catalog
+    return catalog
+
+
+def passed_masks(catalog, student_ids):
+    """
+    bitset دروس گذرانده چند دانشجو با یک کوئری
+    """
+    masks = defaultdict(int)
+    rows = (Enrollment.objects
+            .filter(student_id__in=student_ids, grade__gte=getattr(settings, 'PASSING_GRADE', 10))
+            .values_list('student_id', 'course_id'))
+    for student, course in rows:
+        position = catalog.index.get(course)
+        if position is not None:
+            masks[student] |= 1 << position
+    return masks
+
+
+def eligible_courses(student_id):
+    catalog = get_catalog()
+    passed = passed_masks(catalog, [student_id])[student_id]
+    return catalog.codes_of(catalog.eligible_mask(passed))
+
+
+def eligible_courses_for_cohort(student_ids, batch_size=1000):
+    """
+    دروس قابل اخذ هر دانشجوی یک گروه؛ دیکشنری کد ملی -> فهرست کد دروس
+    """
+    catalog = get_catalog()
+    student_ids = list(student_ids)
+    result = {}
+    for start in range(0, len(student_ids), batch_size):
+        batch = student_ids[start:start + batch_size]
+        masks = passed_masks(catalog, batch)
+        for student in batch:
+            result[student] = catalog.codes_of(catalog.eligible_mask(masks[student]))
+    return result
+
+
+def connect_signals():
+    post_save.connect(invalidate_catalog, sender=Course, dispatch_uid='eligibility:course_saved')
+    post_delete.connect(invalidate_catalog, sender=Course, dispatch_uid='eligibility:course_deleted')
+    m2m_changed.connect(invalidate_catalog, sender=Course.prerequisites.through,
+                        dispatch_uid='eligibility:prerequisites_changed')
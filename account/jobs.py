@@ -0,0 +1,115 @@
+"""
+کارهای زمان‌بندی شده مربوط به کارکنان
+"""
+import datetime
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import get_connection, send_mass_mail
+from django.utils import timezone
+
+from scheduler.registry import register_job
+
+from .models import Professor, StaffAlert
+
+FIELDS = ('national_ID', 'personnel_code', 'first_Name', 'last_Name')
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def expiring_contracts(days, today=None):
+    """
+    قراردادهای قراردادی و پاره وقت که تا days روز آینده تمام می‌شوند (کوئری بازه‌ای روی ایندکس)
+    """
+    today = today or timezone.localdate()
+    return (Professor.objects
+            .filter(contract_end_date__range=(today, today + datetime.timedelta(days=days)),
+                    employment_status__in=get_setting('PAYROLL_CONTRACT_STATUSES', ('Contract', 'Temporary')))
+            .order_by('contract_end_date')
+            .values_list(*FIELDS, 'contract_end_date'))
+
+
+def promotion_milestones(days, years, today=None):
+    """
+    کارکنانی که در days روز آینده years سال از آخرین ترفیعشان می‌گذرد
+    """
+    today = today or timezone.localdate()
+
+    def years_before(date):
+        try:
+            return date.replace(year=date.year - years)
+        except ValueError:
+            # 29 فوریه
+            return date.replace(year=date.year - years, day=28)
+
+    return (Professor.objects
+            .filter(last_promotion_date__range=(years_before(today), years_before(today + datetime.timedelta(days=days))))
+            .order_by('last_promotion_date')
+            .values_list(*FIELDS, 'last_promotion_date'))
+
+
+def _batched(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def notify(subject, rows):
+    """
+    ارسال فهرست به صورت دسته‌ای؛ هر دسته یک ایمیل و همه ایمیل‌ها با یک اتصال
+    """
+    recipients = get_setting('STAFF_ALERT_RECIPIENTS', [])
+    from_email, prefix = None, ''
+    if not recipients:
+        # مانند mail_admins
+        recipients = [email for _, email in settings.ADMINS]
+        from_email, prefix = settings.SERVER_EMAIL, settings.EMAIL_SUBJECT_PREFIX
+    if not recipients:
+        raise ImproperlyConfigured("STAFF_ALERT_RECIPIENTS and ADMINS are empty, staff alerts have no recipients")
+    size = get_setting('STAFF_ALERT_BATCH_SIZE', 200)
+    messages = []
+    for number, batch in enumerate(_batched(rows, size), start=1):
+        body = "\n".join(f"{first} {last} - کد ملی {national_id} - کد پرسنلی {code} - {date}"
+                         for national_id, code, first, last, date in batch)
+        messages.append((f"{prefix}{subject} ({number})", body, from_email, recipients))
+    if not messages:
+        return 0
+    send_mass_mail(messages, connection=get_connection())
+    return len(messages)
+
+
+def alert(kind, subject, rows):
+    """
+    ارسال ردیف‌هایی که هشدارشان قبلا ارسال نشده است و ثبت آن‌ها؛ کار روزانه هر بار کل بازه را
+    می‌خواند ولی هر استاد فقط بار اول که وارد بازه می‌شود (یا تاریخش تغییر می‌کند) اعلام می‌شود
+    """
+    rows = list(rows)
+    sent = set(StaffAlert.objects.filter(kind=kind, date__in={row[-1] for row in rows})
+               .values_list('professor_id', 'date'))
+    rows = [row for row in rows if (row[0], row[-1]) not in sent]
+    count = notify(subject, rows)
+    # اگر ارسال شکست بخورد چیزی ثبت نمی‌شود و اجرای بعدی دوباره ارسال می‌کند
+    StaffAlert.objects.bulk_create([StaffAlert(kind=kind, professor_id=row[0], date=row[-1]) for row in rows],
+                                   ignore_conflicts=True)
+    return count
+
+
+@register_job('contract_expiry', '0 7 * * *')
+def contract_expiry_alerts():
+    days = get_setting('CONTRACT_EXPIRY_ALERT_DAYS', 30)
+    alert('contract_expiry', f"قراردادهای رو به اتمام در {days} روز آینده", expiring_contracts(days))
+
+
+@register_job('promotion_milestones', '5 7 * * *')
+def promotion_milestone_alerts():
+    days = get_setting('PROMOTION_REVIEW_ALERT_DAYS', 30)
+    years = get_setting('PROMOTION_REVIEW_YEARS', 4)
+    alert('promotion_milestone', f"کارکنانی که {years} سال از آخرین ترفیعشان می‌گذرد",
+          promotion_milestones(days, years))
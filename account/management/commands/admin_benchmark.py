@@ -0,0 +1,77 @@
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from account.backends import lookups
+
+SCENARIOS = {
+    'database': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.db',
+        'AUTHENTICATION_BACKENDS': ['django.contrib.auth.backends.ModelBackend'],
+    },
+    'cached_db': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.cached_db',
+        'AUTHENTICATION_BACKENDS': ['account.backends.CachedModelBackend'],
+    },
+    'signed_cookies': {
+        'SESSION_ENGINE': 'django.contrib.sessions.backends.signed_cookies',
+        'AUTHENTICATION_BACKENDS': ['account.backends.CachedModelBackend'],
+    },
+}
+URLS = ['admin:index', 'admin:account_course_changelist', 'admin:account_student_changelist']
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "سنجش زمان پاسخ صفحات مدیریت با تنظیمات مختلف نشست و احراز هویت (همه تغییرات برگردانده می‌شوند)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help="تعداد درخواست برای هر صفحه")
+        parser.add_argument('--scenario', choices=sorted(SCENARIOS), action='append', help="پیش‌فرض: همه")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic(), override_settings(ALLOWED_HOSTS=['testserver']):
+                user = self.staff_user()
+                for name in options['scenario'] or SCENARIOS:
+                    with override_settings(**SCENARIOS[name]):
+                        self.run(name, user, options['requests'])
+                raise Rollback
+        except Rollback:
+            pass
+
+    def staff_user(self):
+        group = Group.objects.create(name='admin-benchmark')
+        group.permissions.set(Permission.objects.filter(content_type__app_label='account', codename__startswith='view_'))
+        user = get_user_model().objects.create_user('admin-benchmark', is_staff=True)
+        user.groups.add(group)
+        return user
+
+    def run(self, name, user, count):
+        lookups.clear()
+        client = Client()
+        client.force_login(user)
+        self.stdout.write(f"{name}:")
+        for url in map(reverse, URLS):
+            # درخواست اول cache را پر می‌کند
+            client.get(url)
+            timings = []
+            with CaptureQueriesContext(connection) as queries:
+                for _ in range(count):
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            self.stdout.write(
+                f"  {url}: {response.status_code} mean {statistics.fmean(timings):.2f}ms "
+                f"p95 {timings[int(len(timings) * 0.95) - 1]:.2f}ms, {len(queries) / count:.1f} queries/request")
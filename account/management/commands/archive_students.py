@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from account.archive import archive_inactive_students, restore_students
+
+
+class Command(BaseCommand):
+    help = "انتقال دانشجویان غیرفعال به بایگانی یا بازگرداندن دانشجویان بایگانی شده"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--pause', type=float, default=0, help="مکث بین دسته‌ها (ثانیه)")
+        parser.add_argument('--limit', type=int)
+        parser.add_argument('--restore', nargs='+', metavar='STUDENT_ID', help="بازگرداندن و فعال کردن این دانشجویان")
+
+    def handle(self, *args, **options):
+        if options['restore']:
+            restored = restore_students(options['restore'])
+            self.stdout.write(self.style.SUCCESS(f"Restored {restored} students."))
+            return
+        moved = archive_inactive_students(options['batch_size'], options['pause'], options['limit'])
+        self.stdout.write(self.style.SUCCESS(f"Archived {moved} inactive students."))
@@ -0,0 +1,32 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from account.eligibility import eligible_courses_for_cohort
+from account.models import Student
+
+
+class Command(BaseCommand):
+    help = "فهرست دروس قابل اخذ دانشجویان (یک دانشجو یا یک گروه) به صورت CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--student', metavar='STUDENT_ID', help="کد دانشجویی")
+        parser.add_argument('--department', help="کد دپارتمان")
+        parser.add_argument('--degree', choices=[choice for choice, _ in Student.DEGREE_CHOICES])
+
+    def handle(self, *args, **options):
+        students = Student.objects.filter(is_active=True)
+        if options['student']:
+            students = students.filter(student_ID=options['student'])
+        if options['department']:
+            students = students.filter(Department_id=options['department'])
+        if options['degree']:
+            students = students.filter(degree=options['degree'])
+        students = dict(students.values_list('national_ID', 'student_ID'))
+        if not students:
+            raise CommandError("No matching active students.")
+
+        writer = csv.writer(self.stdout)
+        writer.writerow(['student_ID', 'eligible_courses'])
+        for national_id, codes in eligible_courses_for_cohort(students).items():
+            writer.writerow([students[national_id], " ".join(codes)])
@@ -0,0 +1,52 @@
+import os
+import time
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+
+from account.storage import BLOB_DIR
+
+
+def referenced_files():
+    """
+    نام همه فایل‌های استفاده شده؛ هر ستون فایل با یک اسکن روی ایندکس خودش خوانده می‌شود
+    """
+    names = set()
+    for model in apps.get_models():
+        for field in model._meta.concrete_fields:
+            if isinstance(field, models.FileField):
+                names.update(model._default_manager.order_by()
+                             .values_list(field.attname, flat=True).distinct())
+    return names
+
+
+class Command(BaseCommand):
+    help = "حذف فایل‌های blob که هیچ رکوردی به آن‌ها اشاره نمی‌کند"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true')
+        parser.add_argument('--grace-seconds', type=int, default=3600,
+                            help="فایل‌های جدیدتر از این مدت حذف نمی‌شوند (آپلودهایی که هنوز ذخیره نشده‌اند)")
+
+    def handle(self, *args, **options):
+        referenced = referenced_files()
+        root = default_storage.path(BLOB_DIR)
+        cutoff = time.time() - options['grace_seconds']
+        removed = freed = 0
+        for directory, subdirectories, files in os.walk(root, topdown=False):
+            for file_name in files:
+                path = os.path.join(directory, file_name)
+                name = os.path.relpath(path, default_storage.location).replace(os.sep, '/')
+                stat = os.stat(path)
+                if name in referenced or stat.st_mtime > cutoff:
+                    continue
+                removed += 1
+                freed += stat.st_size
+                if not options['dry_run']:
+                    os.remove(path)
+            if not options['dry_run'] and directory != root and not os.listdir(directory):
+                os.rmdir(directory)
+        verb = "Would remove" if options['dry_run'] else "Removed"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {removed} unreferenced blobs ({freed} bytes)."))
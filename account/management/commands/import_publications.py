@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import Professor
+from account.bibliography import parse_bibtex, parse_csv
+from account.publications import PublicationIngester
+
+PARSERS = {
+    'bibtex': parse_bibtex,
+    'csv': parse_csv,
+}
+
+
+class Command(BaseCommand):
+    help = "ورود دسته‌ای مقالات از فایل BibTeX یا CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=PARSERS, help="پیش‌فرض بر اساس پسوند فایل")
+        parser.add_argument('--professor', action='append', default=[],
+                            help="کد ملی استادی که به همه مقالات فایل متصل می‌شود")
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('bibtex' if path.lower().endswith('.bib') else 'csv')
+        professors = options['professor']
+        missing = set(professors) - set(Professor.objects.filter(national_ID__in=professors)
+                                        .values_list('national_ID', flat=True))
+        if missing:
+            raise CommandError(f"Unknown professor(s): {', '.join(sorted(missing))}")
+
+        ingester = PublicationIngester(batch_size=options['batch_size'], default_authors=professors)
+        with open(path, encoding='utf-8', newline='') as stream:
+            created, duplicates = ingester.ingest(PARSERS[file_format](stream))
+        self.stdout.write(self.style.SUCCESS(f"Imported {created} publications, skipped {duplicates} duplicates."))
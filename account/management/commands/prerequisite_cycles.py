@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+
+from account.eligibility import Catalog, invalidate_catalog
+from account.models import Course
+
+
+class Command(BaseCommand):
+    help = "گزارش (و در صورت درخواست حذف) پیش‌نیازهای دوطرفه و دروسی که به خاطر دور پیش‌نیازی هرگز قابل اخذ نیستند"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix', choices=['keep-lower', 'drop'],
+            help="keep-lower: از هر جفت دوطرفه فقط جهتی که درس با کد کوچک‌تر پیش‌نیاز است می‌ماند؛ "
+                 "drop: هر دو جهت حذف می‌شوند. در هر دو حالت درس پیش‌نیاز خودش حذف می‌شود",
+        )
+
+    def mirrored_pairs(self):
+        """
+        جفت‌های (a, b) با a < b که هر دو جهت a -> b و b -> a ذخیره شده است؛ رابطه پیش از
+        symmetrical=False همه پیش‌نیازها را به این شکل ذخیره می‌کرد
+        """
+        edges = set(Course.prerequisites.through.objects.values_list('from_course_id', 'to_course_id'))
+        return sorted((course, prerequisite) for course, prerequisite in edges
+                      if course < prerequisite and (prerequisite, course) in edges)
+
+    def handle(self, *args, **options):
+        Through = Course.prerequisites.through
+        pairs = self.mirrored_pairs()
+        loops = list(Through.objects.filter(from_course_id=F('to_course_id'))
+                     .values_list('from_course_id', flat=True))
+        for first, second in pairs:
+            self.stdout.write(f"mirrored: {first} <-> {second}")
+        for code in loops:
+            self.stdout.write(f"self: {code}")
+
+        if options['fix'] and (pairs or loops):
+            remove = Q(from_course_id=F('to_course_id'))
+            for first, second in pairs:
+                # first < second؛ در keep-lower درس second به first نیاز دارد و جهت first -> second حذف می‌شود
+                remove |= Q(from_course_id=first, to_course_id=second)
+                if options['fix'] == 'drop':
+                    remove |= Q(from_course_id=second, to_course_id=first)
+            with transaction.atomic():
+                deleted, _ = Through.objects.filter(remove).delete()
+                # حذف دسته‌ای سیگنال m2m_changed نمی‌فرستد
+                invalidate_catalog()
+            self.stdout.write(self.style.SUCCESS(f"Removed {deleted} prerequisite rows."))
+
+        blocked = Catalog.build().blocked
+        for code in blocked:
+            self.stdout.write(f"blocked: {code}")
+        self.stdout.write(f"{len(pairs)} mirrored pairs, {len(loops)} self prerequisites, "
+                          f"{len(blocked)} permanently ineligible courses.")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from account.publications import annual_output, professor_output, venue_output
+
+
+class Command(BaseCommand):
+    help = "گزارش سالانه تولیدات پژوهشی اساتید"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--year', type=int, help="گزارش تفصیلی یک سال")
+        parser.add_argument('--from', dest='year_from', type=int)
+        parser.add_argument('--to', dest='year_to', type=int)
+
+    def handle(self, *args, **options):
+        if options['year']:
+            year = options['year']
+            self.stdout.write(f"Publications per professor in {year}:")
+            for row in professor_output(year):
+                self.stdout.write(f"  {row['first_Name']} {row['last_Name']} ({row['national_ID']}): {row['count']}")
+            self.stdout.write(f"Publications per venue in {year}:")
+            for row in venue_output(year):
+                self.stdout.write(f"  {row['venue'] or '-'}: {row['count']}")
+            return
+        for row in annual_output(options['year_from'], options['year_to']):
+            self.stdout.write(f"{row['year']}: {row['count']}")
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0003_department_created_at_department_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Publication',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=500, verbose_name='عنوان')),
+                ('venue', models.CharField(blank=True, max_length=255, verbose_name='محل انتشار')),
+                ('year', models.PositiveSmallIntegerField(blank=True, null=True, verbose_name='سال انتشار')),
+                ('doi', models.CharField(blank=True, max_length=255, null=True, unique=True, verbose_name='DOI')),
+                ('title_hash', models.CharField(editable=False, max_length=40, unique=True, verbose_name='هش عنوان')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('authors', models.ManyToManyField(blank=True, related_name='publication_set', to='account.professor', verbose_name='نویسندگان')),
+            ],
+            options={
+                'verbose_name': 'مقاله',
+                'verbose_name_plural': 'مقالات',
+                'db_table': 'Publication',
+                'indexes': [models.Index(fields=['year'], name='publication_year_idx'), models.Index(fields=['venue', 'year'], name='publication_venue_year_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,60 @@
+from django.db import migrations
+
+from account.bibliography import normalize_doi, parse_text_blob, title_hash
+
+BATCH_SIZE = 200
+
+
+def parse_publications(apps, schema_editor):
+    """
+    تبدیل متن آزاد Professor.publications به رکوردهای Publication به صورت دسته‌ای
+    """
+    Professor = apps.get_model('account', 'Professor')
+    Publication = apps.get_model('account', 'Publication')
+    Through = Publication.authors.through
+    db = schema_editor.connection.alias
+
+    seen_dois = dict(Publication.objects.using(db).exclude(doi=None).values_list('doi', 'title_hash'))
+    seen_hashes = set(Publication.objects.using(db).values_list('title_hash', flat=True))
+    professors = (Professor.objects.using(db).exclude(publications='')
+                  .values_list('national_ID', 'publications').iterator(chunk_size=BATCH_SIZE))
+
+    def flush(publications, links):
+        Publication.objects.using(db).bulk_create(publications)
+        ids = dict(Publication.objects.using(db).filter(title_hash__in={digest for digest, _ in links})
+                   .values_list('title_hash', 'id'))
+        Through.objects.using(db).bulk_create(
+            [Through(publication_id=ids[digest], professor_id=professor) for digest, professor in links],
+            ignore_conflicts=True)
+
+    publications, links = [], []
+    for national_id, text in professors:
+        for record in parse_text_blob(text):
+            doi = normalize_doi(record['doi'])
+            digest = title_hash(record['title'])
+            if doi in seen_dois:
+                links.append((seen_dois[doi], national_id))
+                continue
+            links.append((digest, national_id))
+            if digest in seen_hashes:
+                continue
+            if doi:
+                seen_dois[doi] = digest
+            seen_hashes.add(digest)
+            publications.append(Publication(title=record['title'], year=record['year'], doi=doi, title_hash=digest))
+        if len(publications) >= BATCH_SIZE:
+            flush(publications, links)
+            publications, links = [], []
+    if links:
+        flush(publications, links)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0004_publication'),
+    ]
+
+    operations = [
+        migrations.RunPython(parse_publications, migrations.RunPython.noop),
+    ]
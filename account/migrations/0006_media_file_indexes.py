@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_parse_professor_publications'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='professor',
+            index=models.Index(fields=['profile_Image'], name='professor_profile_image_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='professor',
+            index=models.Index(fields=['agreement_image'], name='professor_agreement_image_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['profile_Image'], name='student_profile_image_idx'),
+        ),
+    ]
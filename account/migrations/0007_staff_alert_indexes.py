@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_media_file_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='professor',
+            index=models.Index(fields=['contract_end_date'], name='professor_contract_end_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='professor',
+            index=models.Index(fields=['last_promotion_date'], name='professor_promotion_idx'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:43
+
+import django.core.validators
+import django.db.models.deletion
+import django_jalali.db.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0007_staff_alert_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedStudent',
+            fields=[
+                ('first_Name', models.CharField(max_length=50, validators=[django.core.validators.RegexValidator(message='نام کاربر حداقل 3 حرف و فاقد عدد باید باشد', regex="^[\\w'\\-,.][^0-9_!¡?÷?¿/\\\\+=@#$%ˆ&*(){}|~<>;:[\\]]{2,50}$")], verbose_name='نام')),
+                ('last_Name', models.CharField(max_length=50, validators=[django.core.validators.RegexValidator(message='نام خانوادگی کاربر حداقل 3 حرف و فاقد عدد باید باشد', regex="^[\\w'\\-,.][^0-9_!¡?÷?¿/\\\\+=@#$%ˆ&*(){}|~<>;:[\\]]{2,50}$")], verbose_name='نام خانوادگی')),
+                ('father_Name', models.CharField(max_length=50, validators=[django.core.validators.RegexValidator(message='نام پدر، کاربر حداقل 3 حرف و فاقد عدد باید باشد', regex="^[\\w'\\-,.][^0-9_!¡?÷?¿/\\\\+=@#$%ˆ&*(){}|~<>;:[\\]]{2,50}$")], verbose_name='نام پدر')),
+                ('birth_Date', django_jalali.db.models.jDateField(verbose_name='تاریخ تولد')),
+                ('gender', models.BooleanField(choices=[(True, 'مرد'), (False, 'زن')], default=True, verbose_name='جنسیت')),
+                ('marital_status', models.BooleanField(choices=[(True, 'مجرد'), (False, 'متاهل')], default=True, verbose_name='وضعیت تاهل')),
+                ('blood_Type', models.CharField(choices=[('AB', 'AB'), ('AB+', 'AB+'), ('AB-', 'AB-'), ('A', 'A'), ('A+', 'A+'), ('A-', 'A-'), ('B', 'B'), ('B+', 'B+'), ('B-', 'B-'), ('O', 'O'), ('O+', 'O+'), ('O-', 'O-')], default='B+', max_length=3, verbose_name='گروه خونی')),
+                ('nationality', models.BooleanField(choices=[(True, 'ایرانی'), (False, 'اتباع')], default=True, verbose_name='ملیت')),
+                ('national_ID', models.CharField(max_length=10, primary_key=True, serialize=False, validators=[django.core.validators.RegexValidator(message='کد ملی باید ۱۰ رقم باشد', regex='^\\d{10}$')], verbose_name='کد ملی')),
+                ('profile_Image', models.ImageField(default='account/profiles/default_User.png', upload_to='account/profiles', verbose_name='عکس پروفایل')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('student_ID', models.CharField(max_length=14, unique=True, validators=[django.core.validators.RegexValidator(message='کد دانشجویی باید 14 رقم باشد', regex='^\\d{14}$')], verbose_name='کد دانشجویی')),
+                ('enrollment_date', django_jalali.db.models.jDateField(verbose_name='تاریخ ثبت \u200cنام')),
+                ('degree', models.CharField(choices=[('associate', 'کاردانی'), ('bachelor', 'کارشناسی'), ('master', 'کارشناسی ارشد'), ('phd', 'دکتری')], max_length=20, verbose_name='مقطع تحصیلی')),
+                ('is_active', models.BooleanField(default=True, verbose_name='وضعیت تحصیلی')),
+                ('major', models.CharField(max_length=50, verbose_name='رشته تحصیلی اصلی')),
+                ('minor', models.CharField(blank=True, max_length=50, verbose_name='رشته تحصیلی فرعی')),
+                ('gpa', models.DecimalField(blank=True, decimal_places=2, max_digits=4, verbose_name='میانگین نمرات')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ بایگانی')),
+            ],
+            options={
+                'verbose_name': 'دانشجوی بایگانی شده',
+                'verbose_name_plural': 'دانشجویان بایگانی شده',
+                'db_table': 'ArchivedStudent',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['national_ID'], name='student_inactive_idx'),
+        ),
+        migrations.AddField(
+            model_name='archivedstudent',
+            name='Department',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='account.department', verbose_name='دپارتمان'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:44
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0008_archived_student'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='prerequisites',
+            field=models.ManyToManyField(blank=True, related_name='required_for', to='account.course', verbose_name='پیش \u200cنیاز ها'),
+        ),
+        migrations.CreateModel(
+            name='ArchivedEnrollment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=5, validators=[django.core.validators.RegexValidator(message='نیمسال باید به صورت سال و شماره نیمسال باشد (مثلا 14031)', regex='^\\d{4}[1-3]$')], verbose_name='نیمسال')),
+                ('grade', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True, verbose_name='نمره')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='account.course', verbose_name='درس')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='account.archivedstudent', verbose_name='دانشجو')),
+            ],
+            options={
+                'verbose_name': 'درس اخذ شده (بایگانی)',
+                'verbose_name_plural': 'دروس اخذ شده (بایگانی)',
+                'db_table': 'ArchivedEnrollment',
+                'unique_together': {('student', 'course', 'term')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Enrollment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=5, validators=[django.core.validators.RegexValidator(message='نیمسال باید به صورت سال و شماره نیمسال باشد (مثلا 14031)', regex='^\\d{4}[1-3]$')], verbose_name='نیمسال')),
+                ('grade', models.DecimalField(blank=True, decimal_places=2, max_digits=4, null=True, verbose_name='نمره')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='account.course', verbose_name='درس')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='account.student', verbose_name='دانشجو')),
+            ],
+            options={
+                'verbose_name': 'درس اخذ شده',
+                'verbose_name_plural': 'دروس اخذ شده',
+                'db_table': 'Enrollment',
+                'unique_together': {('student', 'course', 'term')},
+            },
+        ),
+    ]
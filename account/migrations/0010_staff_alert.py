@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:38
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0009_enrollment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StaffAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('contract_expiry', 'پایان قرارداد'), ('promotion_milestone', 'موعد ترفیع')], max_length=30, verbose_name='نوع هشدار')),
+                ('date', models.DateField(verbose_name='تاریخ')),
+                ('sent_at', models.DateTimeField(auto_now_add=True, verbose_name='زمان ارسال')),
+                ('professor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='account.professor', verbose_name='استاد')),
+            ],
+            options={
+                'verbose_name': 'هشدار ارسال شده',
+                'verbose_name_plural': 'هشدارهای ارسال شده',
+                'db_table': 'StaffAlert',
+                'constraints': [models.UniqueConstraint(fields=('kind', 'professor', 'date'), name='staff_alert_unique')],
+            },
+        ),
+    ]
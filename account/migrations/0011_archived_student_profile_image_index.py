@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 13:44
+
+from django.db import migrations, models
+
+from backfill.operations import AddIndexOnline
+
+
+class Migration(migrations.Migration):
+    # جدول بایگانی بزرگ است؛ ایندکس بدون قفل طولانی نوشتن ساخته می‌شود
+    atomic = False
+
+    dependencies = [
+        ('account', '0010_staff_alert'),
+    ]
+
+    operations = [
+        AddIndexOnline(
+            model_name='archivedstudent',
+            index=models.Index(fields=['profile_Image'], name='archived_profile_image_idx'),
+        ),
+    ]
@@ -133,6 +133,12 @@ class Professor(Employee):
         verbose_name = "استاد"
         verbose_name_plural = "اساتید"
         db_table = "Professor"
+        indexes = [
+            models.Index(fields=['profile_Image'], name='professor_profile_image_idx'),
+            models.Index(fields=['agreement_image'], name='professor_agreement_image_idx'),
+            models.Index(fields=['contract_end_date'], name='professor_contract_end_idx'),
+            models.Index(fields=['last_promotion_date'], name='professor_promotion_idx'),
+        ]
 
     ACADEMIC_RANK_CHOICES = {
         'Assistant_Professor': 'استادیار',
@@ -154,16 +160,72 @@ class Professor(Employee):
     def __str__(self):
         return f"{self.first_Name} - {self.last_Name}"
 
-class Student(Person):
+class Publication(models.Model):
     """
-    دانشجو
+    مقاله یا اثر پژوهشی اساتید
+    """
+    class Meta:
+        verbose_name = "مقاله"
+        verbose_name_plural = "مقالات"
+        db_table = "Publication"
+        indexes = [
+            models.Index(fields=['year'], name='publication_year_idx'),
+            models.Index(fields=['venue', 'year'], name='publication_venue_year_idx'),
+        ]
+
+    title = models.CharField(max_length=500, verbose_name="عنوان")
+    venue = models.CharField(max_length=255, blank=True, verbose_name="محل انتشار")
+    year = models.PositiveSmallIntegerField(null=True, blank=True, verbose_name="سال انتشار")
+    doi = models.CharField(max_length=255, null=True, blank=True, unique=True, verbose_name="DOI")
+    title_hash = models.CharField(max_length=40, unique=True, editable=False, verbose_name="هش عنوان")
+    authors = models.ManyToManyField(Professor, blank=True, related_name="publication_set", verbose_name="نویسندگان")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+
+    def save(self, *args, **kwargs):
+        from .bibliography import normalize_doi, title_hash
+        self.doi = normalize_doi(self.doi)
+        self.title_hash = title_hash(self.title)
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return self.title
+
+class StaffAlert(models.Model):
+    """
+    هشدار ارسال شده برای یک استاد؛ هر موعد (پایان قرارداد یا ترفیع) فقط یک بار اعلام می‌شود
+    """
+    class Meta:
+        verbose_name = "هشدار ارسال شده"
+        verbose_name_plural = "هشدارهای ارسال شده"
+        db_table = "StaffAlert"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'professor', 'date'], name='staff_alert_unique'),
+        ]
+
+    KIND_CHOICES = {
+        'contract_expiry': 'پایان قرارداد',
+        'promotion_milestone': 'موعد ترفیع',
+    }
+
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES, verbose_name="نوع هشدار")
+    professor = models.ForeignKey(Professor, on_delete=models.CASCADE, related_name="alerts", verbose_name="استاد")
+    # تاریخ پایان قرارداد یا آخرین ترفیع؛ با تغییر آن هشدار دوباره ارسال می‌شود
+    date = models.DateField(verbose_name="تاریخ")
+    sent_at = models.DateTimeField(auto_now_add=True, verbose_name="زمان ارسال")
+
+    def __str__(self):
+        return f"{self.professor} - {self.get_kind_display()}"
+
+class StudentBase(Person):
+    """
+    مدل پایه اطلاعات دانشجو (دانشجویان فعلی و بایگانی شده)
     """
 
     class Meta:
         verbose_name = "دانشجو"
         verbose_name_plural = "دانشجویان"
-        db_table = "Student"
-        unique_together = ['student_ID', 'national_ID']
+        abstract = True
 
     student_ID = models.CharField(
         max_length=14,
@@ -192,6 +254,36 @@ class Student(Person):
     def __str__(self):
         return f"{self.first_Name} - {self.last_Name} - {self.student_ID}"
 
+class Student(StudentBase):
+    """
+    دانشجو
+    """
+
+    class Meta:
+        verbose_name = "دانشجو"
+        verbose_name_plural = "دانشجویان"
+        db_table = "Student"
+        unique_together = ['student_ID', 'national_ID']
+        indexes = [
+            models.Index(fields=['profile_Image'], name='student_profile_image_idx'),
+            models.Index(fields=['national_ID'], condition=models.Q(is_active=False), name='student_inactive_idx'),
+        ]
+
+class ArchivedStudent(StudentBase):
+    """
+    دانشجوی فارغ‌التحصیل یا انصرافی که از جدول اصلی به بایگانی منتقل شده است
+    """
+
+    class Meta:
+        verbose_name = "دانشجوی بایگانی شده"
+        verbose_name_plural = "دانشجویان بایگانی شده"
+        db_table = "ArchivedStudent"
+        indexes = [
+            models.Index(fields=['profile_Image'], name='archived_profile_image_idx'),
+        ]
+
+    archived_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ بایگانی")
+
 class ContactInfo(models.Model):
     """
     مدل پایه برای اطلاعات تماس و ایمیل اشخاص
@@ -357,7 +449,8 @@ class Course(models.Model):
                 message="تعداد واحد باید حداقل 1 و حداکثر 3 واحد باشد"
             )
         ])
-    prerequisites = models.ManyToManyField('self', blank=True, verbose_name="پیش ‌نیاز ها")
+    prerequisites = models.ManyToManyField('self', blank=True, symmetrical=False, related_name="required_for",
+                                           verbose_name="پیش ‌نیاز ها")
     department = models.ForeignKey("Department", on_delete=models.PROTECT, verbose_name="دپارتمان")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
@@ -365,6 +458,60 @@ class Course(models.Model):
     def __str__(self):
         return f"{self.name} - {self.code}"
 
+class EnrollmentBase(models.Model):
+    """
+    مدل پایه اخذ درس توسط دانشجو در یک نیمسال و نمره آن
+    """
+
+    class Meta:
+        verbose_name = "درس اخذ شده"
+        verbose_name_plural = "دروس اخذ شده"
+        abstract = True
+
+    course = models.ForeignKey(Course, on_delete=models.PROTECT, related_name="+", verbose_name="درس")
+    term = models.CharField(
+        max_length=5,
+        validators=[
+            RegexValidator(
+                regex=r'^\d{4}[1-3]$',
+                message="نیمسال باید به صورت سال و شماره نیمسال باشد (مثلا 14031)"
+            )
+        ],
+        verbose_name="نیمسال")
+    grade = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True, verbose_name="نمره")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+
+    def __str__(self):
+        return f"{self.student_id} - {self.course_id} - {self.term}"
+
+class Enrollment(EnrollmentBase):
+    """
+    درس اخذ شده
+    """
+
+    class Meta:
+        verbose_name = "درس اخذ شده"
+        verbose_name_plural = "دروس اخذ شده"
+        db_table = "Enrollment"
+        unique_together = ['student', 'course', 'term']
+
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="enrollments", verbose_name="دانشجو")
+
+class ArchivedEnrollment(EnrollmentBase):
+    """
+    درس اخذ شده دانشجوی بایگانی شده
+    """
+
+    class Meta:
+        verbose_name = "درس اخذ شده (بایگانی)"
+        verbose_name_plural = "دروس اخذ شده (بایگانی)"
+        db_table = "ArchivedEnrollment"
+        unique_together = ['student', 'course', 'term']
+
+    student = models.ForeignKey(ArchivedStudent, on_delete=models.CASCADE, related_name="enrollments",
+                                verbose_name="دانشجو")
+
 class Faculty(models.Model):
     """
     دانشکده
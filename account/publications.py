@@ -0,0 +1,128 @@
+"""
+ورود دسته‌ای مقالات از فایل‌های BibTeX و CSV و گزارش‌های پژوهشی
+
+فایل‌ها به صورت جریانی و خط به خط خوانده می‌شوند و رکوردها در دسته‌های batch_size
+با bulk_create ذخیره می‌شوند. مقالات تکراری بر اساس DOI یا هش عنوان نرمال شده حذف می‌شوند.
+"""
+from django.db import transaction
+from django.db.models import Count
+
+from .bibliography import normalize_doi, title_hash
+from .models import Professor, Publication
+from .text import normalize
+
+
+def _author_key(name):
+    # «نام خانوادگی، نام» در BibTeX و «نام نام خانوادگی» هر دو به یک کلید می‌رسند
+    if ',' in name:
+        last, _, first = name.partition(',')
+        name = f"{first} {last}"
+    return " ".join(sorted(normalize(name).split()))
+
+
+class PublicationIngester:
+    """
+    ذخیره دسته‌ای رکوردهای مقاله به همراه اتصال به اساتید نویسنده
+    """
+
+    def __init__(self, batch_size=500, default_authors=()):
+        self.batch_size = batch_size
+        self.default_authors = list(default_authors)
+        self.created = 0
+        self.duplicates = 0
+        self._professors = None
+
+    @property
+    def professors(self):
+        # یک بار همه اساتید خوانده می‌شوند تا تطبیق نام نویسنده کوئری جداگانه نداشته باشد
+        if self._professors is None:
+            self._professors = {}
+            for pk, first, last in Professor.objects.values_list('national_ID', 'first_Name', 'last_Name'):
+                self._professors[pk] = pk
+                self._professors[_author_key(f"{first} {last}")] = pk
+        return self._professors
+
+    def _resolve_authors(self, names):
+        found = {self.professors.get(name) or self.professors.get(_author_key(name)) for name in names}
+        found.discard(None)
+        return found | set(self.default_authors)
+
+    def ingest(self, records):
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        if batch:
+            self._flush(batch)
+        return self.created, self.duplicates
+
+    @transaction.atomic
+    def _flush(self, records):
+        # نگاشت DOI و هش عنوان به هش عنوان مقاله اصلی، برای موجودها با دو کوئری ایندکس دار
+        known = {}
+        for doi, digest in (Publication.objects
+                            .filter(doi__in=[normalize_doi(record['doi']) for record in records])
+                            .values_list('doi', 'title_hash')):
+            known[doi] = digest
+        for digest in (Publication.objects
+                       .filter(title_hash__in=[title_hash(record['title']) for record in records])
+                       .values_list('title_hash', flat=True)):
+            known[digest] = digest
+
+        new, links = [], []
+        for record in records:
+            doi = normalize_doi(record['doi'])
+            digest = title_hash(record['title'])
+            authors = self._resolve_authors(record['authors'])
+            original = known.get(doi) if doi else None
+            original = original or known.get(digest)
+            if original:
+                # مقاله تکراری فقط نویسندگان جدیدش را اضافه می‌کند
+                self.duplicates += 1
+                links.extend((original, professor) for professor in authors)
+                continue
+            if doi:
+                known[doi] = digest
+            known[digest] = digest
+            new.append(Publication(title=record['title'], venue=record['venue'], year=record['year'], doi=doi,
+                                   title_hash=digest))
+            links.extend((digest, professor) for professor in authors)
+        Publication.objects.bulk_create(new)
+        self.created += len(new)
+
+        if links:
+            ids = dict(Publication.objects.filter(title_hash__in={digest for digest, _ in links})
+                       .values_list('title_hash', 'id'))
+            Through = Publication.authors.through
+            Through.objects.bulk_create([
+                Through(publication_id=ids[digest], professor_id=professor) for digest, professor in links
+            ], ignore_conflicts=True)
+
+
+def annual_output(year_from=None, year_to=None):
+    """
+    تعداد مقالات هر سال
+    """
+    publications = Publication.objects.filter(year__isnull=False)
+    if year_from:
+        publications = publications.filter(year__gte=year_from)
+    if year_to:
+        publications = publications.filter(year__lte=year_to)
+    return publications.values('year').annotate(count=Count('id')).order_by('year')
+
+
+def professor_output(year):
+    """
+    تعداد مقالات هر استاد در یک سال
+    """
+    return (Professor.objects.filter(publication_set__year=year)
+            .values('national_ID', 'first_Name', 'last_Name')
+            .annotate(count=Count('publication_set'))
+            .order_by('-count'))
+
+
+def venue_output(year):
+    return (Publication.objects.filter(year=year)
+            .values('venue').annotate(count=Count('id')).order_by('-count'))
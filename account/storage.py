@@ -0,0 +1,72 @@
+"""
+ذخیره‌سازی فایل‌های آپلودی بر اساس هش محتوا
+
+هر فایل در مسیر blobs/ab/cd/<sha256><پسوند> ذخیره می‌شود، بنابراین فایل‌های یکسان
+(مثل اسکن‌های تکراری قرارداد) فقط یک بار روی دیسک نوشته می‌شوند. هش در همان گذر
+نوشتن فایل موقت و به صورت تکه تکه محاسبه می‌شود.
+"""
+import hashlib
+import os
+import tempfile
+
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+BLOB_DIR = 'blobs'
+
+
+def blob_name(digest, extension):
+    return f"{BLOB_DIR}/{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}"
+
+
+@deconstructible
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    FileSystemStorage با نام‌گذاری بر اساس محتوا و حذف فایل‌های تکراری
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # نام نهایی در _save از روی محتوا ساخته می‌شود و تداخل نام معنا ندارد
+        return name
+
+    def _save(self, name, content):
+        extension = os.path.splitext(name)[1]
+        temp_dir = self.path(os.path.join(BLOB_DIR, 'tmp'))
+        os.makedirs(temp_dir, mode=self.directory_permissions_mode or 0o777, exist_ok=True)
+
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=temp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                if hasattr(content, 'seek'):
+                    content.seek(0)
+                for chunk in content.chunks():
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode()
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+
+            final_name = blob_name(digest.hexdigest(), extension)
+            final_path = self.path(final_name)
+            try:
+                # محتوای یکسان قبلا ذخیره شده است؛ زمان تغییر تازه می‌شود تا gc_media در مهلت
+                # grace-seconds آن را پیش از ثبت رکورد جدید حذف نکند
+                os.utime(final_path)
+                return final_name
+            except FileNotFoundError:
+                pass
+            os.makedirs(os.path.dirname(final_path), mode=self.directory_permissions_mode or 0o777, exist_ok=True)
+            file_move_safe(temp_path, final_path, allow_overwrite=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(final_path, self.file_permissions_mode)
+            return final_name
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def delete(self, name):
+        # یک blob ممکن است توسط چند رکورد استفاده شود؛ حذف فقط با دستور gc_media انجام می‌شود
+        if name and name.startswith(f"{BLOB_DIR}/"):
+            return
+        super().delete(name)
@@ -1,3 +1,437 @@
-from django.test import TestCase
+import datetime
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+import jdatetime
+from django.contrib.auth import get_user
+from django.contrib.auth.models import Group, Permission, User, update_last_login
+from django.core import mail
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import connection, transaction
+from django.http import HttpRequest
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from documents.models import DocumentJob
+
+from . import backends, jobs
+from .archive import archive_inactive_students, restore_students
+from .bibliography import normalize_doi, parse_bibtex, parse_csv
+from .eligibility import Catalog
+from .models import (ArchivedEnrollment, ArchivedStudent, Course, Department, Enrollment, Faculty, Professor,
+                     Student)
+
+
+class ParseBibtexTests(SimpleTestCase):
+
+    def parse(self, text):
+        return list(parse_bibtex(io.StringIO(text)))
+
+    def test_compact_entry_keeps_last_field(self):
+        [record] = self.parse("@article{key, title={Title}, doi={10.1000/xyz.1}, year={2022}}\n")
+        self.assertEqual(record['doi'], '10.1000/xyz.1')
+        self.assertEqual(record['title'], 'Title')
+
+    def test_compact_entry_with_year_last(self):
+        [record] = self.parse("@article{key, title={Title}, year={2022}}")
+        self.assertEqual(record['year'], 2022)
+
+    def test_bare_last_value(self):
+        [record] = self.parse("@inproceedings{key, title={Title}, booktitle={Conf}, year=2019}")
+        self.assertEqual(record['year'], 2019)
+        self.assertEqual(record['venue'], 'Conf')
+
+    def test_multiline_entry_with_quoted_values(self):
+        [record] = self.parse(
+            '@article{key,\n'
+            '  author = "Smith, John and Doe, Jane",\n'
+            '  title = "A {Nested} Title",\n'
+            '  journal = {Journal},\n'
+            '  doi = "10.1000/abc"\n'
+            '}\n'
+        )
+        self.assertEqual(record['title'], 'A Nested Title')
+        self.assertEqual(record['authors'], ['Smith, John', 'Doe, Jane'])
+        self.assertEqual(record['venue'], 'Journal')
+        self.assertEqual(record['doi'], '10.1000/abc')
+
+    def test_string_macros_are_expanded(self):
+        [record] = self.parse(
+            '@string{jacm = "Journal of the ACM"}\n'
+            '@article{key, title={Title}, journal=jacm, year=2020}\n'
+        )
+        self.assertEqual(record['venue'], 'Journal of the ACM')
+
+    def test_comment_preamble_and_untitled_entries_are_skipped(self):
+        records = self.parse(
+            '@comment{ignored}\n'
+            '@preamble{"\\newcommand{\\x}{y}"}\n'
+            '@misc{empty, note={no title}}\n'
+            'stray text\n'
+            '@book{key, title={Kept}}\n'
+        )
+        self.assertEqual([record['title'] for record in records], ['Kept'])
+
+
+class ParseCsvTests(SimpleTestCase):
+
+    def test_rows(self):
+        records = list(parse_csv(io.StringIO(
+            'title,venue,year,doi,authors\n'
+            '"Title, with comma",Venue,1402,10.1000/x,"Ali Rezaei; Sara Ahmadi"\n'
+            ',Skipped,2020,,\n'
+        )))
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['title'], 'Title, with comma')
+        self.assertEqual(records[0]['year'], 1402)
+        self.assertEqual(records[0]['authors'], ['Ali Rezaei', 'Sara Ahmadi'])
+
+    def test_missing_columns(self):
+        [record] = parse_csv(io.StringIO('title\nOnly title\n'))
+        self.assertEqual(record['venue'], '')
+        self.assertIsNone(record['year'])
+        self.assertEqual(record['authors'], [])
+
+
+class NormalizeDoiTests(SimpleTestCase):
+
+    def test_prefixes_and_case(self):
+        for value in ('10.1000/ABC', 'https://doi.org/10.1000/abc', 'http://dx.doi.org/10.1000/abc',
+                      'doi: 10.1000/abc', '  DOI:10.1000/Abc  '):
+            self.assertEqual(normalize_doi(value), '10.1000/abc')
+
+    def test_empty(self):
+        self.assertIsNone(normalize_doi(None))
+        self.assertIsNone(normalize_doi(''))
+        self.assertIsNone(normalize_doi('https://doi.org/'))
+
+
+class CatalogTests(SimpleTestCase):
+
+    def test_eligible_mask(self):
+        # B به A و C به A و B نیاز دارد
+        catalog = Catalog(['A', 'B', 'C'], [0, 0b001, 0b011])
+        self.assertEqual(catalog.codes_of(catalog.eligible_mask(0)), ['A'])
+        self.assertEqual(catalog.codes_of(catalog.eligible_mask(0b001)), ['B'])
+        self.assertEqual(catalog.codes_of(catalog.eligible_mask(0b011)), ['C'])
+        self.assertEqual(catalog.blocked, [])
+
+    def test_cycles_are_reported(self):
+        # A و B پیش‌نیاز یکدیگرند (رابطه متقارن قدیمی)، C به B وابسته است، D پیش‌نیاز خودش است
+        catalog = Catalog(['A', 'B', 'C', 'D', 'E'], [0b00010, 0b00001, 0b00010, 0b01000, 0])
+        self.assertEqual(catalog.blocked, ['A', 'B', 'C', 'D'])
+
+
+class ArchiveTests(TestCase):
+    CREATED = timezone.make_aware(datetime.datetime(2024, 1, 1, 12, 0))
+    UPDATED = timezone.make_aware(datetime.datetime(2024, 6, 1, 12, 0))
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department(code='D1', name="کامپیوتر", established_Date=jdatetime.date(1360, 1, 1))
+        department.faculty = department
+        department.save()
+        course = Course.objects.create(code='1000001', name="ریاضی", units=3, department=department)
+        for i, active in enumerate([True, False]):
+            Student.objects.create(
+                national_ID=f"{i:010d}", student_ID=f"{i:014d}", first_Name="علی", last_Name="رضایی",
+                father_Name="حسن", birth_Date=jdatetime.date(1380, 1, 1), enrollment_date=jdatetime.date(1400, 1, 1),
+                degree='bachelor', is_active=active, major="کامپیوتر", gpa=15, Department=department,
+            )
+            Enrollment.objects.create(student_id=f"{i:010d}", course=course, term='14011', grade=18)
+        Student.objects.update(created_at=cls.CREATED, updated_at=cls.UPDATED)
+        Enrollment.objects.update(created_at=cls.CREATED, updated_at=cls.UPDATED)
+
+    def assertTimestamps(self, queryset):
+        self.assertEqual(set(queryset.values_list('created_at', 'updated_at')), {(self.CREATED, self.UPDATED)})
+
+    def test_archive_and_restore_keep_timestamps(self):
+        self.assertEqual(archive_inactive_students(), 1)
+        self.assertTimestamps(ArchivedStudent.objects.all())
+        self.assertTimestamps(ArchivedEnrollment.objects.all())
+
+        self.assertEqual(restore_students(['00000000000001']), 1)
+        restored = Student.objects.get(pk='0000000001')
+        self.assertEqual(restored.created_at, self.CREATED)
+        self.assertGreater(restored.updated_at, self.UPDATED)
+        self.assertTimestamps(Enrollment.objects.all())
+        self.assertEqual(Enrollment.objects.count(), 2)
+
+    def test_restored_students_stay_restored(self):
+        archive_inactive_students()
+        restore_students(['00000000000001'])
+        self.assertTrue(Student.objects.get(pk='0000000001').is_active)
+        self.assertEqual(archive_inactive_students(), 0)
+        self.assertEqual(Student.objects.count(), 2)
+
+
+class ImmediateTransactionTests(TransactionTestCase):
+
+    def first_query(self, func):
+        with CaptureQueriesContext(connection) as queries:
+            func()
+        return queries.captured_queries[0]['sql']
+
+    def test_archive_and_restore_take_the_write_lock_first(self):
+        self.assertEqual(self.first_query(archive_inactive_students), 'BEGIN IMMEDIATE')
+        self.assertEqual(self.first_query(lambda: restore_students(['00000000000001'])), 'BEGIN IMMEDIATE')
+
+    def test_other_transactions_are_deferred(self):
+        def read():
+            with transaction.atomic():
+                Student.objects.count()
+
+        self.assertEqual(self.first_query(read), 'BEGIN')
+        archive_inactive_students()
+        self.assertEqual(self.first_query(read), 'BEGIN')
+
+
+class CachedModelBackendTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('staff', password='x', is_staff=True)
+        cls.permission = Permission.objects.get(codename='view_student')
+
+    def setUp(self):
+        cache.clear()
+        backends.lookups.clear()
+        self.backend = backends.CachedModelBackend()
+
+    def has_perm(self):
+        return self.backend.has_perm(self.backend.get_user(self.user.pk), 'account.view_student')
+
+    def test_user_is_cached(self):
+        self.backend.get_user(self.user.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.backend.get_user(self.user.pk), self.user)
+
+    def session_user(self):
+        request = HttpRequest()
+        request.session = self.client.session
+        return get_user(request)
+
+    def test_deactivation(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.session_user(), self.user)
+        self.user.is_active = False
+        self.user.save()
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+        self.assertTrue(self.session_user().is_anonymous)
+
+    def test_bulk_deactivation_needs_explicit_invalidate(self):
+        self.backend.get_user(self.user.pk)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertIsNotNone(self.backend.get_user(self.user.pk))
+        backends.invalidate()
+        self.assertIsNone(self.backend.get_user(self.user.pk))
+
+    def test_permission_revoke(self):
+        self.user.user_permissions.add(self.permission)
+        self.assertTrue(self.has_perm())
+        self.user.user_permissions.remove(self.permission)
+        self.assertFalse(self.has_perm())
+
+    def test_group_change(self):
+        group = Group.objects.create(name="آموزش")
+        group.permissions.add(self.permission)
+        self.assertFalse(self.has_perm())
+        self.user.groups.add(group)
+        self.assertTrue(self.has_perm())
+        group.permissions.remove(self.permission)
+        self.assertFalse(self.has_perm())
+        group.permissions.add(self.permission)
+        self.assertTrue(self.has_perm())
+        self.user.groups.remove(group)
+        self.assertFalse(self.has_perm())
+
+    def test_login_does_not_invalidate(self):
+        generation = backends.current_generation()
+        update_last_login(None, self.user)
+        self.assertEqual(backends.current_generation(), generation)
+        self.user.first_name = "علی"
+        self.user.save()
+        self.assertNotEqual(backends.current_generation(), generation)
+
+
+@override_settings(STAFF_ALERT_RECIPIENTS=['hr@example.com'], STAFF_ALERT_BATCH_SIZE=2,
+                   CONTRACT_EXPIRY_ALERT_DAYS=30, PAYROLL_CONTRACT_STATUSES=('Contract', 'Temporary'))
+class StaffAlertTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = Faculty.objects.create(code='F1', name="فنی", establishment_Date=jdatetime.date(1360, 1, 1))
+        cls.today = timezone.localdate()
+        for i in range(3):
+            cls.professor(i, cls.today + datetime.timedelta(days=10 + i))
+        cls.professor(3, cls.today + datetime.timedelta(days=60))
+
+    @classmethod
+    def professor(cls, i, contract_end):
+        return Professor.objects.create(
+            national_ID=f"{i:010d}", personnel_code=f"{i:010d}", first_Name="علی", last_Name="رضایی",
+            father_Name="حسن", birth_Date=jdatetime.date(1360, 1, 1), Faculty=cls.faculty, agreement_image='x.png',
+            contract_Date=jdatetime.date(1400, 1, 1), salary=1000, employment_status='Contract',
+            academic_rank='Professor', last_promotion_date=datetime.date(2000, 1, 1), contract_end_date=contract_end,
+        )
+
+    def test_batches_share_one_connection(self):
+        with mock.patch('account.jobs.get_connection', wraps=jobs.get_connection) as get_connection:
+            jobs.contract_expiry_alerts()
+        get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, ['hr@example.com'])
+        self.assertEqual(mail.outbox[0].body.count("\n") + mail.outbox[1].body.count("\n"), 1)
+
+    def test_only_new_milestones_are_sent(self):
+        jobs.contract_expiry_alerts()
+        mail.outbox.clear()
+        jobs.contract_expiry_alerts()
+        self.assertEqual(mail.outbox, [])
+
+        Professor.objects.filter(pk='0000000003').update(contract_end_date=self.today + datetime.timedelta(days=20))
+        jobs.contract_expiry_alerts()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('0000000003', mail.outbox[0].body)
+
+    def test_changed_date_is_sent_again(self):
+        jobs.contract_expiry_alerts()
+        mail.outbox.clear()
+        Professor.objects.filter(pk='0000000000').update(contract_end_date=self.today + datetime.timedelta(days=5))
+        jobs.contract_expiry_alerts()
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('0000000000', mail.outbox[0].body)
+
+    @override_settings(STAFF_ALERT_RECIPIENTS=[], ADMINS=[('Admin', 'admin@example.com')],
+                       EMAIL_SUBJECT_PREFIX='[Amoozeshyar] ')
+    def test_falls_back_to_admins(self):
+        with mock.patch('account.jobs.get_connection', wraps=jobs.get_connection) as get_connection:
+            jobs.contract_expiry_alerts()
+        get_connection.assert_called_once()
+        self.assertEqual([message.to for message in mail.outbox], [['admin@example.com']] * 2)
+        self.assertTrue(mail.outbox[0].subject.startswith('[Amoozeshyar] '))
+
+    @override_settings(STAFF_ALERT_RECIPIENTS=[], ADMINS=[])
+    def test_no_recipients_fails(self):
+        with self.assertRaises(ImproperlyConfigured):
+            jobs.contract_expiry_alerts()
+        self.assertEqual(mail.outbox, [])
+        # چیزی ثبت نشده است تا پس از تنظیم گیرندگان ارسال شود
+        with self.settings(STAFF_ALERT_RECIPIENTS=['hr@example.com']):
+            jobs.contract_expiry_alerts()
+        self.assertEqual(len(mail.outbox), 2)
+
+
+class ServeMediaTests(TestCase):
+    CONTENT = b"0123456789"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.faculty = Faculty.objects.create(code='F1', name="فنی", establishment_Date=jdatetime.date(1360, 1, 1))
+        cls.user = User.objects.create_user('user', password='x')
+        cls.hr = User.objects.create_user('hr', password='x')
+        cls.hr.user_permissions.add(Permission.objects.get(codename='view_professor'))
+        cls.registrar = User.objects.create_user('registrar', password='x')
+        cls.registrar.user_permissions.add(Permission.objects.get(codename='view_documentjob'))
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.public = default_storage.save('account/profiles/photo.png', ContentFile(self.CONTENT))
+        self.contract = default_storage.save('account/contracts/scan.png', ContentFile(b"contract"))
+        self.document = default_storage.save('documents/transcript.pdf', ContentFile(b"%PDF"))
+        Professor.objects.create(
+            national_ID='0000000001', personnel_code='0000000001', first_Name="علی", last_Name="رضایی",
+            father_Name="حسن", birth_Date=jdatetime.date(1360, 1, 1), Faculty=self.faculty,
+            agreement_image=self.contract, contract_Date=jdatetime.date(1400, 1, 1), salary=1000,
+            employment_status='Contract', academic_rank='Professor', last_promotion_date=datetime.date(2020, 1, 1),
+            contract_end_date=datetime.date(2030, 1, 1),
+        )
+        DocumentJob.objects.create(kind='transcript', student_ID='00000000000001', data_hash='x', payload={},
+                                   status='done', file=self.document)
+
+    def get(self, name, user=None, **headers):
+        if user is not None:
+            self.client.force_login(user)
+        response = self.client.get(f'/media/{name}', headers=headers)
+        if hasattr(response, 'streaming_content'):
+            response.body = b''.join(response.streaming_content)
+        return response
+
+    def test_anonymous_users_cannot_probe_paths(self):
+        self.assertEqual(self.get(self.public).status_code, 403)
+        self.assertEqual(self.get('account/profiles/missing.png').status_code, 403)
+
+    def test_permission_matrix(self):
+        cases = [
+            (self.user, {self.public: 200, self.contract: 403, self.document: 403}),
+            (self.hr, {self.public: 200, self.contract: 200, self.document: 403}),
+            (self.registrar, {self.public: 200, self.contract: 403, self.document: 200}),
+        ]
+        for user, expected in cases:
+            self.client.force_login(user)
+            for name, status in expected.items():
+                with self.subTest(user=user.username, name=name):
+                    self.assertEqual(self.get(name).status_code, status)
+        self.assertEqual(self.get('account/profiles/missing.png', self.user).status_code, 404)
+        self.assertEqual(self.get('../settings.py', self.user).status_code, 404)
+
+    def test_blobs_are_immutable(self):
+        response = self.get(self.public, self.user)
+        self.assertTrue(self.public.startswith('blobs/'))
+        self.assertEqual(response.body, self.CONTENT)
+        self.assertEqual(response['Cache-Control'], 'private, max-age=31536000, immutable')
+        self.assertEqual(response['ETag'], f'"{os.path.splitext(os.path.basename(self.public))[0]}"')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+
+    def test_not_modified(self):
+        etag = self.get(self.public, self.user)['ETag']
+        for header in (etag, f'"other", {etag}', f'W/{etag}', '*'):
+            with self.subTest(header=header):
+                response = self.get(self.public, If_None_Match=header)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response['ETag'], etag)
+        self.assertEqual(self.get(self.public, If_None_Match='"other"').status_code, 200)
+
+    def test_ranges(self):
+        self.client.force_login(self.user)
+        for header, body, content_range in [('bytes=0-3', b"0123", 'bytes 0-3/10'),
+                                            ('bytes=7-', b"789", 'bytes 7-9/10'),
+                                            ('bytes=-3', b"789", 'bytes 7-9/10'),
+                                            ('bytes=8-100', b"89", 'bytes 8-9/10')]:
+            with self.subTest(header=header):
+                response = self.get(self.public, Range=header)
+                self.assertEqual(response.status_code, 206)
+                self.assertEqual(response.body, body)
+                self.assertEqual(response['Content-Range'], content_range)
+                self.assertEqual(response['Content-Length'], str(len(body)))
+
+    def test_unsatisfiable_range(self):
+        self.client.force_login(self.user)
+        for header in ('bytes=10-', 'bytes=5-2', 'bytes=-0'):
+            with self.subTest(header=header):
+                response = self.get(self.public, Range=header)
+                self.assertEqual(response.status_code, 416)
+                self.assertEqual(response['Content-Range'], 'bytes */10')
+
+    def test_unsupported_range_returns_whole_file(self):
+        response = self.get(self.public, self.user, Range='bytes=0-1,4-5')
+        self.assertEqual((response.status_code, response.body), (200, self.CONTENT))
+
+    def test_if_range(self):
+        etag = self.get(self.public, self.user)['ETag']
+        response = self.get(self.public, Range='bytes=0-3', If_Range=etag)
+        self.assertEqual((response.status_code, response.body), (206, b"0123"))
+        response = self.get(self.public, Range='bytes=0-3', If_Range='"stale"')
+        self.assertEqual((response.status_code, response.body), (200, self.CONTENT))
@@ -0,0 +1,32 @@
+"""
+یکسان‌سازی متن فارسی پیش از ایندکس و جستجو
+"""
+import re
+
+CHARACTER_MAP = str.maketrans({
+    'ي': 'ی', 'ى': 'ی', 'ئ': 'ی',
+    'ك': 'ک',
+    'ة': 'ه', 'ۀ': 'ه',
+    'أ': 'ا', 'إ': 'ا', 'ٱ': 'ا', 'آ': 'ا',
+    'ؤ': 'و',
+    '\u200c': ' ',  # نیم‌فاصله
+    '\u200d': '', '\u200e': '', '\u200f': '',
+    'ـ': '',  # کشیده
+    **{chr(0x06F0 + digit): str(digit) for digit in range(10)},
+    **{chr(0x0660 + digit): str(digit) for digit in range(10)},
+})
+# اعراب و تنوین
+DIACRITICS = re.compile('[\u064b-\u065f\u0670]')
+WHITESPACE = re.compile(r'\s+')
+TOKEN = re.compile(r'\w+')
+
+
+def normalize(text):
+    if not text:
+        return ''
+    text = DIACRITICS.sub('', str(text).translate(CHARACTER_MAP))
+    return WHITESPACE.sub(' ', text).strip().lower()
+
+
+def tokenize(text):
+    return TOKEN.findall(normalize(text))
@@ -1,3 +1,160 @@
-from django.shortcuts import render
+import mimetypes
+import os
+import re
+from urllib.parse import quote
 
-# Create your views here.
+from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import PermissionDenied, SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_etags, quote_etag
+from django.views.decorators.http import require_safe
+
+from .storage import BLOB_DIR
+
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+BLOB_NAME = re.compile(rf'^{BLOB_DIR}/[0-9a-f]{{2}}/[0-9a-f]{{2}}/([0-9a-f]{{64}})\.\w+$')
+# فایل‌های blob بر اساس محتوا نام‌گذاری شده‌اند و هرگز تغییر نمی‌کنند
+IMMUTABLE_CACHE = "private, max-age=31536000, immutable"
+MUTABLE_CACHE = "private, no-cache"
+# (مدل، ستون فایل، مجوز لازم برای مشاهده)
+PROTECTED_MEDIA = [
+    ('account.Professor', 'agreement_image', 'account.view_professor'),
+    ('documents.DocumentJob', 'file', 'documents.view_documentjob'),
+]
+
+
+class RangeFile:
+    """
+    محدود کردن خواندن فایل به یک بازه بایتی برای پاسخ 206
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def check_media_permission(user, name):
+    """
+    اسکن قراردادها و مدارک صادر شده فقط برای کارکنان مجاز قابل مشاهده است؛ ورود کاربر در serveMedia بررسی می‌شود
+    """
+    for label, field, permission in PROTECTED_MEDIA:
+        if apps.get_model(label).objects.filter(**{field: name}).exists() and not user.has_perm(permission):
+            raise PermissionDenied
+
+
+def parse_range(header, size):
+    """
+    بازه (شروع، طول) یا None برای درخواست بدون Range؛ فقط یک بازه پشتیبانی می‌شود
+    """
+    match = RANGE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    start, end = match.groups()
+    if start == '':
+        length = min(int(end), size)
+        if length == 0:
+            raise ValueError(header)
+        return size - length, length
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start > end:
+        raise ValueError(header)
+    return start, end - start + 1
+
+
+def etag_matches(header, etag):
+    """
+    مقایسه ضعیف If-None-Match با ETag فایل؛ سرآیند می‌تواند فهرستی از ETagها (یا *) باشد
+    """
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or etag.removeprefix('W/') in {tag.removeprefix('W/') for tag in etags}
+
+
+def _accel_response(name, path):
+    backend = getattr(settings, 'MEDIA_ACCEL_BACKEND', None)
+    if backend == 'x-accel-redirect':
+        response = HttpResponse()
+        response['X-Accel-Redirect'] = quote(settings.MEDIA_ACCEL_PREFIX.rstrip('/') + '/' + name)
+    elif backend == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = path
+    else:
+        return None
+    # نوع محتوا و Range را وب سرور جلویی تعیین می‌کند
+    del response['Content-Type']
+    return response
+
+
+@require_safe
+def serveMedia(request, name):
+    # پیش از بررسی وجود فایل، تا کاربر وارد نشده نتواند مسیرهای موجود را از 403/404 تشخیص دهد
+    if not request.user.is_authenticated:
+        raise PermissionDenied
+    try:
+        path = default_storage.path(name)
+    except SuspiciousFileOperation:
+        raise Http404
+    if not os.path.isfile(path):
+        raise Http404
+    check_media_permission(request.user, name)
+
+    stat = os.stat(path)
+    blob = BLOB_NAME.match(name)
+    etag = quote_etag(blob.group(1) if blob else f"{int(stat.st_mtime)}-{stat.st_size}")
+    cache_control = IMMUTABLE_CACHE if blob else MUTABLE_CACHE
+
+    if etag_matches(request.headers.get('If-None-Match'), etag):
+        response = HttpResponseNotModified()
+        response['ETag'] = etag
+        response['Cache-Control'] = cache_control
+        return response
+
+    response = _accel_response(name, path)
+    if response is None:
+        response = _file_response(request, path, stat.st_size, etag)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(stat.st_mtime)
+    response['Cache-Control'] = cache_control
+    return response
+
+
+def _file_response(request, path, size, etag):
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    header = request.headers.get('Range')
+    if_range = request.headers.get('If-Range')
+    if header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range(header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f"bytes */{size}"
+            return response
+        if byte_range is not None:
+            start, length = byte_range
+            response = FileResponse(RangeFile(open(path, 'rb'), start, length), status=206,
+                                    content_type=content_type)
+            response['Content-Length'] = str(length)
+            response['Content-Range'] = f"bytes {start}-{start + length - 1}/{size}"
+            response['Accept-Ranges'] = 'bytes'
+            return response
+    # FileResponse از wsgi.file_wrapper (sendfile) استفاده می‌کند و محتوا از Python عبور نمی‌کند
+    response = FileResponse(open(path, 'rb'), content_type=content_type)
+    response['Accept-Ranges'] = 'bytes'
+    return response
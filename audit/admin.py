@@ -0,0 +1,63 @@
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import PermissionDenied
+from django.template.response import TemplateResponse
+from django.urls import path
+
+from .models import AuditLog
+
+
+@admin.register(AuditLog)
+class AuditLogAdmin(admin.ModelAdmin):
+    list_display = ['created_at', 'object_repr', 'action', 'field', 'old_value', 'new_value', 'user']
+    search_fields = ['object_id']
+    list_filter = ['action', 'content_type']
+    list_select_related = ['user', 'content_type']
+    date_hierarchy = 'created_at'
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+class AuditHistoryMixin:
+    """
+    افزودن صفحه تاریخچه تغییرات هر شی به پنل مدیریت مدل
+    """
+    change_form_template = 'audit/change_form.html'
+    audit_history_per_page = 100
+
+    def get_urls(self):
+        info = self.opts.app_label, self.opts.model_name
+        return [
+            path('<path:object_id>/audit/', self.admin_site.admin_view(self.audit_history_view),
+                 name='%s_%s_audit' % info),
+        ] + super().get_urls()
+
+    def audit_history_view(self, request, object_id):
+        obj = self.get_object(request, object_id)
+        if obj is None:
+            return self._get_obj_does_not_exist_redirect(request, self.opts, object_id)
+        if not self.has_view_or_change_permission(request, obj):
+            raise PermissionDenied
+        # از ایندکس audit_object_idx استفاده می‌کند
+        entries = (AuditLog.objects
+                   .filter(content_type=ContentType.objects.get_for_model(self.model), object_id=str(obj.pk))
+                   .select_related('user')
+                   .order_by('-created_at', '-id')[:self.audit_history_per_page])
+        context = {
+            **self.admin_site.each_context(request),
+            'title': f"تاریخچه تغییرات: {obj}",
+            'subtitle': None,
+            'object': obj,
+            'entries': entries,
+            'opts': self.opts,
+            'app_label': self.opts.app_label,
+        }
+        return TemplateResponse(request, 'audit/object_history.html', context)
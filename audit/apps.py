@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class AuditConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'audit'
+    verbose_name = "گزارش تغییرات"
+
+    def ready(self):
+        from . import signals
+        signals.connect_tracked_models()
@@ -0,0 +1,129 @@
+"""
+بافر درون حافظه‌ای برای ثبت دسته‌ای تغییرات
+
+رکوردها در حافظه جمع می‌شوند و یک نخ پس‌زمینه هر AUDIT_BATCH_SIZE رکورد یا هر
+AUDIT_FLUSH_INTERVAL_MS میلی‌ثانیه آن‌ها را با یک bulk_create در پایگاه داده می‌نویسد.
+با AUDIT_ASYNC=False (پیش‌فرض تست‌ها) رکوردها بدون بافر و همزمان نوشته می‌شوند.
+اگر نوشتن شکست بخورد، رکوردها به فایل AUDIT_FALLBACK_FILE اضافه می‌شوند تا بعدا با
+دستور replay_audit_fallback بازیابی شوند.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from Amoozeshyar.db import immediate_atomic
+
+logger = logging.getLogger(__name__)
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def write_fallback(entries):
+    """
+    اضافه کردن رکوردها به فایل پشتیبان به صورت JSON Lines
+    """
+    path = get_setting('AUDIT_FALLBACK_FILE', settings.BASE_DIR / 'audit_fallback.jsonl')
+    with open(path, 'a', encoding='utf-8') as fallback:
+        for entry in entries:
+            fallback.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        fallback.flush()
+        os.fsync(fallback.fileno())
+
+
+def save_entries(entries):
+    """
+    نوشتن رکوردها در جدول AuditLog با یک کوئری دسته‌ای
+    """
+    from .models import AuditLog
+
+    AuditLog.objects.bulk_create([AuditLog(**entry) for entry in entries],
+                                 batch_size=get_setting('AUDIT_BATCH_SIZE', 200))
+
+
+class AuditBuffer:
+    """
+    صف رکوردهای تغییرات همراه با نخ نویسنده پس‌زمینه
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    @property
+    def batch_size(self):
+        return get_setting('AUDIT_BATCH_SIZE', 200)
+
+    @property
+    def interval(self):
+        return get_setting('AUDIT_FLUSH_INTERVAL_MS', 2000) / 1000
+
+    def extend(self, entries):
+        if not entries:
+            return
+        if not get_setting('AUDIT_ASYNC', True):
+            self._write(list(entries))
+            return
+        self._ensure_thread()
+        with self._lock:
+            self._entries.extend(entries)
+            full = len(self._entries) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        نوشتن همه رکوردهای موجود در بافر؛ در پایان برنامه هم صدا زده می‌شود
+        """
+        with self._flush_lock:
+            with self._lock:
+                entries, self._entries = self._entries, []
+            if entries:
+                self._write(entries)
+
+    def _write(self, entries):
+        try:
+            with immediate_atomic():
+                save_entries(entries)
+        except Exception:
+            logger.exception("Writing %d audit entries failed, appending them to the fallback file", len(entries))
+            try:
+                write_fallback(entries)
+            except OSError:
+                logger.exception("Writing the audit fallback file failed, %d entries lost", len(entries))
+
+    def _ensure_thread(self):
+        # پس از fork در سرورهای چند پردازه‌ای نخ والد در فرزند وجود ندارد
+        if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="audit-flusher", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                # اتصال نخ پس‌زمینه مانند اتصال درخواست‌ها پس از CONN_MAX_AGE بسته می‌شود
+                close_old_connections()
+                self.flush()
+            except Exception:
+                logger.exception("Audit flusher iteration failed")
+
+
+audit_buffer = AuditBuffer()
+atexit.register(audit_buffer.flush)
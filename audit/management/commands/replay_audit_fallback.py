@@ -0,0 +1,40 @@
+import json
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from audit.buffer import save_entries
+
+
+class Command(BaseCommand):
+    help = "بازگرداندن رکوردهای فایل پشتیبان گزارش تغییرات به پایگاه داده"
+
+    def handle(self, *args, **options):
+        path = str(getattr(settings, 'AUDIT_FALLBACK_FILE', settings.BASE_DIR / 'audit_fallback.jsonl'))
+        replaying = f"{path}.replaying"
+        if not os.path.exists(path) and not os.path.exists(replaying):
+            self.stdout.write("No fallback file, nothing to replay.")
+            return
+        count = 0
+        # فایل اجرای ناموفق قبلی پیش از فایل اصلی بازگردانده می‌شود
+        if os.path.exists(replaying):
+            count += self.replay(replaying)
+        if os.path.exists(path):
+            # فایل جابجا می‌شود تا رکوردهای جدیدی که همزمان نوشته می‌شوند از دست نروند
+            os.replace(path, replaying)
+            count += self.replay(replaying)
+        self.stdout.write(self.style.SUCCESS(f"Replayed {count} audit entries."))
+
+    def replay(self, replaying):
+        with open(replaying, encoding='utf-8') as fallback:
+            entries = [json.loads(line) for line in fallback if line.strip()]
+        # همه دسته‌ها در یک تراکنش نوشته می‌شوند تا اجرای دوباره پس از خطا رکورد تکراری نسازد
+        try:
+            with transaction.atomic():
+                save_entries(entries)
+        except Exception as exc:
+            raise CommandError(f"Replaying {len(entries)} entries failed, {replaying} was kept: {exc}")
+        os.remove(replaying)
+        return len(entries)
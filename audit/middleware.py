@@ -0,0 +1,26 @@
+from contextvars import ContextVar
+
+current_user_id = ContextVar('audit_current_user_id', default=None)
+
+
+class AuditUserMiddleware:
+    """
+    نگهداری شناسه کاربر درخواست جاری برای ثبت در گزارش تغییرات
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        user = getattr(request, 'user', None)
+        # request.user تنبل است؛ فقط وقتی مقداری ذخیره شود که واقعا تغییری رخ دهد خوانده می‌شود
+        token = current_user_id.set(lambda: user.pk if user is not None and user.is_authenticated else None)
+        try:
+            return self.get_response(request)
+        finally:
+            current_user_id.reset(token)
+
+
+def get_current_user_id():
+    resolver = current_user_id.get()
+    return resolver() if resolver is not None else None
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(max_length=64, verbose_name='شناسه شی')),
+                ('object_repr', models.CharField(blank=True, max_length=200, verbose_name='شی')),
+                ('action', models.CharField(choices=[('create', 'ایجاد'), ('update', 'ویرایش'), ('delete', 'حذف')], max_length=10, verbose_name='عملیات')),
+                ('field', models.CharField(blank=True, max_length=64, verbose_name='فیلد')),
+                ('old_value', models.TextField(blank=True, null=True, verbose_name='مقدار قبلی')),
+                ('new_value', models.TextField(blank=True, null=True, verbose_name='مقدار جدید')),
+                ('created_at', models.DateTimeField(verbose_name='زمان تغییر')),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='contenttypes.contenttype', verbose_name='نوع شی')),
+                ('user', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='کاربر')),
+            ],
+            options={
+                'verbose_name': 'تغییر',
+                'verbose_name_plural': 'گزارش تغییرات',
+                'db_table': 'AuditLog',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['content_type', 'object_id', '-created_at'], name='audit_object_idx'), models.Index(fields=['-created_at'], name='audit_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class AuditLog(models.Model):
+    """
+    یک تغییر ثبت شده روی یکی از فیلدهای مدل‌های تحت نظارت
+    """
+
+    class Meta:
+        verbose_name = "تغییر"
+        verbose_name_plural = "گزارش تغییرات"
+        db_table = "AuditLog"
+        ordering = ['-created_at', '-id']
+        indexes = [
+            models.Index(fields=['content_type', 'object_id', '-created_at'], name='audit_object_idx'),
+            models.Index(fields=['-created_at'], name='audit_created_idx'),
+        ]
+
+    ACTION_CHOICES = {
+        'create': 'ایجاد',
+        'update': 'ویرایش',
+        'delete': 'حذف',
+    }
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.PROTECT, verbose_name="نوع شی")
+    object_id = models.CharField(max_length=64, verbose_name="شناسه شی")
+    object_repr = models.CharField(max_length=200, blank=True, verbose_name="شی")
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES, verbose_name="عملیات")
+    field = models.CharField(max_length=64, blank=True, verbose_name="فیلد")
+    old_value = models.TextField(null=True, blank=True, verbose_name="مقدار قبلی")
+    new_value = models.TextField(null=True, blank=True, verbose_name="مقدار جدید")
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL,
+                             db_constraint=False, verbose_name="کاربر")
+    created_at = models.DateTimeField(verbose_name="زمان تغییر")
+
+    def __str__(self):
+        return f"{self.object_repr} - {self.get_action_display()} {self.field}"
@@ -0,0 +1,101 @@
+"""
+ثبت تفاوت فیلدها با سیگنال‌های pre_save / post_save / post_delete
+"""
+from django.apps import apps
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.utils import timezone
+
+from .buffer import audit_buffer
+from .middleware import get_current_user_id
+
+# مدل‌های تحت نظارت و فیلدهای آن‌ها؛ None یعنی همه فیلدهای ساده مدل
+DEFAULT_TRACKED_MODELS = {
+    'account.Student': None,
+    'account.Course': None,
+    'account.Professor': None,
+}
+
+IGNORED_FIELDS = {'created_at', 'updated_at'}
+
+_tracked_fields = {}
+
+
+def get_tracked_models():
+    return getattr(settings, 'AUDIT_TRACKED_MODELS', DEFAULT_TRACKED_MODELS)
+
+
+def tracked_fields(model):
+    return _tracked_fields.get(model)
+
+
+def _stringify(value):
+    if value is None:
+        return None
+    return str(value)
+
+
+def _entry(instance, action, field='', old_value=None, new_value=None, user_id=None):
+    return {
+        'content_type_id': ContentType.objects.get_for_model(instance).pk,
+        'object_id': str(instance.pk),
+        'object_repr': str(instance)[:200],
+        'action': action,
+        'field': field,
+        'old_value': _stringify(old_value),
+        'new_value': _stringify(new_value),
+        'user_id': user_id,
+        'created_at': timezone.now().isoformat(),
+    }
+
+
+def _enqueue(entries, using):
+    # رکوردهای تراکنش‌های برگشت خورده نباید ثبت شوند
+    transaction.on_commit(lambda: audit_buffer.extend(entries), using=using)
+
+
+def capture_old_values(sender, instance, raw=False, using=None, **kwargs):
+    if raw:
+        return
+    fields = tracked_fields(sender)
+    instance._audit_old = None
+    if instance.pk is None or instance._state.adding:
+        return
+    instance._audit_old = sender._default_manager.using(using).filter(pk=instance.pk).values(*fields).first()
+
+
+def record_save(sender, instance, created, raw=False, using=None, **kwargs):
+    if raw:
+        return
+    user_id = get_current_user_id()
+    old = getattr(instance, '_audit_old', None)
+    instance._audit_old = None
+    if created or old is None:
+        _enqueue([_entry(instance, 'create', user_id=user_id)], using)
+        return
+    entries = []
+    for attname in tracked_fields(sender):
+        new_value = getattr(instance, attname)
+        if old[attname] != new_value:
+            entries.append(_entry(instance, 'update', attname, old[attname], new_value, user_id))
+    if entries:
+        _enqueue(entries, using)
+
+
+def record_delete(sender, instance, using=None, **kwargs):
+    _enqueue([_entry(instance, 'delete', user_id=get_current_user_id())], using)
+
+
+def connect_tracked_models():
+    for label, fields in get_tracked_models().items():
+        model = apps.get_model(label)
+        if fields is None:
+            fields = [field.attname for field in model._meta.concrete_fields
+                      if field.name not in IGNORED_FIELDS]
+        _tracked_fields[model] = list(fields)
+        uid = f"audit:{label}"
+        pre_save.connect(capture_old_values, sender=model, dispatch_uid=uid)
+        post_save.connect(record_save, sender=model, dispatch_uid=uid)
+        post_delete.connect(record_delete, sender=model, dispatch_uid=uid)
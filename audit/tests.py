@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+import jdatetime
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from account.models import Course, Department
+
+from .buffer import AuditBuffer
+from .models import AuditLog
+
+
+def entry(object_id='1'):
+    return {
+        'content_type_id': ContentType.objects.get_for_model(AuditLog).pk,
+        'object_id': object_id,
+        'object_repr': object_id,
+        'action': 'create',
+        'field': '',
+        'old_value': None,
+        'new_value': None,
+        'user_id': None,
+        'created_at': timezone.now().isoformat(),
+    }
+
+
+class FallbackFileMixin:
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'audit_fallback.jsonl')
+        settings_override = override_settings(AUDIT_FALLBACK_FILE=self.path)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def write_file(self, path, entries):
+        with open(path, 'w', encoding='utf-8') as fallback:
+            for item in entries:
+                fallback.write(json.dumps(item) + "\n")
+
+    def read_file(self, path):
+        with open(path, encoding='utf-8') as fallback:
+            return [json.loads(line) for line in fallback]
+
+
+class AuditBufferTests(FallbackFileMixin, TestCase):
+
+    def test_changes_are_written_synchronously_in_tests(self):
+        department = Department(code='D1', name="کامپیوتر", established_Date=jdatetime.date(1360, 1, 1))
+        department.faculty = department
+        department.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            course = Course.objects.create(code='1000001', name="ریاضی", units=3, department=department)
+        self.assertEqual(list(AuditLog.objects.values_list('object_id', 'action')), [(course.pk, 'create')])
+
+    @override_settings(AUDIT_ASYNC=True)
+    def test_buffered_entries_are_written_on_flush(self):
+        buffer = AuditBuffer()
+        with mock.patch.object(buffer, '_ensure_thread'):
+            buffer.extend([entry('1'), entry('2')])
+        self.assertEqual(AuditLog.objects.count(), 0)
+        buffer.flush()
+        self.assertEqual(sorted(AuditLog.objects.values_list('object_id', flat=True)), ['1', '2'])
+        buffer.flush()
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    @override_settings(AUDIT_ASYNC=True, AUDIT_BATCH_SIZE=2)
+    def test_full_batch_wakes_the_flusher(self):
+        buffer = AuditBuffer()
+        with mock.patch.object(buffer, '_ensure_thread'):
+            buffer.extend([entry('1')])
+            self.assertFalse(buffer._wakeup.is_set())
+            buffer.extend([entry('2')])
+        self.assertTrue(buffer._wakeup.is_set())
+
+    def test_failed_write_goes_to_fallback_file(self):
+        entries = [entry('1'), entry('2')]
+        with mock.patch('audit.buffer.save_entries', side_effect=DatabaseError), \
+                self.assertLogs('audit.buffer', 'ERROR'):
+            AuditBuffer().extend(entries)
+        self.assertEqual(self.read_file(self.path), entries)
+        self.assertEqual(AuditLog.objects.count(), 0)
+
+
+class AuditFlushTransactionTests(TransactionTestCase):
+
+    def test_flush_takes_the_write_lock_first(self):
+        entries = [entry('1'), entry('2')]
+        with CaptureQueriesContext(connection) as queries:
+            AuditBuffer().extend(entries)
+        self.assertEqual(queries.captured_queries[0]['sql'], 'BEGIN IMMEDIATE')
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+
+class ReplayAuditFallbackTests(FallbackFileMixin, TestCase):
+
+    def replay(self):
+        out = StringIO()
+        call_command('replay_audit_fallback', stdout=out)
+        return out.getvalue()
+
+    def test_nothing_to_replay(self):
+        self.assertIn("nothing to replay", self.replay())
+
+    def test_replays_and_removes_file(self):
+        self.write_file(self.path, [entry('1'), entry('2')])
+        self.assertIn("Replayed 2", self.replay())
+        self.assertEqual(AuditLog.objects.count(), 2)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_leftover_file_of_failed_run_is_retried(self):
+        self.write_file(f"{self.path}.replaying", [entry('1')])
+        self.assertIn("Replayed 1", self.replay())
+        self.assertFalse(os.path.exists(f"{self.path}.replaying"))
+
+    def test_leftover_file_is_replayed_before_new_entries(self):
+        self.write_file(f"{self.path}.replaying", [entry('1')])
+        self.write_file(self.path, [entry('2'), entry('3')])
+        self.assertIn("Replayed 3", self.replay())
+        self.assertEqual(AuditLog.objects.count(), 3)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertFalse(os.path.exists(f"{self.path}.replaying"))
+
+    def test_failed_replay_keeps_entries_without_partial_rows(self):
+        self.write_file(self.path, [entry('1'), dict(entry('2'), content_type_id=None)])
+        with self.assertRaises(CommandError):
+            self.replay()
+        self.assertEqual(AuditLog.objects.count(), 0)
+        self.assertEqual(len(self.read_file(f"{self.path}.replaying")), 2)
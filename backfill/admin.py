@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import BackfillCheckpoint
+
+
+@admin.register(BackfillCheckpoint)
+class BackfillCheckpointAdmin(admin.ModelAdmin):
+    list_display = ['name', 'rows_done', 'total', 'updated_at', 'completed_at']
+    readonly_fields = ['name', 'last_pk', 'rows_done', 'total', 'started_at', 'updated_at', 'completed_at']
+
+    list_filter = ()
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
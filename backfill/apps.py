@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class BackfillConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'backfill'
+    verbose_name = "به‌روزرسانی دسته‌ای داده‌ها"
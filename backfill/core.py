@@ -0,0 +1,91 @@
+"""
+اجرای backfill روی جداول بزرگ به صورت دسته‌های کوچک و قابل ادامه
+
+ردیف‌ها به ترتیب کلید اصلی در دسته‌هایی پردازش می‌شوند که هر کدام یک تراکنش کوتاه است و
+آخرین کلید در همان تراکنش ذخیره می‌شود؛ بنابراین قفل نوشتن فقط برای یک دسته گرفته می‌شود و
+اجرای قطع شده از همان نقطه ادامه پیدا می‌کند. اندازه دسته طوری تنظیم می‌شود که هر تراکنش
+حدود BACKFILL_CHUNK_TARGET_MS طول بکشد و بین دسته‌ها BACKFILL_PAUSE_MS مکث می‌شود تا
+درخواست‌های دیگر هم بتوانند بنویسند.
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger('backfill')
+
+MIN_BATCH_SIZE = 10
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def log_progress(status):
+    logger.info("%(name)s: %(done)s/%(total)s rows, batch %(batch_size)s, %(rate).0f rows/s", status)
+
+
+def run_backfill(name, queryset, apply, checkpoint_model=None, batch_size=None, pause=None, limit=None,
+                 progress=log_progress):
+    """
+    اجرای apply روی ردیف‌های queryset؛ apply یک queryset محدود به یک دسته می‌گیرد.
+    اگر backfill قبلا تمام شده باشد کاری انجام نمی‌شود. تعداد ردیف‌های پردازش شده در این اجرا
+    برگردانده می‌شود.
+    """
+    if checkpoint_model is None:
+        from .models import BackfillCheckpoint as checkpoint_model
+    using = queryset.db
+    pk = queryset.model._meta.pk
+    queryset = queryset.order_by()
+    batch_size = batch_size or get_setting('BACKFILL_BATCH_SIZE', 1000)
+    max_batch_size = batch_size * 8
+    target = get_setting('BACKFILL_CHUNK_TARGET_MS', 200) / 1000
+    pause = get_setting('BACKFILL_PAUSE_MS', 50) / 1000 if pause is None else pause
+
+    checkpoint, _ = checkpoint_model._default_manager.using(using).get_or_create(name=name)
+    if checkpoint.completed_at is not None:
+        return 0
+    if checkpoint.total is None:
+        checkpoint.total = checkpoint.rows_done + queryset.count()
+        checkpoint.save(update_fields=['total', 'updated_at'])
+    last = None if checkpoint.last_pk is None else pk.to_python(checkpoint.last_pk)
+
+    started = time.monotonic()
+    processed = 0
+    while limit is None or processed < limit:
+        size = batch_size if limit is None else min(batch_size, limit - processed)
+        pending = queryset if last is None else queryset.filter(pk__gt=last)
+        keys = list(pending.order_by('pk').values_list('pk', flat=True)[:size])
+        if not keys:
+            checkpoint.completed_at = timezone.now()
+            checkpoint.save(update_fields=['completed_at', 'updated_at'])
+            break
+
+        chunk_started = time.monotonic()
+        with transaction.atomic(using=using):
+            apply(pending.filter(pk__lte=keys[-1]))
+            checkpoint.last_pk = str(keys[-1])
+            checkpoint.rows_done += len(keys)
+            checkpoint.save(update_fields=['last_pk', 'rows_done', 'updated_at'])
+        chunk_time = time.monotonic() - chunk_started
+        last = keys[-1]
+        processed += len(keys)
+
+        if progress is not None:
+            progress({'name': name, 'done': checkpoint.rows_done, 'total': checkpoint.total,
+                      'batch_size': batch_size, 'rate': processed / max(time.monotonic() - started, 1e-6)})
+        if chunk_time > target * 2:
+            batch_size = max(MIN_BATCH_SIZE, batch_size // 2)
+        elif chunk_time < target / 2:
+            batch_size = min(max_batch_size, batch_size * 2)
+        if pause:
+            time.sleep(pause)
+    return processed
+
+
+def reset_backfill(name, checkpoint_model=None, using='default'):
+    if checkpoint_model is None:
+        from .models import BackfillCheckpoint as checkpoint_model
+    checkpoint_model._default_manager.using(using).filter(name=name).delete()
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from backfill.models import BackfillCheckpoint
+from backfill.registry import autodiscover
+
+
+class Command(BaseCommand):
+    help = "اجرای backfill‌های ثبت شده به صورت دسته‌ای؛ اجرای قطع شده از آخرین دسته ادامه پیدا می‌کند"
+
+    def add_arguments(self, parser):
+        parser.add_argument('names', nargs='*', metavar='NAME', help="پیش‌فرض: همه backfill‌های ناتمام")
+        parser.add_argument('--list', action='store_true', help="نمایش backfill‌ها و پیشرفت آن‌ها")
+        parser.add_argument('--reset', action='store_true', help="شروع دوباره از ابتدا")
+        parser.add_argument('--batch-size', type=int, help="اندازه اولیه هر دسته")
+        parser.add_argument('--pause', type=float, help="مکث بین دسته‌ها (ثانیه)")
+        parser.add_argument('--limit', type=int, help="حداکثر تعداد ردیف در این اجرا")
+
+    def handle(self, *args, **options):
+        backfills = autodiscover()
+        names = options['names'] or sorted(backfills)
+        unknown = [name for name in names if name not in backfills]
+        if unknown:
+            raise CommandError(f"Unknown backfill {', '.join(unknown)}")
+
+        if options['list']:
+            checkpoints = BackfillCheckpoint.objects.in_bulk(names)
+            for name in names:
+                checkpoint = checkpoints.get(name)
+                if checkpoint is None:
+                    state = "not started"
+                elif checkpoint.completed_at:
+                    state = f"done ({checkpoint.rows_done} rows)"
+                else:
+                    state = f"{checkpoint.rows_done}/{checkpoint.total} rows"
+                self.stdout.write(f"{name}: {state}")
+            return
+
+        def progress(status):
+            self.stdout.write(f"  {status['done']}/{status['total']} rows ({status['rate']:.0f} rows/s)")
+
+        for name in names:
+            backfill = backfills[name]
+            if options['reset']:
+                backfill.reset()
+            self.stdout.write(f"{name}:")
+            processed = backfill.run(batch_size=options['batch_size'] or backfill.batch_size, pause=options['pause'],
+                                     limit=options['limit'], progress=progress)
+            self.stdout.write(self.style.SUCCESS(f"{name}: {processed} rows processed."))
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BackfillCheckpoint',
+            fields=[
+                ('name', models.CharField(max_length=150, primary_key=True, serialize=False, verbose_name='نام')),
+                ('last_pk', models.CharField(blank=True, max_length=100, null=True, verbose_name='آخرین کلید پردازش شده')),
+                ('rows_done', models.PositiveBigIntegerField(default=0, verbose_name='تعداد ردیف\u200cهای پردازش شده')),
+                ('total', models.PositiveBigIntegerField(blank=True, null=True, verbose_name='تعداد کل (تخمینی)')),
+                ('started_at', models.DateTimeField(auto_now_add=True, verbose_name='زمان شروع')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='آخرین پیشرفت')),
+                ('completed_at', models.DateTimeField(blank=True, null=True, verbose_name='زمان پایان')),
+            ],
+            options={
+                'verbose_name': 'پیشرفت به\u200cروزرسانی',
+                'verbose_name_plural': 'پیشرفت به\u200cروزرسانی\u200cها',
+                'db_table': 'BackfillCheckpoint',
+            },
+        ),
+    ]
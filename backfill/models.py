@@ -0,0 +1,23 @@
+from django.db import models
+
+
+class BackfillCheckpoint(models.Model):
+    """
+    پیشرفت ذخیره شده هر backfill؛ اجرای دوباره از آخرین کلید اصلی پردازش شده ادامه پیدا می‌کند
+    """
+
+    class Meta:
+        verbose_name = "پیشرفت به‌روزرسانی"
+        verbose_name_plural = "پیشرفت به‌روزرسانی‌ها"
+        db_table = "BackfillCheckpoint"
+
+    name = models.CharField(max_length=150, primary_key=True, verbose_name="نام")
+    last_pk = models.CharField(max_length=100, null=True, blank=True, verbose_name="آخرین کلید پردازش شده")
+    rows_done = models.PositiveBigIntegerField(default=0, verbose_name="تعداد ردیف‌های پردازش شده")
+    total = models.PositiveBigIntegerField(null=True, blank=True, verbose_name="تعداد کل (تخمینی)")
+    started_at = models.DateTimeField(auto_now_add=True, verbose_name="زمان شروع")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="آخرین پیشرفت")
+    completed_at = models.DateTimeField(null=True, blank=True, verbose_name="زمان پایان")
+
+    def __str__(self):
+        return self.name
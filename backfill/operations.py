@@ -0,0 +1,124 @@
+"""
+عملیات مهاجرت برای تغییر ساختار جداول بزرگ بدون توقف سرویس
+
+افزودن ستون جدید به جدول بزرگ در سه مرحله انجام می‌شود: ستون nullable اضافه می‌شود (روی
+اکثر پایگاه داده‌ها فقط تغییر metadata است)، مقدار آن با RunBackfill به صورت دسته‌ای پر
+می‌شود و در صورت نیاز در مهاجرت بعدی NOT NULL می‌شود. ایندکس‌ها با AddIndexOnline ساخته
+می‌شوند. هر دو عملیات در یک مهاجرت جدا و غیر اتمی (atomic = False) اجرا می‌شوند تا اگر
+مهاجرت قطع شد، اجرای دوباره آن فقط همین عملیات قابل تکرار را دوباره اجرا کند:
+
+    class Migration(migrations.Migration):
+        atomic = False
+        dependencies = [('account', '0010_course_slug'), ('backfill', '0001_initial')]
+        operations = [
+            RunBackfill('course', 'course_slug', update={'slug': F('code')}, filter={'slug__isnull': True}),
+            AddIndexOnline('course', models.Index(fields=['slug'], name='course_slug_idx')),
+        ]
+"""
+import re
+
+from django.db import migrations
+
+from .core import reset_backfill, run_backfill
+
+INDEX_STATEMENT = re.compile(r'^CREATE (UNIQUE )?INDEX ')
+
+
+def _require_autocommit(schema_editor, operation):
+    if schema_editor.connection.in_atomic_block:
+        raise ValueError(f"{operation} must run in a migration with atomic = False")
+
+
+class RunBackfill(migrations.operations.base.Operation):
+    """
+    پر کردن ستون‌ها به صورت دسته‌ای؛ update دیکشنری فیلد -> مقدار یا عبارت (مثل F) است و
+    code تابعی است که queryset یک دسته را می‌گیرد. پیشرفت با نام app_label.name ذخیره می‌شود
+    و اجرای دوباره مهاجرت پس از قطع شدن از همان نقطه ادامه می‌دهد.
+    """
+
+    reduces_to_sql = False
+    reversible = True
+    atomic = False
+
+    def __init__(self, model_name, name, update=None, code=None, filter=None, batch_size=None, pause=None):
+        if (update is None) == (code is None):
+            raise ValueError("RunBackfill needs exactly one of update or code")
+        self.model_name = model_name
+        self.name = name
+        self.update = update
+        self.code = code
+        self.filter = filter or {}
+        self.batch_size = batch_size
+        self.pause = pause
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        _require_autocommit(schema_editor, self.describe())
+        try:
+            checkpoint_model = to_state.apps.get_model('backfill', 'BackfillCheckpoint')
+        except LookupError:
+            raise ValueError(f"{self.describe()} needs a dependency on ('backfill', '0001_initial')")
+        queryset = model._base_manager.using(schema_editor.connection.alias).filter(**self.filter)
+        apply = self.code or (lambda chunk: chunk.update(**self.update))
+        run_backfill(f"{app_label}.{self.name}", queryset, apply, checkpoint_model,
+                     batch_size=self.batch_size, pause=self.pause)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        # ستون‌ها با عملیات قبلی مهاجرت حذف می‌شوند؛ فقط پیشرفت پاک می‌شود تا اجرای بعدی از ابتدا باشد
+        try:
+            checkpoint_model = from_state.apps.get_model('backfill', 'BackfillCheckpoint')
+        except LookupError:
+            return
+        reset_backfill(f"{app_label}.{self.name}", checkpoint_model, schema_editor.connection.alias)
+
+    def describe(self):
+        return f"Backfill {self.name} on {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"backfill_{self.name}"
+
+
+class AddIndexOnline(migrations.AddIndex):
+    """
+    ساخت ایندکس با کمترین قفل نوشتن: روی PostgreSQL با CREATE INDEX CONCURRENTLY و روی
+    MySQL با ALGORITHM=INPLACE, LOCK=NONE. SQLite ایندکس را در یک دستور می‌سازد و فقط در
+    همان مدت نوشتن را متوقف می‌کند (در حالت WAL خواندن‌ها ادامه دارند)؛ ساخت با IF NOT EXISTS
+    است تا اجرای دوباره مهاجرت قطع شده خطا ندهد.
+    """
+
+    atomic = False
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        vendor = schema_editor.connection.vendor
+        if vendor == 'postgresql':
+            _require_autocommit(schema_editor, self.describe())
+            schema_editor.add_index(model, self.index, concurrently=True)
+            return
+        sql = str(self.index.create_sql(model, schema_editor))
+        if vendor == 'sqlite':
+            sql = INDEX_STATEMENT.sub(r'CREATE \1INDEX IF NOT EXISTS ', sql)
+        elif vendor == 'mysql':
+            sql += " ALGORITHM=INPLACE LOCK=NONE"
+        schema_editor.execute(sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        if schema_editor.connection.vendor == 'postgresql':
+            _require_autocommit(schema_editor, self.describe())
+            schema_editor.remove_index(model, self.index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, self.index)
+
+    def describe(self):
+        return super().describe() + " (online)"
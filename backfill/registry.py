@@ -0,0 +1,50 @@
+"""
+ثبت backfill‌ها؛ هر اپ می‌تواند در ماژول backfills.py خود backfill تعریف کند
+
+    from backfill.registry import register_backfill
+
+    @register_backfill('course_slug', Course, filter={'slug': ''})
+    def course_slug(chunk):
+        ...
+
+و با دستور backfill اجرا کند.
+"""
+from django.utils.module_loading import autodiscover_modules
+
+from .core import reset_backfill, run_backfill
+
+backfills = {}
+
+
+class Backfill:
+    def __init__(self, name, model, func, filter, batch_size):
+        self.name = name
+        self.model = model
+        self.func = func
+        self.filter = filter or {}
+        self.batch_size = batch_size
+
+    def queryset(self):
+        return self.model._base_manager.filter(**self.filter)
+
+    def run(self, **kwargs):
+        kwargs.setdefault('batch_size', self.batch_size)
+        return run_backfill(self.name, self.queryset(), self.func, **kwargs)
+
+    def reset(self):
+        reset_backfill(self.name)
+
+
+def register_backfill(name, model, filter=None, batch_size=None):
+    """
+    filter ردیف‌هایی را که هنوز باید پردازش شوند محدود می‌کند
+    """
+    def decorator(func):
+        backfills[name] = Backfill(name, model, func, filter, batch_size)
+        return func
+    return decorator
+
+
+def autodiscover():
+    autodiscover_modules('backfills')
+    return backfills
@@ -0,0 +1,133 @@
+from django.apps import apps
+from django.contrib.auth.models import Group
+from django.db import connection, models
+from django.db.migrations.state import ProjectState
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from .core import reset_backfill, run_backfill
+from .models import BackfillCheckpoint
+from .operations import AddIndexOnline, RunBackfill
+
+
+class RunBackfillTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.bulk_create([Group(name=f"group {i}") for i in range(25)])
+        cls.keys = list(Group.objects.order_by('pk').values_list('pk', flat=True))
+
+    def setUp(self):
+        self.seen = []
+
+    def apply(self, chunk):
+        self.seen.extend(chunk.order_by('pk').values_list('pk', flat=True))
+
+    def run_backfill(self, **kwargs):
+        kwargs.setdefault('batch_size', 10)
+        kwargs.setdefault('pause', 0)
+        kwargs.setdefault('progress', None)
+        return run_backfill('groups', Group.objects.all(), self.apply, **kwargs)
+
+    def checkpoint(self):
+        return BackfillCheckpoint.objects.get(name='groups')
+
+    def test_processes_every_row_once(self):
+        self.assertEqual(self.run_backfill(), 25)
+        self.assertEqual(self.seen, self.keys)
+        checkpoint = self.checkpoint()
+        self.assertEqual((checkpoint.rows_done, checkpoint.total), (25, 25))
+        self.assertEqual(checkpoint.last_pk, str(self.keys[-1]))
+        self.assertIsNotNone(checkpoint.completed_at)
+
+    def test_resume_after_limit(self):
+        self.assertEqual(self.run_backfill(limit=12), 12)
+        checkpoint = self.checkpoint()
+        self.assertEqual(checkpoint.last_pk, str(self.keys[11]))
+        self.assertIsNone(checkpoint.completed_at)
+
+        self.assertEqual(self.run_backfill(), 13)
+        self.assertEqual(self.seen, self.keys)
+        checkpoint = self.checkpoint()
+        self.assertEqual((checkpoint.rows_done, checkpoint.total), (25, 25))
+        self.assertIsNotNone(checkpoint.completed_at)
+
+    def test_completed_backfill_is_a_no_op(self):
+        self.run_backfill()
+        self.seen.clear()
+        Group.objects.create(name="new")
+        with self.assertNumQueries(1):
+            self.assertEqual(self.run_backfill(), 0)
+        self.assertEqual(self.seen, [])
+
+    def test_reset(self):
+        self.run_backfill()
+        self.seen.clear()
+        reset_backfill('groups')
+        self.assertFalse(BackfillCheckpoint.objects.exists())
+        self.assertEqual(self.run_backfill(), 25)
+        self.assertEqual(self.seen, self.keys)
+
+    def test_rolled_back_chunk_is_retried(self):
+        def fail_on_second_chunk(chunk):
+            if self.seen:
+                raise RuntimeError
+            self.apply(chunk)
+
+        with self.assertRaises(RuntimeError):
+            run_backfill('groups', Group.objects.all(), fail_on_second_chunk, batch_size=10, pause=0, progress=None)
+        self.assertEqual(self.checkpoint().rows_done, 10)
+        self.assertEqual(self.run_backfill(), 15)
+        self.assertEqual(self.seen, self.keys)
+
+    def sizes(self, batch_size):
+        statuses = []
+        self.run_backfill(batch_size=batch_size, progress=statuses.append)
+        return [status['batch_size'] for status in statuses]
+
+    @override_settings(BACKFILL_CHUNK_TARGET_MS=60000)
+    def test_fast_chunks_grow_the_batch(self):
+        self.assertEqual(self.sizes(2), [2, 4, 8, 16])
+
+    @override_settings(BACKFILL_CHUNK_TARGET_MS=0)
+    def test_slow_chunks_shrink_the_batch(self):
+        self.assertEqual(self.sizes(20), [20, 10])
+        BackfillCheckpoint.objects.all().delete()
+        self.assertEqual(self.sizes(40), [40])
+
+
+class OperationTests(TransactionTestCase):
+    app_label = 'auth'
+
+    def forwards(self, operation, collect_sql=False):
+        state = ProjectState.from_apps(apps)
+        with connection.schema_editor(collect_sql=collect_sql) as editor:
+            operation.database_forwards(self.app_label, editor, state, state)
+        return editor.collected_sql if collect_sql else None
+
+    def index_names(self):
+        with connection.cursor() as cursor:
+            return set(connection.introspection.get_constraints(cursor, Group._meta.db_table))
+
+    def test_sqlite_index_sql(self):
+        operation = AddIndexOnline('group', models.Index(fields=['name'], name='group_name_online_idx'))
+        [sql] = self.forwards(operation, collect_sql=True)
+        self.assertTrue(sql.startswith('CREATE INDEX IF NOT EXISTS "group_name_online_idx"'), sql)
+        operation = AddIndexOnline('group', models.Index(models.Func('name', function='LOWER'),
+                                                         name='group_lower_name_idx'))
+        [sql] = self.forwards(operation, collect_sql=True)
+        self.assertTrue(sql.startswith('CREATE INDEX IF NOT EXISTS "group_lower_name_idx"'), sql)
+
+    def test_interrupted_index_migration_can_run_again(self):
+        operation = AddIndexOnline('group', models.Index(fields=['name'], name='group_name_online_idx'))
+        self.forwards(operation)
+        self.forwards(operation)
+        self.assertIn('group_name_online_idx', self.index_names())
+        state = ProjectState.from_apps(apps)
+        with connection.schema_editor() as editor:
+            operation.database_backwards(self.app_label, editor, state, state)
+        self.assertNotIn('group_name_online_idx', self.index_names())
+
+    def test_run_backfill_requires_non_atomic_migration(self):
+        operation = RunBackfill('group', 'names', update={'name': models.F('name')})
+        with self.assertRaisesMessage(ValueError, "atomic = False"):
+            self.forwards(operation)
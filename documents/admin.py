@@ -0,0 +1,60 @@
+from django.contrib import admin, messages
+from django.urls import reverse
+from django.utils.html import format_html
+
+from .models import DocumentJob
+from .service import request_document
+
+
+class DocumentRequestMixin:
+    """
+    عملیات درخواست گروهی کارنامه و گواهی برای فهرست دانشجویان؛ نام عملیات باید در actions بیاید
+    """
+
+    def _request_documents(self, request, queryset, kind):
+        queued = errors = 0
+        for student_ID in queryset.values_list('student_ID', flat=True):
+            try:
+                request_document(kind, student_ID, request.user)
+            except ValueError:
+                errors += 1
+            else:
+                queued += 1
+        self.message_user(request, f"{queued} درخواست {DocumentJob.KIND_CHOICES[kind]} ثبت شد.")
+        if errors:
+            self.message_user(request, f"برای {errors} دانشجو امکان صدور وجود ندارد.", messages.WARNING)
+
+    def has_request_document_permission(self, request):
+        # مانند views.requestDocument؛ دیدن دانشجو برای صدور مدرک او کافی نیست
+        return request.user.has_perms(['documents.add_documentjob', 'documents.view_documentjob'])
+
+    @admin.action(description="صدور کارنامه تحصیلی", permissions=['request_document'])
+    def request_transcripts(self, request, queryset):
+        self._request_documents(request, queryset, 'transcript')
+
+    @admin.action(description="صدور گواهی اشتغال به تحصیل", permissions=['request_document'])
+    def request_certificates(self, request, queryset):
+        self._request_documents(request, queryset, 'certificate')
+
+
+@admin.register(DocumentJob)
+class DocumentJobAdmin(admin.ModelAdmin):
+    list_display = ['student_ID', 'kind', 'status', 'created_at', 'finished_at', 'download']
+    search_fields = ['student_ID']
+    list_filter = ['kind', 'status']
+    readonly_fields = ['kind', 'student_ID', 'data_hash', 'status', 'file', 'error', 'attempts', 'locked_by',
+                       'requested_by', 'created_at', 'started_at', 'finished_at']
+    exclude = ['payload']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.display(description="فایل")
+    def download(self, obj):
+        if obj.status != 'done':
+            return ''
+        return format_html('<a href="{}">دریافت</a>', reverse('document-download', args=[obj.pk]))
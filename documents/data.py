@@ -0,0 +1,100 @@
+"""
+جمع‌آوری داده‌های دانشجو برای ساخت مدرک و محاسبه نسخه آن‌ها
+"""
+import hashlib
+import json
+from collections import defaultdict
+from decimal import ROUND_HALF_UP, Decimal
+
+import jdatetime
+from django.conf import settings
+
+# با تغییر ظاهر فایل‌ها در render.py این عدد افزایش پیدا می‌کند تا فایل‌های قبلی cache استفاده نشوند.
+# render.py (و fpdf) فقط در کارگر ساخت PDF بارگذاری می‌شود، نه در پردازه‌های وب
+RENDERER_VERSION = 1
+
+
+def _jalali(value):
+    return value.strftime('%Y/%m/%d') if value else ''
+
+
+def _gpa(rows):
+    graded = [(units, grade) for units, grade in rows if grade is not None]
+    total_units = sum(units for units, _ in graded)
+    if not total_units:
+        return None
+    average = sum(Decimal(units) * grade for units, grade in graded) / total_units
+    return str(average.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
+
+
+def student_payload(student):
+    return {
+        'first_name': student.first_Name,
+        'last_name': student.last_Name,
+        'father_name': student.father_Name,
+        'student_ID': student.student_ID,
+        'national_ID': student.national_ID,
+        'degree': student.get_degree_display(),
+        'major': student.major,
+        'minor': student.minor,
+        'department': student.Department.name,
+        'enrollment_date': _jalali(student.enrollment_date),
+    }
+
+
+def transcript_payload(student):
+    rows = (student.enrollments.order_by('term', 'course_id')
+            .values_list('term', 'course_id', 'course__name', 'course__units', 'grade'))
+    terms = defaultdict(list)
+    for term, code, name, units, grade in rows:
+        terms[term].append({'code': code, 'name': name, 'units': units, 'grade': grade})
+
+    passing = Decimal(getattr(settings, 'PASSING_GRADE', 10))
+    all_rows = []
+    result = []
+    for term, courses in terms.items():
+        term_rows = [(course['units'], course['grade']) for course in courses]
+        all_rows.extend(term_rows)
+        result.append({'term': term, 'units': sum(units for units, _ in term_rows), 'gpa': _gpa(term_rows),
+                       'courses': [dict(course, grade=None if course['grade'] is None else str(course['grade']))
+                                   for course in courses]})
+    return {
+        'student': student_payload(student),
+        'terms': result,
+        'passed_units': sum(units for units, grade in all_rows if grade is not None and grade >= passing),
+        'gpa': _gpa(all_rows),
+    }
+
+
+def certificate_payload(student):
+    if not student.is_active or not student._meta.model_name == 'student':
+        raise ValueError("دانشجو در حال تحصیل نیست")
+    term = student.enrollments.order_by('-term').values_list('term', flat=True).first()
+    if term is None:
+        raise ValueError("دانشجو در هیچ نیمسالی درس اخذ نکرده است")
+    return {'student': student_payload(student), 'term': term}
+
+
+PAYLOADS = {
+    'transcript': transcript_payload,
+    'certificate': certificate_payload,
+}
+
+
+def build_payload(kind, student, issued=None):
+    """
+    داده‌های مدرک همراه با تاریخ صدور؛ تاریخ چاپ شده جزو داده‌ها (و هش نسخه) است تا مدرکی که
+    روز دیگری ساخته شده با تاریخ قدیمی دوباره تحویل داده نشود
+    """
+    payload = PAYLOADS[kind](student)
+    payload['issued'] = _jalali(issued or jdatetime.date.today())
+    return payload
+
+
+def data_hash(kind, payload):
+    """
+    نسخه داده‌ها؛ با تغییر هر داده‌ای که در مدرک چاپ می‌شود (یا ظاهر مدرک) تغییر می‌کند
+    """
+    content = json.dumps({'kind': kind, 'version': RENDERER_VERSION, 'payload': payload},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode()).hexdigest()
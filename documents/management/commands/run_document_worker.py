@@ -0,0 +1,64 @@
+import logging
+import multiprocessing
+import signal
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+
+from documents.models import DocumentJob
+from documents.render import render
+from documents.service import NODE, claim_jobs, complete_job, fail_job, font_paths, get_setting, requeue_stale
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "ساخت PDF مدارک درخواست شده در چند پردازه؛ می‌تواند روی چند سرور همزمان اجرا شود"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, help="تعداد پردازه‌های سازنده PDF")
+        parser.add_argument('--interval', type=float, default=2.0, help="فاصله بررسی صف (ثانیه)")
+        parser.add_argument('--once', action='store_true', help="پس از خالی شدن صف خارج شو")
+
+    def handle(self, *args, **options):
+        processes = options['processes'] or get_setting('DOCUMENT_WORKER_PROCESSES', 2)
+        fonts = font_paths()
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+        self.stdout.write(f"Document worker started with {processes} processes.")
+
+        running = {}
+        finished = 0
+        # پردازه‌های فرزند به پایگاه داده دسترسی ندارند و فقط داده‌های کار را به PDF تبدیل می‌کنند
+        pool = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'))
+        try:
+            while running or not stopping:
+                if not stopping:
+                    requeue_stale()
+                    for job in claim_jobs(processes * 2 - len(running)):
+                        running[pool.submit(render, job.kind, job.payload, job.payload['issued'], fonts)] = job
+                if not running:
+                    if options['once']:
+                        break
+                    time.sleep(options['interval'])
+                    continue
+                done, _ = wait(running, timeout=options['interval'], return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        content = future.result()
+                    except Exception:
+                        logger.exception("Rendering %s failed", job.pk)
+                        fail_job(job, traceback.format_exc())
+                        continue
+                    complete_job(job, content)
+                    finished += 1
+        except KeyboardInterrupt:
+            pass
+        finally:
+            pool.shutdown(cancel_futures=True)
+            # کارهای نیمه‌کاره همین کارگر به صف برمی‌گردند
+            DocumentJob.objects.filter(status='running', locked_by=NODE).update(status='queued', locked_by='')
+        self.stdout.write(f"Document worker stopped after {finished} documents.")
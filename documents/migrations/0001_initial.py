@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:55
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DocumentJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('transcript', 'کارنامه تحصیلی'), ('certificate', 'گواهی اشتغال به تحصیل')], max_length=20, verbose_name='نوع مدرک')),
+                ('student_ID', models.CharField(max_length=14, verbose_name='کد دانشجویی')),
+                ('data_hash', models.CharField(max_length=64, verbose_name='نسخه داده\u200cها')),
+                ('payload', models.JSONField(verbose_name='داده\u200cها')),
+                ('status', models.CharField(choices=[('queued', 'در صف'), ('running', 'در حال ساخت'), ('done', 'آماده'), ('failed', 'ناموفق')], default='queued', max_length=10, verbose_name='وضعیت')),
+                ('file', models.FileField(blank=True, upload_to='documents', verbose_name='فایل')),
+                ('error', models.TextField(blank=True, verbose_name='خطا')),
+                ('attempts', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد تلاش')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='کارگر')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ درخواست')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='شروع ساخت')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='پایان ساخت')),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='درخواست کننده')),
+            ],
+            options={
+                'verbose_name': 'درخواست مدرک',
+                'verbose_name_plural': 'درخواست\u200cهای مدرک',
+                'db_table': 'DocumentJob',
+                'indexes': [models.Index(fields=['status', 'created_at'], name='document_job_queue_idx'), models.Index(fields=['student_ID', 'kind'], name='document_job_student_idx'), models.Index(fields=['file'], name='document_job_file_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'failed'), _negated=True), fields=('kind', 'data_hash'), name='document_job_version_unique')],
+            },
+        ),
+    ]
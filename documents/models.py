@@ -0,0 +1,58 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class DocumentJob(models.Model):
+    """
+    درخواست صدور کارنامه یا گواهی؛ صف کارها و cache فایل‌های ساخته شده
+
+    داده‌های دانشجو هنگام درخواست در payload ذخیره می‌شوند و data_hash نسخه آن‌هاست؛
+    درخواست دوباره با همان نسخه، همان کار (و همان فایل) را برمی‌گرداند.
+    """
+
+    class Meta:
+        verbose_name = "درخواست مدرک"
+        verbose_name_plural = "درخواست‌های مدرک"
+        db_table = "DocumentJob"
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'data_hash'], condition=~models.Q(status='failed'),
+                                    name='document_job_version_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='document_job_queue_idx'),
+            models.Index(fields=['student_ID', 'kind'], name='document_job_student_idx'),
+            models.Index(fields=['file'], name='document_job_file_idx'),
+        ]
+
+    KIND_CHOICES = {
+        'transcript': 'کارنامه تحصیلی',
+        'certificate': 'گواهی اشتغال به تحصیل',
+    }
+    STATUS_CHOICES = {
+        'queued': 'در صف',
+        'running': 'در حال ساخت',
+        'done': 'آماده',
+        'failed': 'ناموفق',
+    }
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="نوع مدرک")
+    # دانشجو ممکن است در جدول اصلی یا بایگانی باشد؛ به همین دلیل کلید خارجی نیست
+    student_ID = models.CharField(max_length=14, verbose_name="کد دانشجویی")
+    data_hash = models.CharField(max_length=64, verbose_name="نسخه داده‌ها")
+    payload = models.JSONField(verbose_name="داده‌ها")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued', verbose_name="وضعیت")
+    file = models.FileField(upload_to="documents", blank=True, verbose_name="فایل")
+    error = models.TextField(blank=True, verbose_name="خطا")
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد تلاش")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="کارگر")
+    requested_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL,
+                                     verbose_name="درخواست کننده")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ درخواست")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="شروع ساخت")
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name="پایان ساخت")
+
+    def __str__(self):
+        return f"{self.get_kind_display()} - {self.student_ID}"
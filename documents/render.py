@@ -0,0 +1,125 @@
+"""
+ساخت فایل PDF کارنامه و گواهی اشتغال به تحصیل
+
+این ماژول به Django وابسته نیست و در پردازه‌های کارگر اجرا می‌شود؛ ورودی آن داده‌های
+ذخیره شده در کار (payload) و مسیر فونت‌هاست. متن فارسی با موتور HarfBuzz (uharfbuzz)
+شکل‌دهی و راست به چپ چیده می‌شود.
+"""
+from fpdf import FPDF
+
+PERSIAN_DIGITS = str.maketrans('0123456789', '۰۱۲۳۴۵۶۷۸۹')
+SEMESTERS = {'1': 'اول', '2': 'دوم', '3': 'تابستان'}
+TITLES = {
+    'transcript': 'کارنامه تحصیلی',
+    'certificate': 'گواهی اشتغال به تحصیل',
+}
+
+
+def fa(value):
+    return str(value).translate(PERSIAN_DIGITS)
+
+
+def term_label(term):
+    return f"نیمسال {SEMESTERS.get(term[4:], term[4:])} {fa(term[:4])}"
+
+
+class Document(FPDF):
+    def __init__(self, title, issued, fonts):
+        super().__init__(format='A4')
+        self.title_text = title
+        self.issued = issued
+        self.add_font('Shabnam', '', fonts['regular'])
+        self.add_font('Shabnam', 'B', fonts['bold'])
+        self.set_text_shaping(use_shaping_engine=True, direction='rtl')
+        self.set_auto_page_break(True, margin=20)
+        self.add_page()
+
+    def header(self):
+        self.set_font('Shabnam', 'B', 16)
+        self.cell(0, 10, self.title_text, align='C', new_x='LMARGIN', new_y='NEXT')
+        self.set_font('Shabnam', '', 9)
+        self.cell(0, 6, f"تاریخ صدور: {fa(self.issued)}", align='R', new_x='LMARGIN', new_y='NEXT')
+        self.ln(4)
+
+    def footer(self):
+        self.set_y(-15)
+        self.set_font('Shabnam', '', 8)
+        self.cell(0, 8, f"صفحه {fa(self.page_no())}", align='C')
+
+    def field_rows(self, fields):
+        self.set_font('Shabnam', '', 10)
+        with self.table(col_widths=(45, 50, 45, 50), first_row_as_headings=False, text_align='RIGHT',
+                        borders_layout='NONE', line_height=7) as table:
+            for start in range(0, len(fields), 2):
+                row = table.row()
+                # ستون‌ها از چپ به راست چیده می‌شوند؛ اولین جفت باید سمت راست باشد
+                pairs = fields[start:start + 2]
+                for label, value in reversed(pairs + [('', '')] * (2 - len(pairs))):
+                    row.cell(fa(value))
+                    row.cell(f"{label}:" if label else '')
+        self.ln(3)
+
+
+def student_fields(student):
+    fields = [
+        ('نام و نام خانوادگی', f"{student['first_name']} {student['last_name']}"),
+        ('نام پدر', student['father_name']),
+        ('شماره دانشجویی', student['student_ID']),
+        ('کد ملی', student['national_ID']),
+        ('مقطع', student['degree']),
+        ('رشته', student['major']),
+        ('دانشکده / گروه', student['department']),
+        ('تاریخ ورود', student['enrollment_date']),
+    ]
+    if student['minor']:
+        fields.append(('رشته فرعی', student['minor']))
+    return fields
+
+
+def render_transcript(pdf, payload):
+    pdf.field_rows(student_fields(payload['student']))
+    for term in payload['terms']:
+        pdf.set_font('Shabnam', 'B', 11)
+        pdf.cell(0, 8, term_label(term['term']), align='R', new_x='LMARGIN', new_y='NEXT')
+        pdf.set_font('Shabnam', '', 10)
+        with pdf.table(col_widths=(25, 20, 105, 30), text_align=('CENTER', 'CENTER', 'RIGHT', 'CENTER'),
+                       line_height=7) as table:
+            table.row(['نمره', 'واحد', 'نام درس', 'کد درس'])
+            for course in term['courses']:
+                grade = fa(course['grade']) if course['grade'] is not None else '-'
+                table.row([grade, fa(course['units']), course['name'], fa(course['code'])])
+        pdf.set_font('Shabnam', '', 9)
+        pdf.cell(0, 7, f"واحد اخذ شده: {fa(term['units'])}    معدل نیمسال: {fa(term['gpa'] or '-')}",
+                 align='R', new_x='LMARGIN', new_y='NEXT')
+        pdf.ln(2)
+    pdf.ln(3)
+    pdf.set_font('Shabnam', 'B', 11)
+    pdf.cell(0, 8, f"مجموع واحدهای گذرانده: {fa(payload['passed_units'])}    معدل کل: {fa(payload['gpa'] or '-')}",
+             align='R', new_x='LMARGIN', new_y='NEXT')
+
+
+def render_certificate(pdf, payload):
+    student = payload['student']
+    pdf.field_rows(student_fields(student))
+    pdf.ln(6)
+    pdf.set_font('Shabnam', '', 12)
+    text = (f"بدین‌وسیله گواهی می‌شود {student['first_name']} {student['last_name']} فرزند {student['father_name']} "
+            f"به شماره دانشجویی {fa(student['student_ID'])} در مقطع {student['degree']} رشته {student['major']} "
+            f"در {term_label(payload['term'])} مشغول به تحصیل می‌باشد. "
+            "این گواهی بنا به درخواست نامبرده صادر شده و فاقد ارزش دیگری است.")
+    pdf.multi_cell(0, 9, text, align='R')
+
+
+RENDERERS = {
+    'transcript': render_transcript,
+    'certificate': render_certificate,
+}
+
+
+def render(kind, payload, issued, fonts):
+    """
+    ساخت PDF و برگرداندن محتوای آن؛ fonts دیکشنری مسیر فونت regular و bold است
+    """
+    pdf = Document(TITLES[kind], issued, fonts)
+    RENDERERS[kind](pdf, payload)
+    return bytes(pdf.output())
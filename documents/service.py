@@ -0,0 +1,98 @@
+"""
+صف درخواست‌های صدور مدرک
+
+درخواست فقط داده‌ها را در جدول DocumentJob ذخیره می‌کند و فوراً برمی‌گردد؛ ساخت PDF با
+دستور run_document_worker در پردازه‌های جدا انجام می‌شود. هر کارگر کارها را با یک UPDATE
+شرطی برمی‌دارد، بنابراین چند کارگر (روی چند سرور) می‌توانند همزمان از یک صف کار بردارند.
+"""
+import datetime
+import os
+import socket
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from account.archive import get_student
+
+from .data import build_payload, data_hash
+from .models import DocumentJob
+
+NODE = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def request_document(kind, student_ID, user=None):
+    """
+    (کار، ساخته شده یا نه)؛ اگر همین نسخه از مدرک قبلا درخواست شده باشد همان کار برگردانده می‌شود
+    """
+    student = get_student(student_ID)
+    if student is None:
+        raise LookupError(student_ID)
+    payload = build_payload(kind, student)
+    version = data_hash(kind, payload)
+    existing = DocumentJob.objects.exclude(status='failed').filter(kind=kind, data_hash=version).first()
+    if existing is not None:
+        return existing, False
+    try:
+        with transaction.atomic():
+            job = DocumentJob.objects.create(kind=kind, student_ID=student.student_ID, data_hash=version,
+                                             payload=payload, requested_by=user if user and user.pk else None)
+    except IntegrityError:
+        # درخواست همزمان دیگری همین نسخه را ثبت کرده است
+        return DocumentJob.objects.exclude(status='failed').get(kind=kind, data_hash=version), False
+    return job, True
+
+
+def requeue_stale():
+    """
+    کارهایی که کارگرشان بیش از DOCUMENT_JOB_TIMEOUT ثانیه پیش شروع کرده و تمام نکرده دوباره در صف قرار می‌گیرند؛
+    کاری که DOCUMENT_JOB_MAX_ATTEMPTS بار تلاش شده باشد ناموفق ثبت می‌شود تا بی‌پایان تکرار نشود
+    """
+    now = timezone.now()
+    max_attempts = get_setting('DOCUMENT_JOB_MAX_ATTEMPTS', 3)
+    stale = DocumentJob.objects.filter(
+        status='running', started_at__lt=now - datetime.timedelta(seconds=get_setting('DOCUMENT_JOB_TIMEOUT', 300)))
+    stale.filter(attempts__gte=max_attempts).update(
+        status='failed', error=f"Timed out after {max_attempts} attempts", locked_by='', finished_at=now)
+    return stale.filter(attempts__lt=max_attempts).update(status='queued', locked_by='')
+
+
+def claim_jobs(limit):
+    claimed = []
+    candidates = (DocumentJob.objects.filter(status='queued').order_by('created_at')
+                  .values_list('pk', flat=True)[:limit])
+    for pk in candidates:
+        if DocumentJob.objects.filter(pk=pk, status='queued').update(
+                status='running', locked_by=NODE, started_at=timezone.now(), attempts=F('attempts') + 1):
+            claimed.append(pk)
+    return list(DocumentJob.objects.filter(pk__in=claimed).order_by('created_at'))
+
+
+def complete_job(job, content):
+    job.file.save(f"{job.kind}.pdf", ContentFile(content), save=False)
+    DocumentJob.objects.filter(pk=job.pk, locked_by=NODE).update(
+        status='done', file=job.file.name, error='', locked_by='', finished_at=timezone.now())
+    # نسخه‌های قدیمی‌تر همین مدرک دیگر استفاده نمی‌شوند؛ فایل‌هایشان با gc_media پاک می‌شوند
+    (DocumentJob.objects.filter(kind=job.kind, student_ID=job.student_ID, created_at__lt=job.created_at)
+     .exclude(status__in=['queued', 'running']).delete())
+
+
+def fail_job(job, error):
+    retry = job.attempts < get_setting('DOCUMENT_JOB_MAX_ATTEMPTS', 3)
+    DocumentJob.objects.filter(pk=job.pk, locked_by=NODE).update(
+        status='queued' if retry else 'failed', error=error, locked_by='',
+        finished_at=None if retry else timezone.now())
+
+
+def font_paths():
+    font_dir = get_setting('DOCUMENT_FONT_DIR', settings.BASE_DIR / 'assets' / 'fonts')
+    return {
+        'regular': str(font_dir / 'Shabnam-Thin.ttf'),
+        'bold': str(font_dir / 'SHABNAM-MEDIUM.TTF'),
+    }
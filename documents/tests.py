@@ -0,0 +1,127 @@
+import datetime
+import shutil
+import tempfile
+from unittest import mock
+
+import jdatetime
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from account.models import Course, Department, Enrollment, Student
+
+from .models import DocumentJob
+from .service import NODE, claim_jobs, complete_job, fail_job, request_document, requeue_stale
+
+STUDENT_ID = '00000000000001'
+
+
+class DocumentJobTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        department = Department(code='D1', name="کامپیوتر", established_Date=jdatetime.date(1360, 1, 1))
+        department.faculty = department
+        department.save()
+        Course.objects.create(code='1000001', name="ریاضی", units=3, department=department)
+        for i in (1, 2):
+            Student.objects.create(
+                national_ID=f"{i:010d}", student_ID=f"{i:014d}", first_Name="علی", last_Name="رضایی",
+                father_Name="حسن", birth_Date=jdatetime.date(1380, 1, 1), enrollment_date=jdatetime.date(1400, 1, 1),
+                degree='bachelor', major="کامپیوتر", gpa=15, Department=department,
+            )
+            Enrollment.objects.create(student_id=f"{i:010d}", course_id='1000001', term='14031', grade=17)
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def test_same_data_returns_the_same_job(self):
+        job, created = request_document('transcript', STUDENT_ID)
+        self.assertTrue(created)
+        self.assertEqual(job.payload['issued'], jdatetime.date.today().strftime('%Y/%m/%d'))
+        self.assertEqual(request_document('transcript', STUDENT_ID), (job, False))
+        self.assertEqual(DocumentJob.objects.count(), 1)
+
+    def test_changed_data_creates_a_new_version(self):
+        job, _ = request_document('transcript', STUDENT_ID)
+        Enrollment.objects.filter(student_id='0000000001').update(grade=19)
+        changed, created = request_document('transcript', STUDENT_ID)
+        self.assertTrue(created)
+        self.assertNotEqual(changed.data_hash, job.data_hash)
+
+    def test_issue_date_is_part_of_the_version(self):
+        job, _ = request_document('certificate', STUDENT_ID)
+        tomorrow = jdatetime.date.today() + datetime.timedelta(days=1)
+        with mock.patch('documents.data.jdatetime') as jdatetime_mock:
+            jdatetime_mock.date.today.return_value = tomorrow
+            later, created = request_document('certificate', STUDENT_ID)
+        self.assertTrue(created)
+        self.assertEqual(later.payload['issued'], tomorrow.strftime('%Y/%m/%d'))
+
+    def test_failed_job_is_not_reused(self):
+        job, _ = request_document('transcript', STUDENT_ID)
+        DocumentJob.objects.filter(pk=job.pk).update(status='failed')
+        retry, created = request_document('transcript', STUDENT_ID)
+        self.assertTrue(created)
+        self.assertNotEqual(retry.pk, job.pk)
+
+    def test_unknown_student(self):
+        with self.assertRaises(LookupError):
+            request_document('transcript', '99999999999999')
+
+    def test_claim(self):
+        first, _ = request_document('transcript', STUDENT_ID)
+        second, _ = request_document('transcript', '00000000000002')
+        [claimed] = claim_jobs(1)
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual((claimed.status, claimed.attempts, claimed.locked_by), ('running', 1, NODE))
+        self.assertEqual([job.pk for job in claim_jobs(5)], [second.pk])
+        self.assertEqual(claim_jobs(5), [])
+
+    def test_complete_replaces_older_versions(self):
+        old, _ = request_document('transcript', STUDENT_ID)
+        complete_job(claim_jobs(1)[0], b"%PDF-old")
+        Enrollment.objects.filter(student_id='0000000001').update(grade=19)
+        new, _ = request_document('transcript', STUDENT_ID)
+        complete_job(claim_jobs(1)[0], b"%PDF-new")
+
+        new.refresh_from_db()
+        self.assertEqual((new.status, new.locked_by, new.error), ('done', '', ''))
+        self.assertIsNotNone(new.finished_at)
+        with new.file.open('rb') as file:
+            self.assertEqual(file.read(), b"%PDF-new")
+        self.assertFalse(DocumentJob.objects.filter(pk=old.pk).exists())
+
+    @override_settings(DOCUMENT_JOB_MAX_ATTEMPTS=2)
+    def test_fail_retries_until_max_attempts(self):
+        job, _ = request_document('transcript', STUDENT_ID)
+        fail_job(claim_jobs(1)[0], "boom")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error, job.locked_by), ('queued', "boom", ''))
+
+        fail_job(claim_jobs(1)[0], "boom again")
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.error), ('failed', 2, "boom again"))
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(claim_jobs(1), [])
+
+    @override_settings(DOCUMENT_JOB_MAX_ATTEMPTS=2, DOCUMENT_JOB_TIMEOUT=60)
+    def test_stale_jobs_are_requeued_until_max_attempts(self):
+        job, _ = request_document('transcript', STUDENT_ID)
+        claim_jobs(1)
+        self.assertEqual(requeue_stale(), 0)
+
+        DocumentJob.objects.update(started_at=timezone.now() - datetime.timedelta(minutes=5))
+        self.assertEqual(requeue_stale(), 1)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), ('queued', ''))
+
+        claim_jobs(1)
+        DocumentJob.objects.update(started_at=timezone.now() - datetime.timedelta(minutes=5))
+        self.assertEqual(requeue_stale(), 0)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertIn("Timed out", job.error)
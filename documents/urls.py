@@ -0,0 +1,8 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path("jobs/<uuid:job_id>/", views.documentStatus, name="document-status"),
+    path("jobs/<uuid:job_id>/download/", views.downloadDocument, name="document-download"),
+    path("<str:kind>/<str:student_ID>/", views.requestDocument, name="document-request"),
+]
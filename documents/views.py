@@ -0,0 +1,72 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.auth.decorators import permission_required
+from django.http import FileResponse, Http404, HttpResponseNotModified, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.http import quote_etag
+from django.views.decorators.http import require_POST, require_safe
+
+from .models import DocumentJob
+from .service import request_document
+
+# فاصله پیشنهادی (ثانیه) برای بررسی دوباره وضعیت
+POLL_INTERVAL = 2
+
+
+def _job_response(job, status=200):
+    status_url = reverse('document-status', args=[job.pk])
+    data = {
+        'id': str(job.pk),
+        'kind': job.kind,
+        'student_ID': job.student_ID,
+        'status': job.status,
+        'status_url': status_url,
+        'download_url': reverse('document-download', args=[job.pk]) if job.status == 'done' else None,
+    }
+    if job.status == 'failed':
+        data['error'] = "ساخت مدرک ناموفق بود"
+    response = JsonResponse(data, status=status)
+    if job.status in ('queued', 'running'):
+        response['Retry-After'] = str(POLL_INTERVAL)
+    if status == 202:
+        response['Location'] = status_url
+    return response
+
+
+@staff_member_required
+@permission_required(['documents.add_documentjob', 'documents.view_documentjob'], raise_exception=True)
+@require_POST
+def requestDocument(request, kind, student_ID):
+    if kind not in DocumentJob.KIND_CHOICES:
+        raise Http404
+    try:
+        job, _ = request_document(kind, student_ID, request.user)
+    except LookupError:
+        return JsonResponse({'error': "دانشجو یافت نشد"}, status=404)
+    except ValueError as error:
+        return JsonResponse({'error': str(error)}, status=400)
+    return _job_response(job, status=200 if job.status == 'done' else 202)
+
+
+@staff_member_required
+@permission_required('documents.view_documentjob', raise_exception=True)
+@require_safe
+def documentStatus(request, job_id):
+    return _job_response(get_object_or_404(DocumentJob, pk=job_id))
+
+
+@staff_member_required
+@permission_required('documents.view_documentjob', raise_exception=True)
+@require_safe
+def downloadDocument(request, job_id):
+    job = get_object_or_404(DocumentJob, pk=job_id, status='done')
+    # هر کار یک نسخه ثابت از داده‌هاست و فایلش هرگز تغییر نمی‌کند
+    etag = quote_etag(job.data_hash)
+    if request.headers.get('If-None-Match') == etag:
+        response = HttpResponseNotModified()
+    else:
+        response = FileResponse(job.file.open('rb'), as_attachment=True, content_type='application/pdf',
+                                filename=f"{job.kind}-{job.student_ID}.pdf")
+    response['ETag'] = etag
+    response['Cache-Control'] = "private, max-age=31536000, immutable"
+    return response
@@ -0,0 +1,36 @@
+from django.contrib import admin
+
+from .models import PayrollRun, Payslip
+
+
+@admin.register(PayrollRun)
+class PayrollRunAdmin(admin.ModelAdmin):
+    list_display = ['__str__', 'employee_count', 'total_gross', 'updated_at']
+    readonly_fields = ['year', 'month', 'employee_count', 'total_gross', 'created_at', 'updated_at']
+
+    list_filter = ()
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(Payslip)
+class PayslipAdmin(admin.ModelAdmin):
+    list_display = ['professor', 'run', 'days_worked', 'promotion_steps', 'gross_pay']
+    search_fields = ['professor__national_ID', 'professor__personnel_code']
+    list_filter = ['run']
+    list_select_related = ['professor', 'run']
+    raw_id_fields = ['professor']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,123 @@
+"""
+محاسبه حقوق ماهانه کارکنان
+
+ستون‌های لازم با values_list و به صورت دسته‌ای خوانده می‌شوند و هر محاسبه روی کل
+ستون‌های یک دسته انجام می‌شود. همه مبالغ به صورت عدد صحیح (صدم ریال) محاسبه و فقط
+یک بار در پایان به ریال گرد می‌شوند تا نتیجه دقیق و تکرارپذیر باشد.
+"""
+import datetime
+from decimal import Decimal
+
+import jdatetime
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from account.models import Professor
+
+from .models import PayrollRun, Payslip
+
+BASIS_POINTS = 10000
+CENTS = 100
+
+
+def get_setting(name, default):
+    return getattr(settings, name, default)
+
+
+def month_bounds(year, month):
+    """
+    روز اول و آخر (میلادی) و تعداد روزهای یک ماه شمسی
+    """
+    first = jdatetime.date(year, month, 1)
+    days = jdatetime.j_days_in_month[month - 1]
+    if month == 12 and first.isleap():
+        days += 1
+    start = first.togregorian()
+    return start, start + datetime.timedelta(days=days - 1), days
+
+
+def round_div(numerator, denominator):
+    # تقسیم صحیح با گرد کردن نیم به بالا برای مقادیر نامنفی
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def to_gregorian(value):
+    if value is None:
+        return None
+    if isinstance(value, jdatetime.date):
+        return value.togregorian()
+    return value
+
+
+def full_years(since, until):
+    if since is None or since > until:
+        return 0
+    return until.year - since.year - ((until.month, until.day) < (since.month, since.day))
+
+
+def compute_batch(rows, start, end, days_in_month):
+    """
+    محاسبه ستونی یک دسته؛ ردیف‌ها (کد ملی، حقوق، وضعیت، تاریخ استخدام، آخرین ترفیع، پایان قرارداد) هستند
+    """
+    step_bp = get_setting('PAYROLL_PROMOTION_STEP_BASIS_POINTS', 250)
+    max_steps = get_setting('PAYROLL_MAX_PROMOTION_STEPS', 5)
+    contract_statuses = get_setting('PAYROLL_CONTRACT_STATUSES', ('Contract', 'Temporary'))
+
+    ids, salaries, statuses, hired, promoted, contract_ends = zip(*rows)
+    salary_cents = [int(salary * CENTS) for salary in salaries]
+    first_days = [max(start, to_gregorian(date) or start) for date in hired]
+    last_days = [min(end, contract_end) if status in contract_statuses and contract_end else end
+                 for status, contract_end in zip(statuses, contract_ends)]
+    days = [max(0, (last - first).days + 1) for first, last in zip(first_days, last_days)]
+    steps = [min(max_steps, full_years(to_gregorian(date), end)) for date in promoted]
+
+    denominator = days_in_month * CENTS
+    prorated = [round_div(cents * worked, denominator) for cents, worked in zip(salary_cents, days)]
+    gross = [round_div(cents * worked * (BASIS_POINTS + step * step_bp), denominator * BASIS_POINTS)
+             for cents, worked, step in zip(salary_cents, days, steps)]
+
+    return [
+        {'professor_id': pk, 'base_salary': salary, 'days_worked': worked, 'promotion_steps': step,
+         'adjustment': Decimal(total - base), 'gross_pay': Decimal(total)}
+        for pk, salary, worked, step, base, total in zip(ids, salaries, days, steps, prorated, gross)
+        if worked
+    ]
+
+
+@transaction.atomic
+def run_payroll(year, month, batch_size=2000):
+    """
+    اجرای حقوق یک ماه؛ اجرای دوباره فیش‌های قبلی همان ماه را جایگزین می‌کند
+    """
+    start, end, days_in_month = month_bounds(year, month)
+    run, _ = PayrollRun.objects.select_for_update().get_or_create(year=year, month=month)
+    run.payslips.all().delete()
+
+    rows = (Professor.objects
+            .filter(contract_Date__lte=jdatetime.date.fromgregorian(date=end))
+            .order_by('national_ID')
+            .values_list('national_ID', 'salary', 'employment_status', 'contract_Date',
+                         'last_promotion_date', 'contract_end_date')
+            .iterator(chunk_size=batch_size))
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            _save_batch(run, batch, start, end, days_in_month, batch_size)
+            batch = []
+    if batch:
+        _save_batch(run, batch, start, end, days_in_month, batch_size)
+
+    totals = run.payslips.aggregate(count=Count('id'), gross=Sum('gross_pay'))
+    run.employee_count = totals['count']
+    run.total_gross = totals['gross'] or 0
+    run.save(update_fields=['employee_count', 'total_gross', 'updated_at'])
+    return run
+
+
+def _save_batch(run, rows, start, end, days_in_month, batch_size):
+    Payslip.objects.bulk_create([
+        Payslip(run=run, days_in_month=days_in_month, **values)
+        for values in compute_batch(rows, start, end, days_in_month)
+    ], batch_size=batch_size)
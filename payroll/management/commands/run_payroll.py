@@ -0,0 +1,25 @@
+import time
+
+import jdatetime
+from django.core.management.base import BaseCommand, CommandError
+
+from payroll.engine import run_payroll
+
+
+class Command(BaseCommand):
+    help = "محاسبه حقوق یک ماه شمسی؛ اجرای دوباره برای همان ماه نتایج قبلی را جایگزین می‌کند"
+
+    def add_arguments(self, parser):
+        today = jdatetime.date.today()
+        parser.add_argument('--year', type=int, default=today.year)
+        parser.add_argument('--month', type=int, default=today.month)
+        parser.add_argument('--batch-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        if not 1 <= options['month'] <= 12:
+            raise CommandError("Month must be between 1 and 12.")
+        started = time.monotonic()
+        run = run_payroll(options['year'], options['month'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Payroll {run}: {run.employee_count} payslips, total {run.total_gross} rials "
+            f"in {time.monotonic() - started:.2f}s."))
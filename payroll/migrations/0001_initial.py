@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('account', '0006_media_file_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayrollRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField(verbose_name='سال')),
+                ('month', models.PositiveSmallIntegerField(verbose_name='ماه')),
+                ('employee_count', models.PositiveIntegerField(default=0, verbose_name='تعداد کارکنان')),
+                ('total_gross', models.DecimalField(decimal_places=0, default=0, max_digits=16, verbose_name='جمع حقوق ناخالص (ریال)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='تاریخ بروزرسانی')),
+            ],
+            options={
+                'verbose_name': 'دوره حقوق',
+                'verbose_name_plural': 'دوره\u200cهای حقوق',
+                'db_table': 'PayrollRun',
+                'ordering': ['-year', '-month'],
+                'unique_together': {('year', 'month')},
+            },
+        ),
+        migrations.CreateModel(
+            name='Payslip',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('base_salary', models.DecimalField(decimal_places=2, max_digits=10, verbose_name='حقوق پایه (ریال)')),
+                ('days_worked', models.PositiveSmallIntegerField(verbose_name='روزهای کارکرد')),
+                ('days_in_month', models.PositiveSmallIntegerField(verbose_name='روزهای ماه')),
+                ('promotion_steps', models.PositiveSmallIntegerField(default=0, verbose_name='پایه\u200cهای ترفیع')),
+                ('adjustment', models.DecimalField(decimal_places=0, default=0, max_digits=12, verbose_name='افزایش ترفیع (ریال)')),
+                ('gross_pay', models.DecimalField(decimal_places=0, max_digits=12, verbose_name='حقوق ناخالص (ریال)')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='تاریخ ایجاد')),
+                ('professor', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='account.professor', verbose_name='استاد')),
+                ('run', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='payslips', to='payroll.payrollrun', verbose_name='دوره حقوق')),
+            ],
+            options={
+                'verbose_name': 'فیش حقوقی',
+                'verbose_name_plural': 'فیش\u200cهای حقوقی',
+                'db_table': 'Payslip',
+                'unique_together': {('run', 'professor')},
+            },
+        ),
+    ]
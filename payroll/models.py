@@ -0,0 +1,49 @@
+from django.db import models
+
+
+class PayrollRun(models.Model):
+    """
+    اجرای حقوق یک ماه (تقویم شمسی)
+    """
+
+    class Meta:
+        verbose_name = "دوره حقوق"
+        verbose_name_plural = "دوره‌های حقوق"
+        db_table = "PayrollRun"
+        unique_together = ['year', 'month']
+        ordering = ['-year', '-month']
+
+    year = models.PositiveSmallIntegerField(verbose_name="سال")
+    month = models.PositiveSmallIntegerField(verbose_name="ماه")
+    employee_count = models.PositiveIntegerField(default=0, verbose_name="تعداد کارکنان")
+    total_gross = models.DecimalField(max_digits=16, decimal_places=0, default=0, verbose_name="جمع حقوق ناخالص (ریال)")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="تاریخ بروزرسانی")
+
+    def __str__(self):
+        return f"{self.year}/{self.month:02d}"
+
+
+class Payslip(models.Model):
+    """
+    فیش حقوقی هر استاد در یک دوره
+    """
+
+    class Meta:
+        verbose_name = "فیش حقوقی"
+        verbose_name_plural = "فیش‌های حقوقی"
+        db_table = "Payslip"
+        unique_together = ['run', 'professor']
+
+    run = models.ForeignKey(PayrollRun, on_delete=models.CASCADE, related_name="payslips", verbose_name="دوره حقوق")
+    professor = models.ForeignKey("account.Professor", on_delete=models.PROTECT, verbose_name="استاد")
+    base_salary = models.DecimalField(max_digits=10, decimal_places=2, verbose_name="حقوق پایه (ریال)")
+    days_worked = models.PositiveSmallIntegerField(verbose_name="روزهای کارکرد")
+    days_in_month = models.PositiveSmallIntegerField(verbose_name="روزهای ماه")
+    promotion_steps = models.PositiveSmallIntegerField(default=0, verbose_name="پایه‌های ترفیع")
+    adjustment = models.DecimalField(max_digits=12, decimal_places=0, default=0, verbose_name="افزایش ترفیع (ریال)")
+    gross_pay = models.DecimalField(max_digits=12, decimal_places=0, verbose_name="حقوق ناخالص (ریال)")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاریخ ایجاد")
+
+    def __str__(self):
+        return f"{self.run} - {self.professor_id}"
@@ -0,0 +1,118 @@
+import datetime
+from decimal import Decimal
+
+import jdatetime
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from account.models import Faculty, Professor
+
+from .engine import compute_batch, month_bounds, round_div, run_payroll
+from .models import PayrollRun, Payslip
+
+SALARY = Decimal('3000000.00')
+LONG_AGO = jdatetime.date(1390, 1, 1)
+RECENT_PROMOTION = datetime.date(2024, 6, 1)
+
+
+def row(pk='1', salary=SALARY, status='Full-time', hired=LONG_AGO, promoted=RECENT_PROMOTION, contract_end=None):
+    return pk, salary, status, hired, promoted, contract_end
+
+
+@override_settings(PAYROLL_PROMOTION_STEP_BASIS_POINTS=250, PAYROLL_MAX_PROMOTION_STEPS=5,
+                   PAYROLL_CONTRACT_STATUSES=('Contract', 'Temporary'))
+class ComputeBatchTests(SimpleTestCase):
+
+    def compute(self, *rows, year=1403, month=7):
+        start, end, days = month_bounds(year, month)
+        return compute_batch(rows, start, end, days)
+
+    def test_month_bounds(self):
+        self.assertEqual(month_bounds(1403, 7), (datetime.date(2024, 9, 22), datetime.date(2024, 10, 21), 30))
+        self.assertEqual(month_bounds(1403, 1), (datetime.date(2024, 3, 20), datetime.date(2024, 4, 19), 31))
+
+    def test_esfand_leap_year(self):
+        self.assertEqual(month_bounds(1403, 12), (datetime.date(2025, 2, 19), datetime.date(2025, 3, 20), 30))
+        self.assertEqual(month_bounds(1402, 12), (datetime.date(2024, 2, 20), datetime.date(2024, 3, 19), 29))
+        [slip] = self.compute(row(), year=1403, month=12)
+        self.assertEqual(slip['days_worked'], 30)
+        self.assertEqual(slip['gross_pay'], Decimal(3000000))
+
+    def test_full_month(self):
+        [slip] = self.compute(row())
+        self.assertEqual(slip['days_worked'], 30)
+        self.assertEqual(slip['promotion_steps'], 0)
+        self.assertEqual(slip['gross_pay'], Decimal(3000000))
+        self.assertEqual(slip['adjustment'], 0)
+
+    def test_partial_first_month(self):
+        # ۱۶ مهر ۱۴۰۳ تا پایان ماه: ۱۵ روز
+        [slip] = self.compute(row(hired=jdatetime.date(1403, 7, 16)))
+        self.assertEqual(slip['days_worked'], 15)
+        self.assertEqual(slip['gross_pay'], Decimal(1500000))
+
+    def test_contract_end_mid_month(self):
+        # پایان قرارداد ۱۵ مهر ۱۴۰۳
+        [slip] = self.compute(row(status='Contract', contract_end=datetime.date(2024, 10, 6)))
+        self.assertEqual(slip['days_worked'], 15)
+        self.assertEqual(slip['gross_pay'], Decimal(1500000))
+
+    def test_contract_end_ignored_for_permanent_staff(self):
+        [slip] = self.compute(row(contract_end=datetime.date(2024, 10, 6)))
+        self.assertEqual(slip['days_worked'], 30)
+
+    def test_employees_without_worked_days_are_skipped(self):
+        self.assertEqual(self.compute(row(status='Temporary', contract_end=datetime.date(2024, 9, 1))), [])
+        self.assertEqual(self.compute(row(hired=jdatetime.date(1403, 8, 1))), [])
+
+    def test_promotion_steps_are_capped(self):
+        [slip] = self.compute(row(salary=Decimal('1000000.00'), promoted=datetime.date(2010, 1, 1)))
+        self.assertEqual(slip['promotion_steps'], 5)
+        self.assertEqual(slip['adjustment'], Decimal(125000))
+        self.assertEqual(slip['gross_pay'], Decimal(1125000))
+
+    def test_promotion_steps_count_full_years(self):
+        steps = [slip['promotion_steps'] for slip in self.compute(
+            row('1', promoted=datetime.date(2022, 10, 21)),
+            row('2', promoted=datetime.date(2022, 10, 22)),
+        )]
+        self.assertEqual(steps, [2, 1])
+
+    def test_base_plus_adjustment_equals_gross(self):
+        rows = [row(str(i), salary=Decimal(1234567 + i * 7919) / 100, hired=jdatetime.date(1403, 7, 1 + i % 30),
+                    promoted=datetime.date(2015 + i % 10, 1 + i % 12, 1)) for i in range(200)]
+        for slip in self.compute(*rows):
+            base = round_div(int(slip['base_salary'] * 100) * slip['days_worked'], 30 * 100)
+            self.assertEqual(base + slip['adjustment'], slip['gross_pay'])
+            self.assertEqual(slip['gross_pay'], int(slip['gross_pay']))
+
+    def test_round_half_up(self):
+        self.assertEqual(round_div(5, 2), 3)
+        self.assertEqual(round_div(4, 3), 1)
+        self.assertEqual(round_div(0, 7), 0)
+
+
+class RunPayrollTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        faculty = Faculty.objects.create(code='F1', name="فنی", establishment_Date=jdatetime.date(1360, 1, 1))
+        for i, (hired, status) in enumerate([(LONG_AGO, 'Full-time'), (jdatetime.date(1403, 7, 16), 'Contract'),
+                                             (jdatetime.date(1404, 1, 1), 'Full-time')]):
+            Professor.objects.create(
+                national_ID=f"{i:010d}", personnel_code=f"{i:010d}", first_Name="علی", last_Name="رضایی",
+                father_Name="حسن", birth_Date=jdatetime.date(1360, 1, 1), Faculty=faculty, agreement_image='x.png',
+                contract_Date=hired, salary=SALARY, employment_status=status, academic_rank='Professor',
+                last_promotion_date=RECENT_PROMOTION, contract_end_date=datetime.date(2025, 1, 1),
+            )
+
+    def test_rerun_replaces_payslips(self):
+        first = run_payroll(1403, 7)
+        slips = list(Payslip.objects.order_by('professor_id').values_list('professor_id', 'days_worked', 'gross_pay'))
+        second = run_payroll(1403, 7)
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(PayrollRun.objects.count(), 1)
+        self.assertEqual(second.employee_count, 2)
+        self.assertEqual(second.total_gross, Decimal(4500000))
+        self.assertEqual(list(Payslip.objects.order_by('professor_id')
+                              .values_list('professor_id', 'days_worked', 'gross_pay')), slips)
@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from .models import JobState
+
+
+@admin.register(JobState)
+class JobStateAdmin(admin.ModelAdmin):
+    list_display = ['name', 'schedule', 'next_run_at', 'last_run_at', 'last_status', 'locked_by']
+    readonly_fields = ['name', 'schedule', 'last_run_at', 'last_status', 'last_error', 'locked_by', 'locked_until']
+    list_filter = ['last_status']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
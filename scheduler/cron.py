@@ -0,0 +1,87 @@
+"""
+تجزیه عبارت‌های cron پنج بخشی: دقیقه ساعت روز ماه روز-هفته
+"""
+import datetime
+
+FIELDS = (
+    ('minute', 0, 59),
+    ('hour', 0, 23),
+    ('day', 1, 31),
+    ('month', 1, 12),
+    ('weekday', 0, 6),
+)
+ALIASES = {
+    '@hourly': '0 * * * *',
+    '@daily': '0 0 * * *',
+    '@weekly': '0 0 * * 0',
+    '@monthly': '0 0 1 * *',
+}
+
+
+def _parse_field(text, low, high):
+    values = set()
+    # یکشنبه را می‌توان 0 یا 7 نوشت؛ بازه روی 0 تا 7 ساخته و 7 به 0 تبدیل می‌شود
+    weekday = (low, high) == (0, 6)
+    upper = 7 if weekday else high
+    for part in text.split(','):
+        part, _, step = part.partition('/')
+        step = int(step) if step else 1
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(bound) for bound in part.split('-', 1))
+        else:
+            start = end = int(part)
+            if step > 1:
+                end = high
+        if not (low <= start <= end <= upper) or step < 1:
+            raise ValueError(f"Invalid cron field {text!r}")
+        values.update(value % 7 if weekday else value for value in range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSpec:
+    def __init__(self, expression):
+        self.expression = expression
+        parts = ALIASES.get(expression.strip(), expression).split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.minute, self.hour, self.day, self.month, self.weekday = (
+            _parse_field(part, low, high) for part, (_, low, high) in zip(parts, FIELDS))
+        self.any_day = parts[2] == '*'
+        self.any_weekday = parts[4] == '*'
+
+    def __str__(self):
+        return self.expression
+
+    def _day_matches(self, moment):
+        # مانند cron: اگر هر دو محدود شده باشند، تطابق یکی کافی است
+        weekday = (moment.weekday() + 1) % 7
+        day_ok = moment.day in self.day
+        weekday_ok = weekday in self.weekday
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment):
+        """
+        اولین زمان منطبق بعد از moment (با همان منطقه زمانی)
+        """
+        moment = moment.replace(second=0, microsecond=0) + datetime.timedelta(minutes=1)
+        limit = moment + datetime.timedelta(days=366 * 5)
+        while moment < limit:
+            if moment.month not in self.month:
+                year, month = (moment.year + 1, 1) if moment.month == 12 else (moment.year, moment.month + 1)
+                moment = moment.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(moment):
+                moment = (moment + datetime.timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if moment.hour not in self.hour:
+                moment = (moment + datetime.timedelta(hours=1)).replace(minute=0)
+                continue
+            if moment.minute not in self.minute:
+                moment += datetime.timedelta(minutes=1)
+                continue
+            return moment
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
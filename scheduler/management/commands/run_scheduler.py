@@ -0,0 +1,49 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from scheduler.registry import autodiscover
+from scheduler.runner import run_due_jobs, run_job, sync_states
+
+
+class Command(BaseCommand):
+    help = "اجرای کارهای زمان‌بندی شده؛ می‌تواند روی چند سرور همزمان اجرا شود"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="فقط یک بار کارهای سررسید شده را اجرا کن")
+        parser.add_argument('--run', metavar='JOB', help="اجرای فوری یک کار بدون توجه به زمان‌بندی")
+        parser.add_argument('--interval', type=int, default=30, help="فاصله بررسی کارها (ثانیه)")
+        parser.add_argument('--list', action='store_true', help="نمایش کارهای ثبت شده")
+
+    def handle(self, *args, **options):
+        jobs = autodiscover()
+        sync_states(jobs)
+
+        if options['list']:
+            for name, job in sorted(jobs.items()):
+                self.stdout.write(f"{name}: {job.schedule}")
+            return
+        if options['run']:
+            if options['run'] not in jobs:
+                raise CommandError(f"Unknown job {options['run']!r}")
+            if not run_job(jobs[options['run']], force=True):
+                raise CommandError(f"Job {options['run']!r} is locked by another node")
+            self.stdout.write(self.style.SUCCESS(f"Ran {options['run']}."))
+            return
+        if options['once']:
+            for name in run_due_jobs(jobs):
+                self.stdout.write(f"Ran {name}.")
+            return
+
+        stopping = []
+        signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+        self.stdout.write(f"Scheduler started with {len(jobs)} jobs.")
+        try:
+            while not stopping:
+                for name in run_due_jobs(jobs):
+                    self.stdout.write(f"Ran {name}.")
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write("Scheduler stopped.")
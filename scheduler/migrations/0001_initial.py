@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobState',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='نام کار')),
+                ('schedule', models.CharField(max_length=100, verbose_name='زمان\u200cبندی')),
+                ('next_run_at', models.DateTimeField(blank=True, null=True, verbose_name='اجرای بعدی')),
+                ('last_run_at', models.DateTimeField(blank=True, null=True, verbose_name='آخرین اجرا')),
+                ('last_status', models.CharField(blank=True, choices=[('success', 'موفق'), ('failed', 'ناموفق'), ('running', 'در حال اجرا')], max_length=10, verbose_name='نتیجه آخرین اجرا')),
+                ('last_error', models.TextField(blank=True, verbose_name='خطای آخرین اجرا')),
+                ('locked_by', models.CharField(blank=True, max_length=100, verbose_name='قفل شده توسط')),
+                ('locked_until', models.DateTimeField(blank=True, null=True, verbose_name='انقضای قفل')),
+            ],
+            options={
+                'verbose_name': 'وضعیت کار',
+                'verbose_name_plural': 'وضعیت کارها',
+                'db_table': 'JobState',
+            },
+        ),
+    ]
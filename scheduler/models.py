@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class JobState(models.Model):
+    """
+    وضعیت ذخیره شده هر کار زمان‌بندی شده و قفل اجرای آن بین سرورها
+    """
+
+    class Meta:
+        verbose_name = "وضعیت کار"
+        verbose_name_plural = "وضعیت کارها"
+        db_table = "JobState"
+
+    STATUS_CHOICES = {
+        'success': 'موفق',
+        'failed': 'ناموفق',
+        'running': 'در حال اجرا',
+    }
+
+    name = models.CharField(max_length=100, primary_key=True, verbose_name="نام کار")
+    schedule = models.CharField(max_length=100, verbose_name="زمان‌بندی")
+    next_run_at = models.DateTimeField(null=True, blank=True, verbose_name="اجرای بعدی")
+    last_run_at = models.DateTimeField(null=True, blank=True, verbose_name="آخرین اجرا")
+    last_status = models.CharField(max_length=10, choices=STATUS_CHOICES, blank=True, verbose_name="نتیجه آخرین اجرا")
+    last_error = models.TextField(blank=True, verbose_name="خطای آخرین اجرا")
+    locked_by = models.CharField(max_length=100, blank=True, verbose_name="قفل شده توسط")
+    locked_until = models.DateTimeField(null=True, blank=True, verbose_name="انقضای قفل")
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,42 @@
+"""
+ثبت کارهای زمان‌بندی شده؛ هر اپ می‌تواند در ماژول jobs.py خود کار تعریف کند
+
+    from scheduler.registry import register_job
+
+    @register_job('contract_expiry', '0 7 * * *')
+    def contract_expiry():
+        ...
+"""
+import datetime
+
+from django.utils.module_loading import autodiscover_modules
+
+from .cron import CronSpec
+
+jobs = {}
+
+
+class Job:
+    def __init__(self, name, schedule, func, timeout):
+        self.name = name
+        self.schedule = CronSpec(schedule)
+        self.func = func
+        self.timeout = datetime.timedelta(seconds=timeout)
+
+    def __call__(self):
+        return self.func()
+
+
+def register_job(name, schedule, timeout=3600):
+    """
+    timeout مدت اعتبار قفل است؛ اگر سرور اجرا کننده از کار بیفتد پس از آن کار دوباره قابل اجراست
+    """
+    def decorator(func):
+        jobs[name] = Job(name, schedule, func, timeout)
+        return func
+    return decorator
+
+
+def autodiscover():
+    autodiscover_modules('jobs')
+    return jobs
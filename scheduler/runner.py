@@ -0,0 +1,68 @@
+import logging
+import os
+import socket
+import traceback
+
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import JobState
+
+logger = logging.getLogger(__name__)
+
+NODE = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def sync_states(jobs):
+    """
+    ساخت وضعیت کارهای جدید و بروزرسانی زمان اجرای کارهایی که زمان‌بندیشان تغییر کرده است
+    """
+    now = timezone.localtime()
+    states = JobState.objects.in_bulk(list(jobs))
+    for name, job in jobs.items():
+        state = states.get(name)
+        if state is None:
+            JobState.objects.get_or_create(
+                name=name, defaults={'schedule': str(job.schedule), 'next_run_at': job.schedule.next_after(now)})
+        elif state.schedule != str(job.schedule):
+            JobState.objects.filter(name=name).update(schedule=str(job.schedule),
+                                                      next_run_at=job.schedule.next_after(now))
+
+
+def acquire(job, now, force=False):
+    """
+    گرفتن قفل با یک UPDATE شرطی؛ فقط یک سرور می‌تواند ردیف را تغییر دهد
+    """
+    due = Q() if force else Q(next_run_at__lte=now)
+    return JobState.objects.filter(
+        due, Q(locked_until__isnull=True) | Q(locked_until__lt=now), name=job.name,
+    ).update(locked_by=NODE, locked_until=now + job.timeout, last_status='running') == 1
+
+
+def run_job(job, force=False):
+    now = timezone.localtime()
+    if not acquire(job, now, force):
+        return False
+    status, error = 'success', ''
+    try:
+        job()
+    except Exception:
+        logger.exception("Scheduled job %s failed", job.name)
+        status, error = 'failed', traceback.format_exc()
+    finally:
+        close_old_connections()
+        finished = timezone.localtime()
+        JobState.objects.filter(name=job.name, locked_by=NODE).update(
+            last_run_at=now, last_status=status, last_error=error,
+            next_run_at=job.schedule.next_after(finished), locked_by='', locked_until=None)
+    return True
+
+
+def run_due_jobs(jobs):
+    """
+    اجرای کارهایی که زمانشان رسیده است؛ فهرست کارهای اجرا شده برگردانده می‌شود
+    """
+    now = timezone.now()
+    due = JobState.objects.filter(name__in=list(jobs), next_run_at__lte=now).values_list('name', flat=True)
+    return [name for name in list(due) if run_job(jobs[name])]
@@ -0,0 +1,75 @@
+import datetime
+
+from django.test import SimpleTestCase
+
+from .cron import CronSpec
+
+# دوشنبه
+MONDAY = datetime.datetime(2026, 10, 19, 10, 30)
+
+
+class CronSpecTests(SimpleTestCase):
+
+    def next_after(self, expression, moment=MONDAY):
+        return CronSpec(expression).next_after(moment)
+
+    def test_aliases(self):
+        self.assertEqual(self.next_after('@hourly'), datetime.datetime(2026, 10, 19, 11, 0))
+        self.assertEqual(self.next_after('@daily'), datetime.datetime(2026, 10, 20, 0, 0))
+        self.assertEqual(self.next_after('@weekly'), datetime.datetime(2026, 10, 25, 0, 0))
+        self.assertEqual(self.next_after('@monthly'), datetime.datetime(2026, 11, 1, 0, 0))
+
+    def test_next_minute_is_strictly_after(self):
+        self.assertEqual(self.next_after('30 10 * * *'), datetime.datetime(2026, 10, 20, 10, 30))
+        self.assertEqual(self.next_after('* * * * *', MONDAY.replace(second=59)),
+                         datetime.datetime(2026, 10, 19, 10, 31))
+
+    def test_steps(self):
+        spec = CronSpec('*/15 */6 * * *')
+        self.assertEqual(spec.minute, {0, 15, 30, 45})
+        self.assertEqual(spec.hour, {0, 6, 12, 18})
+        self.assertEqual(CronSpec('5/20 * * * *').minute, {5, 25, 45})
+        self.assertEqual(self.next_after('*/15 */6 * * *'), datetime.datetime(2026, 10, 19, 12, 0))
+
+    def test_ranges_and_lists(self):
+        spec = CronSpec('0 9-17/4 1,15 * 1-5')
+        self.assertEqual(spec.hour, {9, 13, 17})
+        self.assertEqual(spec.day, {1, 15})
+        self.assertEqual(spec.weekday, {1, 2, 3, 4, 5})
+
+    def test_sunday_as_seven(self):
+        self.assertEqual(CronSpec('0 0 * * 7').weekday, {0})
+        self.assertEqual(CronSpec('0 0 * * 5-7').weekday, {5, 6, 0})
+        self.assertEqual(CronSpec('0 0 * * 4-7/2').weekday, {4, 6})
+        self.assertEqual(self.next_after('0 0 * * 7'), datetime.datetime(2026, 10, 25, 0, 0))
+
+    def test_day_or_weekday(self):
+        # با محدود بودن هر دو، روز ۱ ماه یا هر جمعه
+        self.assertEqual(self.next_after('0 8 1 * 5'), datetime.datetime(2026, 10, 23, 8, 0))
+        self.assertEqual(self.next_after('0 8 1 * 5', datetime.datetime(2026, 10, 30, 9, 0)),
+                         datetime.datetime(2026, 11, 1, 8, 0))
+
+    def test_day_and_weekday_when_one_is_wildcard(self):
+        self.assertEqual(self.next_after('0 8 * * 5'), datetime.datetime(2026, 10, 23, 8, 0))
+        self.assertEqual(self.next_after('0 8 20 * *'), datetime.datetime(2026, 10, 20, 8, 0))
+
+    def test_month_rollover(self):
+        self.assertEqual(self.next_after('0 0 31 * *'), datetime.datetime(2026, 10, 31, 0, 0))
+        self.assertEqual(self.next_after('0 0 31 * *', datetime.datetime(2026, 10, 31, 1, 0)),
+                         datetime.datetime(2026, 12, 31, 0, 0))
+        self.assertEqual(self.next_after('0 0 1 2 *'), datetime.datetime(2027, 2, 1, 0, 0))
+        self.assertEqual(self.next_after('0 0 29 2 *'), datetime.datetime(2028, 2, 29, 0, 0))
+
+    def test_preserves_timezone(self):
+        moment = MONDAY.replace(tzinfo=datetime.timezone.utc)
+        self.assertEqual(self.next_after('0 12 * * *', moment).tzinfo, datetime.timezone.utc)
+
+    def test_invalid_expressions(self):
+        for expression in ('* * * *', '60 * * * *', '* 24 * * *', '* * 0 * *', '* * * 13 *', '* * * * 8',
+                           '*/0 * * * *', '5-1 * * * *', 'a * * * *'):
+            with self.assertRaises(ValueError, msg=expression):
+                CronSpec(expression)
+
+    def test_never_matches(self):
+        with self.assertRaises(ValueError):
+            self.next_after('0 0 30 2 *')
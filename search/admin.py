@@ -0,0 +1,36 @@
+from django.contrib import admin
+
+from .backend import search_ids
+from .models import SearchDocument
+
+
+class FullTextSearchMixin:
+    """
+    افزودن نتایج جستجوی تمام متن به جستجوی پنل مدیریت
+    """
+    search_kind = None
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term and self.search_kind:
+            ids = search_ids(search_term, self.search_kind)
+            if ids:
+                results = results | queryset.filter(pk__in=ids)
+        return results, may_have_duplicates
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ['title', 'kind', 'object_id']
+    search_fields = ['object_id']
+    list_filter = ['kind']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
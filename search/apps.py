@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'search'
+    verbose_name = "جستجو"
+
+    def ready(self):
+        from . import signals
+        signals.connect_indexed_models()
@@ -0,0 +1,85 @@
+"""
+اجرای جستجو؛ روی SQLite با FTS5 از ایندکس SearchIndex و رتبه‌بندی bm25 استفاده می‌شود
+و روی سایر پایگاه داده‌ها به جستجوی ساده در جدول SearchDocument برمی‌گردد.
+"""
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from account.text import tokenize
+
+from .models import SearchDocument
+
+FTS_TABLE = "SearchIndex"
+# وزن ستون عنوان نسبت به متن در رتبه‌بندی bm25
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+_fts_tables = {}
+
+
+def fts_available(using=DEFAULT_DB_ALIAS):
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    if using not in _fts_tables:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+            found = cursor.fetchone() is not None
+        if not found:
+            # جدول ممکن است بعدا با migrate ساخته شود؛ نتیجه منفی ذخیره نمی‌شود
+            return False
+        _fts_tables[using] = True
+    return _fts_tables[using]
+
+
+def match_expression(tokens):
+    # هر کلمه به صورت پیشوندی جستجو می‌شود و همه کلمات باید در سند باشند
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search(query, kind=None, limit=50, using=DEFAULT_DB_ALIAS):
+    """
+    فهرست نتایج به ترتیب رتبه به صورت دیکشنری‌های kind, object_id, title, rank
+    """
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+    if fts_available(using):
+        return _fts_search(tokens, kind, limit, using)
+    return _fallback_search(tokens, kind, limit, using)
+
+
+def _fts_search(tokens, kind, limit, using):
+    sql = (f'SELECT d.kind, d.object_id, d.title, bm25("{FTS_TABLE}", %s, %s) AS rank '
+           f'FROM "{FTS_TABLE}" JOIN "SearchDocument" d ON d.id = "{FTS_TABLE}".rowid '
+           f'WHERE "{FTS_TABLE}" MATCH %s')
+    params = [TITLE_WEIGHT, BODY_WEIGHT, match_expression(tokens)]
+    if kind:
+        sql += " AND d.kind = %s"
+        params.append(kind)
+    sql += " ORDER BY rank LIMIT %s"
+    params.append(limit)
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        return [{'kind': row[0], 'object_id': row[1], 'title': row[2], 'rank': row[3]}
+                for row in cursor.fetchall()]
+
+
+def _fallback_search(tokens, kind, limit, using):
+    documents = SearchDocument.objects.using(using)
+    if kind:
+        documents = documents.filter(kind=kind)
+    for token in tokens:
+        documents = documents.filter(Q(title__contains=token) | Q(body__contains=token))
+    # اسنادی که همه کلمات در عنوانشان است بالاتر قرار می‌گیرند
+    title_match = Q()
+    for token in tokens:
+        title_match &= Q(title__contains=token)
+    documents = documents.annotate(
+        rank=Case(When(title_match, then=Value(0)), default=Value(1), output_field=IntegerField())
+    ).order_by('rank', 'title')
+    return list(documents.values('kind', 'object_id', 'title', 'rank')[:limit])
+
+
+def search_ids(query, kind, limit=1000, using=DEFAULT_DB_ALIAS):
+    return [result['object_id'] for result in search(query, kind, limit, using)]
@@ -0,0 +1,22 @@
+"""
+ساخت اسناد جستجو به صورت دسته‌ای و قابل ادامه؛ جایگزین بدون قفل طولانی برای rebuild_search_index
+"""
+from backfill.registry import register_backfill
+
+from .documents import INDEXED_MODELS
+from .models import SearchDocument
+
+
+def _register(model, kind, build):
+    @register_backfill(f'search_documents_{kind}', model)
+    def backfill(chunk):
+        documents = []
+        for instance in chunk:
+            title, body = build(instance)
+            documents.append(SearchDocument(kind=kind, object_id=str(instance.pk), title=title[:200], body=body))
+        SearchDocument.objects.bulk_create(documents, update_conflicts=True, unique_fields=['kind', 'object_id'],
+                                           update_fields=['title', 'body'])
+
+
+for model, (kind, build) in INDEXED_MODELS.items():
+    _register(model, kind, build)
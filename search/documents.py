@@ -0,0 +1,30 @@
+"""
+تبدیل اشیای مدل‌های account به سند قابل جستجو
+"""
+from account.models import Course, Professor, Student
+from account.text import normalize
+
+
+def _join(*parts):
+    return normalize(" ".join(str(part) for part in parts if part))
+
+
+def course_document(course):
+    return _join(course.name), _join(course.code)
+
+
+def student_document(student):
+    return (_join(student.first_Name, student.last_Name),
+            _join(student.student_ID, student.major, student.minor))
+
+
+def professor_document(professor):
+    return (_join(professor.first_Name, professor.last_Name),
+            _join(professor.personnel_code, professor.get_academic_rank_display(), professor.publications))
+
+
+INDEXED_MODELS = {
+    Course: ('course', course_document),
+    Student: ('student', student_document),
+    Professor: ('professor', professor_document),
+}
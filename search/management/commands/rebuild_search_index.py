@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from search.backend import FTS_TABLE, fts_available
+from search.documents import INDEXED_MODELS
+from search.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = "ساخت دوباره اسناد جستجو از روی دروس، دانشجویان و اساتید"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        with transaction.atomic():
+            SearchDocument.objects.all().delete()
+            for model, (kind, build) in INDEXED_MODELS.items():
+                batch = []
+                count = 0
+                for instance in model._default_manager.iterator(chunk_size=batch_size):
+                    title, body = build(instance)
+                    batch.append(SearchDocument(kind=kind, object_id=str(instance.pk), title=title[:200], body=body))
+                    if len(batch) >= batch_size:
+                        SearchDocument.objects.bulk_create(batch)
+                        count += len(batch)
+                        batch = []
+                SearchDocument.objects.bulk_create(batch)
+                count += len(batch)
+                self.stdout.write(f"{kind}: {count} documents")
+        if fts_available():
+            with connection.cursor() as cursor:
+                cursor.execute(f'INSERT INTO "{FTS_TABLE}"("{FTS_TABLE}") VALUES (\'optimize\')')
+        self.stdout.write(self.style.SUCCESS("Search index rebuilt."))
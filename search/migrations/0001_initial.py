@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('course', 'درس'), ('student', 'دانشجو'), ('professor', 'استاد')], max_length=20, verbose_name='نوع')),
+                ('object_id', models.CharField(max_length=64, verbose_name='شناسه شی')),
+                ('title', models.CharField(max_length=200, verbose_name='عنوان')),
+                ('body', models.TextField(blank=True, verbose_name='متن')),
+            ],
+            options={
+                'verbose_name': 'سند جستجو',
+                'verbose_name_plural': 'اسناد جستجو',
+                'db_table': 'SearchDocument',
+                'unique_together': {('kind', 'object_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+from django.db import migrations
+from django.db.utils import OperationalError
+
+CREATE_SQL = [
+    """CREATE VIRTUAL TABLE "SearchIndex" USING fts5(
+        title, body,
+        content='SearchDocument', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER "SearchDocument_ai" AFTER INSERT ON "SearchDocument" BEGIN
+        INSERT INTO "SearchIndex"(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """CREATE TRIGGER "SearchDocument_ad" AFTER DELETE ON "SearchDocument" BEGIN
+        INSERT INTO "SearchIndex"("SearchIndex", rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END""",
+    """CREATE TRIGGER "SearchDocument_au" AFTER UPDATE ON "SearchDocument" BEGIN
+        INSERT INTO "SearchIndex"("SearchIndex", rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO "SearchIndex"(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END""",
+    """INSERT INTO "SearchIndex"("SearchIndex") VALUES ('rebuild')""",
+]
+
+DROP_SQL = [
+    'DROP TRIGGER IF EXISTS "SearchDocument_au"',
+    'DROP TRIGGER IF EXISTS "SearchDocument_ad"',
+    'DROP TRIGGER IF EXISTS "SearchDocument_ai"',
+    'DROP TABLE IF EXISTS "SearchIndex"',
+]
+
+
+def fts5_supported(schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return False
+    with schema_editor.connection.cursor() as cursor:
+        try:
+            cursor.execute('CREATE VIRTUAL TABLE temp."fts5_probe" USING fts5(probe)')
+            cursor.execute('DROP TABLE temp."fts5_probe"')
+        except OperationalError:
+            return False
+    return True
+
+
+def create_fts_index(apps, schema_editor):
+    # روی پایگاه داده‌های بدون FTS5 جستجو از جدول SearchDocument انجام می‌شود
+    if not fts5_supported(schema_editor):
+        return
+    for sql in CREATE_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_fts_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in DROP_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
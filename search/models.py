@@ -0,0 +1,27 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    متن نرمال شده هر شی قابل جستجو؛ جدول FTS5 به نام SearchIndex با تریگر از روی آن ساخته می‌شود
+    """
+
+    class Meta:
+        verbose_name = "سند جستجو"
+        verbose_name_plural = "اسناد جستجو"
+        db_table = "SearchDocument"
+        unique_together = ['kind', 'object_id']
+
+    KIND_CHOICES = {
+        'course': 'درس',
+        'student': 'دانشجو',
+        'professor': 'استاد',
+    }
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, verbose_name="نوع")
+    object_id = models.CharField(max_length=64, verbose_name="شناسه شی")
+    title = models.CharField(max_length=200, verbose_name="عنوان")
+    body = models.TextField(blank=True, verbose_name="متن")
+
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.title}"
@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save
+
+from .documents import INDEXED_MODELS
+from .models import SearchDocument
+
+
+def index_instance(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    kind, build = INDEXED_MODELS[sender]
+    title, body = build(instance)
+    SearchDocument.objects.update_or_create(kind=kind, object_id=str(instance.pk),
+                                            defaults={'title': title[:200], 'body': body})
+
+
+def unindex_instance(sender, instance, **kwargs):
+    kind, _ = INDEXED_MODELS[sender]
+    SearchDocument.objects.filter(kind=kind, object_id=str(instance.pk)).delete()
+
+
+def connect_indexed_models():
+    for model in INDEXED_MODELS:
+        uid = f"search:{model._meta.label}"
+        post_save.connect(index_instance, sender=model, dispatch_uid=uid)
+        post_delete.connect(unindex_instance, sender=model, dispatch_uid=uid)
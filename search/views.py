@@ -0,0 +1,20 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import JsonResponse
+
+from .backend import search
+from .models import SearchDocument
+
+MAX_LIMIT = 100
+
+
+@staff_member_required
+def searchView(request):
+    query = request.GET.get('q', '')
+    kind = request.GET.get('kind') or None
+    if kind is not None and kind not in SearchDocument.KIND_CHOICES:
+        return JsonResponse({'error': "نوع جستجو معتبر نیست"}, status=400)
+    try:
+        limit = max(1, min(int(request.GET.get('limit', 20)), MAX_LIMIT))
+    except ValueError:
+        return JsonResponse({'error': "تعداد نتایج معتبر نیست"}, status=400)
+    return JsonResponse({'query': query, 'results': search(query, kind, limit)})
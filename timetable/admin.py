@@ -0,0 +1,49 @@
+from django.contrib import admin
+
+from .models import Cohort, ProfessorAvailability, Room, TimetableEntry
+
+
+@admin.register(Room)
+class RoomAdmin(admin.ModelAdmin):
+    list_display = ['code', 'name', 'capacity', 'faculty']
+    search_fields = ['code', 'name']
+
+    list_filter = ()
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+
+@admin.register(Cohort)
+class CohortAdmin(admin.ModelAdmin):
+    list_display = ['name', 'department', 'size']
+    search_fields = ['name']
+    list_filter = ['department']
+
+    filter_horizontal = ['courses']
+    fieldsets = ()
+    ordering = ()
+
+
+@admin.register(ProfessorAvailability)
+class ProfessorAvailabilityAdmin(admin.ModelAdmin):
+    list_display = ['professor', 'day', 'period', 'level']
+    list_filter = ['level', 'day']
+    raw_id_fields = ['professor']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
+
+
+@admin.register(TimetableEntry)
+class TimetableEntryAdmin(admin.ModelAdmin):
+    list_display = ['course', 'session', 'term', 'day', 'period', 'room', 'professor']
+    search_fields = ['course__code', 'course__name']
+    list_filter = ['term', 'day', 'room']
+    list_select_related = ['course', 'room', 'professor']
+    raw_id_fields = ['course', 'professor']
+
+    filter_horizontal = ()
+    fieldsets = ()
+    ordering = ()
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class TimetableConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'timetable'
+    verbose_name = "برنامه هفتگی"
@@ -0,0 +1,56 @@
+"""
+ساخت دانشکده‌های مصنوعی برای سنجش سرعت حل کننده جدول زمانی
+"""
+import random
+
+from .solver import Event, Problem, Room
+
+# اندازه‌ها نزدیک به یک دانشکده بزرگ: هر درس 3 واحدی دو جلسه در هفته دارد
+SIZES = {
+    'small': {'courses': 120, 'professors': 45, 'rooms': 15, 'cohorts': 20},
+    'medium': {'courses': 350, 'professors': 130, 'rooms': 35, 'cohorts': 60},
+    'large': {'courses': 800, 'professors': 300, 'rooms': 80, 'cohorts': 140},
+}
+
+
+def synthetic_problem(courses, professors, rooms, cohorts, days=6, periods=5, seed=0):
+    rng = random.Random(seed)
+    slots = days * periods
+    professor_ids = [f"P{number:04d}" for number in range(professors)]
+    room_list = [Room(f"R{number:03d}", rng.choice((30, 40, 60, 90, 120))) for number in range(rooms)]
+
+    # هر گروه دانشجویی حدود 6 درس همزمان می‌گیرد
+    course_groups = {f"C{number:04d}": [] for number in range(courses)}
+    for cohort in range(cohorts):
+        for course in rng.sample(sorted(course_groups), min(6, courses)):
+            course_groups[course].append(f"G{cohort:03d}")
+
+    events = []
+    for course, groups in course_groups.items():
+        teachers = tuple(rng.sample(professor_ids, rng.choice((1, 1, 2))))
+        size = rng.choice((20, 30, 40, 60, 80))
+        for session in range(rng.choice((1, 2, 2))):
+            events.append(Event(f"{course}-{session}", course, teachers, tuple(groups), size))
+
+    unavailable = {}
+    preferences = {}
+    for professor in professor_ids:
+        unavailable[professor] = set(rng.sample(range(slots), slots // 5))
+        preferences[professor] = {slot: rng.choice((-2, 3)) for slot in rng.sample(range(slots), slots // 6)}
+    return Problem(events, room_list, days, periods, unavailable, preferences)
+
+
+def run(size='medium', time_budget=10.0, seed=0, progress=None):
+    """
+    حل یک مسئله مصنوعی و سپس حل دوباره آن پس از یک تغییر (غیبت یک استاد در یک روز)
+    """
+    from .solver import solve
+
+    problem = synthetic_problem(seed=seed, **SIZES[size])
+    first = solve(problem, time_budget=time_budget, seed=seed, progress=progress)
+
+    professor = problem.events[0].professors[0]
+    problem.unavailable[professor] = problem.unavailable[professor] | set(range(problem.periods))
+    second = solve(problem, time_budget=time_budget, seed=seed, previous=first.assignment, progress=progress)
+    moved = sum(1 for event, option in second.assignment.items() if first.assignment[event] != option)
+    return problem, first, second, moved
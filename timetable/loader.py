@@ -0,0 +1,125 @@
+"""
+تبدیل داده‌های پایگاه داده به مسئله حل کننده و ذخیره جدول حاصل
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+
+from account.models import Course, Professor
+
+from . import solver
+from .models import Cohort, ProfessorAvailability, Room, TimetableEntry
+
+# جریمه نرم هر وضعیت حضور استاد؛ منفی یعنی زمان مطلوب
+AVAILABILITY_PENALTY = {
+    'undesired': 3,
+    'preferred': -2,
+}
+
+
+def grid():
+    return getattr(settings, 'TIMETABLE_DAYS', 6), getattr(settings, 'TIMETABLE_PERIODS', 5)
+
+
+def sessions_per_week(units):
+    return 2 if units >= 3 else 1
+
+
+def build_problem(department=None, term=None):
+    """
+    مسئله شامل همه دروسی است که استادی برای آن‌ها ثبت شده یا در یک گروه دانشجویی هستند.
+    اگر فقط یک دپارتمان حل شود، جلسات ذخیره شده سایر دپارتمان‌ها در نیمسال term به عنوان
+    اشغال ثابت کلاس‌ها، اساتید و گروه‌ها در نظر گرفته می‌شوند.
+    """
+    days, periods = grid()
+    taught = Professor.courses_taught.through.objects.values_list('course_id', 'professor_id')
+    cohort_courses = Cohort.courses.through.objects.values_list('course_id', 'cohort_id', 'cohort__size')
+    courses = Course.objects.all()
+    if department is not None:
+        taught = taught.filter(course__department=department)
+        cohort_courses = cohort_courses.filter(course__department=department)
+        courses = courses.filter(department=department)
+
+    professors = defaultdict(list)
+    for course, professor in taught:
+        professors[course].append(professor)
+    groups = defaultdict(list)
+    sizes = defaultdict(int)
+    for course, cohort, size in cohort_courses:
+        groups[course].append(cohort)
+        sizes[course] += size
+
+    events = []
+    for code, units in courses.filter(code__in=set(professors) | set(groups)).values_list('code', 'units'):
+        for session in range(sessions_per_week(units)):
+            events.append(solver.Event(f"{code}-{session}", code, tuple(sorted(professors[code])),
+                                       tuple(sorted(groups[code])), sizes[code]))
+
+    rooms = [solver.Room(code, capacity) for code, capacity in Room.objects.order_by('code').values_list('code', 'capacity')]
+
+    unavailable = defaultdict(set)
+    preferences = defaultdict(dict)
+    for professor, day, period, level in ProfessorAvailability.objects.values_list('professor_id', 'day', 'period', 'level'):
+        if day >= days or not 1 <= period <= periods:
+            continue
+        slot = day * periods + period - 1
+        if level == 'unavailable':
+            unavailable[professor].add(slot)
+        else:
+            preferences[professor][slot] = AVAILABILITY_PENALTY[level]
+    problem = solver.Problem(events, rooms, days, periods, dict(unavailable), dict(preferences))
+    if department is not None and term is not None:
+        _load_fixed_occupancy(problem, TimetableEntry.objects.filter(term=term).exclude(course__department=department))
+    return problem
+
+
+def _load_fixed_occupancy(problem, entries):
+    busy_rooms, busy_professors, busy_groups = defaultdict(set), defaultdict(set), defaultdict(set)
+    cohorts = defaultdict(list)
+    for course, cohort in Cohort.courses.through.objects.filter(
+            course_id__in=entries.values('course_id')).values_list('course_id', 'cohort_id'):
+        cohorts[course].append(cohort)
+    for course, day, period, room, professor in entries.values_list('course_id', 'day', 'period', 'room_id',
+                                                                   'professor_id'):
+        if day >= problem.days or not 1 <= period <= problem.periods:
+            continue
+        slot = day * problem.periods + period - 1
+        busy_rooms[room].add(slot)
+        if professor is not None:
+            busy_professors[professor].add(slot)
+        for cohort in cohorts[course]:
+            busy_groups[cohort].add(slot)
+    problem.busy_rooms, problem.busy_professors, problem.busy_groups = (
+        dict(busy_rooms), dict(busy_professors), dict(busy_groups))
+
+
+def load_assignment(term):
+    """
+    جدول ذخیره شده یک نیمسال به شکل Result.assignment برای حل دوباره
+    """
+    _, periods = grid()
+    entries = TimetableEntry.objects.filter(term=term).values_list('course_id', 'session', 'day', 'period', 'room_id',
+                                                                   'professor_id')
+    return {f"{course}-{session}": (day * periods + period - 1, room, professor)
+            for course, session, day, period, room, professor in entries}
+
+
+@transaction.atomic
+def save_assignment(term, problem, assignment, department=None):
+    """
+    جایگزینی جدول ذخیره شده نیمسال؛ با department فقط جلسات دروس همان دپارتمان جایگزین می‌شوند
+    """
+    events = {event.id: event for event in problem.events}
+    entries = []
+    for event_id, (slot, room, professor) in assignment.items():
+        day, period = divmod(slot, problem.periods)
+        session = int(event_id.rsplit('-', 1)[1])
+        entries.append(TimetableEntry(term=term, course_id=events[event_id].course, session=session,
+                                      professor_id=professor, room_id=room, day=day, period=period + 1))
+    previous = TimetableEntry.objects.filter(term=term)
+    if department is not None:
+        previous = previous.filter(course__department=department)
+    previous.delete()
+    TimetableEntry.objects.bulk_create(entries)
+    return len(entries)
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from account.models import Department
+from timetable.loader import build_problem, load_assignment, save_assignment
+from timetable.solver import solve
+
+
+class Command(BaseCommand):
+    help = "ساخت برنامه هفتگی یک نیمسال؛ اگر برنامه‌ای از قبل باشد با کمترین جابجایی بازسازی می‌شود"
+
+    def add_arguments(self, parser):
+        parser.add_argument('term', help="نیمسال به صورت سال و شماره نیمسال، مثلا 14031")
+        parser.add_argument('--department', help="کد دپارتمان")
+        parser.add_argument('--budget', type=float, default=10.0, help="حداکثر زمان حل (ثانیه)")
+        parser.add_argument('--seed', type=int)
+        parser.add_argument('--fresh', action='store_true', help="برنامه قبلی نادیده گرفته شود")
+        parser.add_argument('--dry-run', action='store_true')
+
+    def handle(self, *args, **options):
+        department = None
+        if options['department']:
+            department = Department.objects.filter(pk=options['department']).first()
+            if department is None:
+                raise CommandError(f"Unknown department {options['department']!r}")
+
+        problem = build_problem(department, options['term'])
+        if not problem.events:
+            raise CommandError("No courses with professors or cohorts to schedule.")
+        previous = None if options['fresh'] else load_assignment(options['term']) or None
+        self.stdout.write(f"Scheduling {len(problem.events)} sessions in {len(problem.rooms)} rooms"
+                          f"{' from the existing timetable' if previous else ''}.")
+
+        def progress(status):
+            self.stdout.write(f"  {status['elapsed']:.1f}s: hard={status['best_hard']} soft={status['best_soft']}")
+
+        result = solve(problem, time_budget=options['budget'], seed=options['seed'], progress=progress,
+                       previous=previous, progress_every=20000)
+        self.stdout.write(f"Finished after {result.iterations} iterations in {result.elapsed:.1f}s: "
+                          f"hard={result.hard} soft={result.soft}.")
+        if previous:
+            moved = sum(1 for event, option in result.assignment.items()
+                        if event in previous and previous[event] != option)
+            self.stdout.write(f"{moved} sessions moved.")
+        if not result.feasible:
+            self.stderr.write(self.style.WARNING("The timetable still has conflicts; increase --budget or add rooms."))
+        if options['dry_run']:
+            return
+        saved = save_assignment(options['term'], problem, result.assignment, department)
+        self.stdout.write(self.style.SUCCESS(f"Saved {saved} sessions for term {options['term']}."))
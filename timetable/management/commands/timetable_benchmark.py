@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from timetable.benchmark import SIZES, run
+
+
+class Command(BaseCommand):
+    help = "سنجش سرعت حل کننده برنامه هفتگی روی دانشکده‌های مصنوعی"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--size', choices=sorted(SIZES), action='append', help="پیش‌فرض: همه اندازه‌ها")
+        parser.add_argument('--budget', type=float, default=10.0, help="حداکثر زمان هر حل (ثانیه)")
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        for size in options['size'] or SIZES:
+            problem, first, second, moved = run(size, options['budget'], options['seed'])
+            self.stdout.write(
+                f"{size}: {len(problem.events)} sessions | "
+                f"solve {first.elapsed:.1f}s hard={first.hard} soft={first.soft} | "
+                f"re-solve {second.elapsed:.1f}s hard={second.hard} soft={second.soft} moved={moved}")
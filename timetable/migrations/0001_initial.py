@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 12:49
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('account', '0009_enrollment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Cohort',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, verbose_name='نام گروه')),
+                ('size', models.PositiveSmallIntegerField(default=0, verbose_name='تعداد دانشجویان')),
+                ('courses', models.ManyToManyField(related_name='cohorts', to='account.course', verbose_name='دروس')),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.department', verbose_name='دپارتمان')),
+            ],
+            options={
+                'verbose_name': 'گروه دانشجویی',
+                'verbose_name_plural': 'گروه\u200cهای دانشجویی',
+                'db_table': 'Cohort',
+            },
+        ),
+        migrations.CreateModel(
+            name='Room',
+            fields=[
+                ('code', models.CharField(max_length=10, primary_key=True, serialize=False, verbose_name='کد کلاس')),
+                ('name', models.CharField(blank=True, max_length=50, verbose_name='نام کلاس')),
+                ('capacity', models.PositiveSmallIntegerField(verbose_name='ظرفیت')),
+                ('faculty', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='account.faculty', verbose_name='دانشکده')),
+            ],
+            options={
+                'verbose_name': 'کلاس',
+                'verbose_name_plural': 'کلاس\u200cها',
+                'db_table': 'Room',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProfessorAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.PositiveSmallIntegerField(choices=[(0, 'شنبه'), (1, 'یکشنبه'), (2, 'دوشنبه'), (3, 'سه\u200cشنبه'), (4, 'چهارشنبه'), (5, 'پنجشنبه')], verbose_name='روز')),
+                ('period', models.PositiveSmallIntegerField(verbose_name='زنگ')),
+                ('level', models.CharField(choices=[('unavailable', 'غیرقابل حضور'), ('undesired', 'نامطلوب'), ('preferred', 'مطلوب')], max_length=12, verbose_name='وضعیت')),
+                ('professor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability', to='account.professor', verbose_name='استاد')),
+            ],
+            options={
+                'verbose_name': 'زمان حضور استاد',
+                'verbose_name_plural': 'زمان\u200cهای حضور اساتید',
+                'db_table': 'ProfessorAvailability',
+                'unique_together': {('professor', 'day', 'period')},
+            },
+        ),
+        migrations.CreateModel(
+            name='TimetableEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=5, validators=[django.core.validators.RegexValidator(message='نیمسال باید به صورت سال و شماره نیمسال باشد', regex='^\\d{4}[1-3]$')], verbose_name='نیمسال')),
+                ('session', models.PositiveSmallIntegerField(default=0, verbose_name='جلسه')),
+                ('day', models.PositiveSmallIntegerField(choices=[(0, 'شنبه'), (1, 'یکشنبه'), (2, 'دوشنبه'), (3, 'سه\u200cشنبه'), (4, 'چهارشنبه'), (5, 'پنجشنبه')], verbose_name='روز')),
+                ('period', models.PositiveSmallIntegerField(verbose_name='زنگ')),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='account.course', verbose_name='درس')),
+                ('professor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='account.professor', verbose_name='استاد')),
+                ('room', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='timetable.room', verbose_name='کلاس')),
+            ],
+            options={
+                'verbose_name': 'جلسه',
+                'verbose_name_plural': 'برنامه هفتگی',
+                'db_table': 'TimetableEntry',
+                'indexes': [models.Index(fields=['term', 'day', 'period'], name='timetable_term_slot_idx')],
+                'unique_together': {('term', 'course', 'session')},
+            },
+        ),
+    ]
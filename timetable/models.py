@@ -0,0 +1,107 @@
+from django.core.validators import RegexValidator
+from django.db import models
+
+DAY_CHOICES = {
+    0: 'شنبه',
+    1: 'یکشنبه',
+    2: 'دوشنبه',
+    3: 'سه‌شنبه',
+    4: 'چهارشنبه',
+    5: 'پنجشنبه',
+}
+
+
+class Room(models.Model):
+    """
+    کلاس درس
+    """
+
+    class Meta:
+        verbose_name = "کلاس"
+        verbose_name_plural = "کلاس‌ها"
+        db_table = "Room"
+
+    code = models.CharField(max_length=10, primary_key=True, verbose_name="کد کلاس")
+    name = models.CharField(max_length=50, blank=True, verbose_name="نام کلاس")
+    capacity = models.PositiveSmallIntegerField(verbose_name="ظرفیت")
+    faculty = models.ForeignKey("account.Faculty", null=True, blank=True, on_delete=models.SET_NULL,
+                                verbose_name="دانشکده")
+
+    def __str__(self):
+        return self.name or self.code
+
+
+class Cohort(models.Model):
+    """
+    گروه دانشجویانی که دروسشان در یک نیمسال نباید تداخل زمانی داشته باشد
+    """
+
+    class Meta:
+        verbose_name = "گروه دانشجویی"
+        verbose_name_plural = "گروه‌های دانشجویی"
+        db_table = "Cohort"
+
+    name = models.CharField(max_length=100, verbose_name="نام گروه")
+    department = models.ForeignKey("account.Department", on_delete=models.CASCADE, verbose_name="دپارتمان")
+    size = models.PositiveSmallIntegerField(default=0, verbose_name="تعداد دانشجویان")
+    courses = models.ManyToManyField("account.Course", related_name="cohorts", verbose_name="دروس")
+
+    def __str__(self):
+        return self.name
+
+
+class ProfessorAvailability(models.Model):
+    """
+    حضور یا ترجیح زمانی استاد در یک خانه از برنامه هفتگی
+    """
+
+    class Meta:
+        verbose_name = "زمان حضور استاد"
+        verbose_name_plural = "زمان‌های حضور اساتید"
+        db_table = "ProfessorAvailability"
+        unique_together = ['professor', 'day', 'period']
+
+    LEVEL_CHOICES = {
+        'unavailable': 'غیرقابل حضور',
+        'undesired': 'نامطلوب',
+        'preferred': 'مطلوب',
+    }
+
+    professor = models.ForeignKey("account.Professor", on_delete=models.CASCADE, related_name="availability",
+                                  verbose_name="استاد")
+    day = models.PositiveSmallIntegerField(choices=DAY_CHOICES, verbose_name="روز")
+    period = models.PositiveSmallIntegerField(verbose_name="زنگ")
+    level = models.CharField(max_length=12, choices=LEVEL_CHOICES, verbose_name="وضعیت")
+
+    def __str__(self):
+        return f"{self.professor_id} - {self.get_day_display()} {self.period}"
+
+
+class TimetableEntry(models.Model):
+    """
+    یک جلسه هفتگی درس در برنامه یک نیمسال
+    """
+
+    class Meta:
+        verbose_name = "جلسه"
+        verbose_name_plural = "برنامه هفتگی"
+        db_table = "TimetableEntry"
+        unique_together = ['term', 'course', 'session']
+        indexes = [
+            models.Index(fields=['term', 'day', 'period'], name='timetable_term_slot_idx'),
+        ]
+
+    term = models.CharField(
+        max_length=5,
+        validators=[RegexValidator(regex=r'^\d{4}[1-3]$', message="نیمسال باید به صورت سال و شماره نیمسال باشد")],
+        verbose_name="نیمسال")
+    course = models.ForeignKey("account.Course", on_delete=models.CASCADE, verbose_name="درس")
+    session = models.PositiveSmallIntegerField(default=0, verbose_name="جلسه")
+    professor = models.ForeignKey("account.Professor", null=True, blank=True, on_delete=models.SET_NULL,
+                                  verbose_name="استاد")
+    room = models.ForeignKey(Room, on_delete=models.PROTECT, verbose_name="کلاس")
+    day = models.PositiveSmallIntegerField(choices=DAY_CHOICES, verbose_name="روز")
+    period = models.PositiveSmallIntegerField(verbose_name="زنگ")
+
+    def __str__(self):
+        return f"{self.course_id} - {self.get_day_display()} {self.period}"
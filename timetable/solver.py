@@ -0,0 +1,280 @@
+"""
+حل کننده جدول زمانی با جستجوی محلی
+
+هر جلسه درس (Event) باید یک خانه زمانی، یک کلاس و یکی از اساتید مجاز آن درس را بگیرد.
+قیود سخت: تداخل کلاس، تداخل استاد، تداخل دروس یک گروه دانشجویی (و جلسات یک درس)،
+زمان‌های غیرقابل حضور استاد و ظرفیت کلاس. قیود نرم: ترجیحات زمانی اساتید، ساعت‌های آخر روز،
+چند جلسه یک درس در یک روز و (در حل دوباره) جابجایی نسبت به جدول قبلی.
+
+خانه‌هایی که از قبل (مثلا توسط جدول دپارتمان‌های دیگر) برای یک کلاس، استاد یا گروه پر شده‌اند
+به عنوان اشغال ثابت در شمارنده‌ها قرار می‌گیرند و قرار دادن جلسه در آن‌ها تداخل سخت است.
+
+حل با یک چیدمان حریصانه شروع و با Simulated Annealing ادامه پیدا می‌کند. هزینه هر حرکت با
+شمارنده‌های اشغال (کلاس/استاد/گروه در هر خانه زمانی) به صورت افزایشی حساب می‌شود،
+بنابراین هر گام مستقل از اندازه مسئله است. این ماژول به ORM وابسته نیست.
+"""
+import math
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+HARD_WEIGHT = 1000
+LATE_PENALTY = 2
+SAME_DAY_PENALTY = 5
+STABILITY_PENALTY = 3
+
+
+@dataclass(frozen=True)
+class Event:
+    """
+    یک جلسه هفتگی یک درس
+    """
+    id: str
+    course: str
+    professors: tuple = ()
+    groups: tuple = ()
+    size: int = 0
+
+
+@dataclass(frozen=True)
+class Room:
+    id: str
+    capacity: int = 0
+
+
+@dataclass
+class Problem:
+    events: list
+    rooms: list
+    days: int
+    periods: int
+    # استاد -> مجموعه خانه‌های زمانی غیرقابل حضور
+    unavailable: dict = field(default_factory=dict)
+    # استاد -> {خانه زمانی: جریمه}؛ جریمه منفی یعنی زمان مطلوب
+    preferences: dict = field(default_factory=dict)
+    # شناسه کلاس / استاد / گروه -> مجموعه خانه‌های زمانی که بیرون از این مسئله پر شده‌اند
+    busy_rooms: dict = field(default_factory=dict)
+    busy_professors: dict = field(default_factory=dict)
+    busy_groups: dict = field(default_factory=dict)
+
+    @property
+    def slots(self):
+        return self.days * self.periods
+
+
+@dataclass
+class Result:
+    # شناسه جلسه -> (خانه زمانی، کلاس، استاد)
+    assignment: dict
+    hard: int
+    soft: int
+    iterations: int
+    elapsed: float
+
+    @property
+    def feasible(self):
+        return self.hard == 0
+
+
+class State:
+    """
+    چیدمان جاری همراه با شمارنده‌های اشغال برای محاسبه افزایشی هزینه
+    """
+
+    def __init__(self, problem, previous=None):
+        self.problem = problem
+        self.events = problem.events
+        self.rooms = problem.rooms
+        self.previous = previous or {}
+        self.room_use = defaultdict(int)
+        self.professor_use = defaultdict(int)
+        self.group_use = defaultdict(int)
+        self.course_day = defaultdict(int)
+        self.assignment = [None] * len(self.events)
+        self.hard = 0
+        self.soft = 0
+        # جلسات یک درس نباید همزمان باشند؛ درس به عنوان یک گروه ضمنی اضافه می‌شود
+        self.groups = [tuple(event.groups) + (('course', event.course),) for event in self.events]
+        positions = {room.id: position for position, room in enumerate(self.rooms)}
+        for room, slots in problem.busy_rooms.items():
+            if room in positions:
+                for slot in slots:
+                    self.room_use[(positions[room], slot)] += 1
+        for professor, slots in problem.busy_professors.items():
+            for slot in slots:
+                self.professor_use[(professor, slot)] += 1
+        for group, slots in problem.busy_groups.items():
+            for slot in slots:
+                self.group_use[(group, slot)] += 1
+
+    def cost(self, index, option):
+        """
+        هزینه (سخت، نرم) قرار دادن جلسه index در option با فرض اینکه خودش در شمارنده‌ها نیست
+        """
+        slot, room, professor = option
+        event = self.events[index]
+        problem = self.problem
+        hard = self.room_use[(room, slot)]
+        if self.rooms[room].capacity and event.size > self.rooms[room].capacity:
+            hard += 1
+        for group in self.groups[index]:
+            hard += self.group_use[(group, slot)]
+        day, period = divmod(slot, problem.periods)
+        soft = self.course_day[(event.course, day)] * SAME_DAY_PENALTY
+        if period == problem.periods - 1:
+            soft += LATE_PENALTY
+        if professor is not None:
+            hard += self.professor_use[(professor, slot)]
+            if slot in problem.unavailable.get(professor, ()):
+                hard += 1
+            soft += problem.preferences.get(professor, {}).get(slot, 0)
+        previous = self.previous.get(event.id)
+        if previous is not None and previous != option:
+            soft += STABILITY_PENALTY
+        return hard, soft
+
+    def _apply(self, index, option, sign):
+        slot, room, professor = option
+        self.room_use[(room, slot)] += sign
+        if professor is not None:
+            self.professor_use[(professor, slot)] += sign
+        for group in self.groups[index]:
+            self.group_use[(group, slot)] += sign
+        self.course_day[(self.events[index].course, slot // self.problem.periods)] += sign
+
+    def place(self, index, option):
+        hard, soft = self.cost(index, option)
+        self._apply(index, option, 1)
+        self.assignment[index] = option
+        self.hard += hard
+        self.soft += soft
+
+    def unplace(self, index):
+        option = self.assignment[index]
+        self._apply(index, option, -1)
+        self.assignment[index] = None
+        hard, soft = self.cost(index, option)
+        self.hard -= hard
+        self.soft -= soft
+        return option
+
+    def conflicted(self):
+        conflicted = []
+        for index, option in enumerate(self.assignment):
+            self._apply(index, option, -1)
+            hard, _ = self.cost(index, option)
+            self._apply(index, option, 1)
+            if hard:
+                conflicted.append(index)
+        return conflicted
+
+    def random_option(self, index, rng):
+        professors = self.events[index].professors
+        return (rng.randrange(self.problem.slots), rng.randrange(len(self.rooms)),
+                rng.choice(professors) if professors else None)
+
+    def best_option(self, index, rng, samples):
+        best, best_cost = None, None
+        current = self.assignment[index]
+        candidates = [self.random_option(index, rng) for _ in range(samples)]
+        previous = self.previous.get(self.events[index].id)
+        if previous is not None:
+            candidates.append(previous)
+        for option in candidates:
+            if option == current:
+                continue
+            hard, soft = self.cost(index, option)
+            total = hard * HARD_WEIGHT + soft
+            if best_cost is None or total < best_cost:
+                best, best_cost = option, total
+        return best, best_cost
+
+
+def _decode(problem, assignment):
+    return {event.id: (slot, problem.rooms[room].id, professor)
+            for event, (slot, room, professor) in zip(problem.events, assignment)}
+
+
+def solve(problem, time_budget=10.0, seed=None, progress=None, previous=None, progress_every=2000,
+          samples=30, initial_temperature=50.0, patience=20000):
+    """
+    حل مسئله در حداکثر time_budget ثانیه.
+
+    previous یک جدول قبلی (خروجی Result.assignment) است؛ جلساتی که در آن هستند از جای قبلی
+    شروع می‌کنند و جابجاییشان جریمه دارد، بنابراین پس از یک تغییر کوچک فقط بخش کوچکی از جدول
+    عوض می‌شود. progress هر progress_every گام با یک دیکشنری وضعیت صدا زده می‌شود و اگر
+    False برگرداند حل متوقف می‌شود. اگر جدول بدون تداخل باشد و patience گام بهبودی رخ ندهد
+    حل پیش از پایان زمان متوقف می‌شود.
+    """
+    started = time.monotonic()
+    rng = random.Random(seed)
+    if not problem.events:
+        return Result({}, 0, 0, 0, 0.0)
+    if not problem.rooms or not problem.slots:
+        raise ValueError("Timetable needs at least one room and one time slot")
+
+    rooms = {room.id: position for position, room in enumerate(problem.rooms)}
+    previous_options = {}
+    for event in problem.events:
+        old = (previous or {}).get(event.id)
+        if old is None:
+            continue
+        slot, room_id, professor = old
+        room = rooms.get(room_id)
+        if room is not None and slot < problem.slots and (professor in event.professors or not event.professors):
+            previous_options[event.id] = (slot, room, professor)
+
+    state = State(problem, previous_options)
+    # جلسات با قیود بیشتر ابتدا چیده می‌شوند
+    order = sorted(range(len(problem.events)),
+                   key=lambda index: (problem.events[index].id not in previous_options,
+                                      len(problem.events[index].professors) or 99,
+                                      -len(problem.events[index].groups)))
+    for index in order:
+        option = previous_options.get(problem.events[index].id)
+        if option is None:
+            option, _ = state.best_option(index, rng, samples * 3)
+        state.place(index, option)
+
+    best_assignment, best_hard, best_soft = list(state.assignment), state.hard, state.soft
+    # در حل دوباره دما پایین شروع می‌شود تا جدول قبلی بی‌دلیل به هم نریزد
+    temperature = initial_temperature / 10 if previous_options else initial_temperature
+    conflicted = state.conflicted()
+    iteration = improved_at = 0
+    while True:
+        elapsed = time.monotonic() - started
+        if elapsed >= time_budget or (best_hard == 0 and iteration - improved_at > patience):
+            break
+        iteration += 1
+        if iteration % 500 == 0:
+            conflicted = state.conflicted()
+        if conflicted and rng.random() < 0.8:
+            index = rng.choice(conflicted)
+        else:
+            index = rng.randrange(len(problem.events))
+
+        old = state.assignment[index]
+        state.unplace(index)
+        old_hard, old_soft = state.cost(index, old)
+        option, new_cost = state.best_option(index, rng, samples)
+        delta = new_cost - (old_hard * HARD_WEIGHT + old_soft) if option is not None else 0
+        if option is not None and (delta <= 0 or rng.random() < math.exp(-delta / max(temperature, 1e-6))):
+            state.place(index, option)
+        else:
+            state.place(index, old)
+
+        if (state.hard, state.soft) < (best_hard, best_soft):
+            best_assignment, best_hard, best_soft = list(state.assignment), state.hard, state.soft
+            improved_at = iteration
+        temperature *= 0.9995
+        if temperature < 0.05:
+            temperature = initial_temperature / 5
+
+        if progress is not None and iteration % progress_every == 0:
+            keep_going = progress({'iteration': iteration, 'elapsed': elapsed, 'hard': state.hard,
+                                   'soft': state.soft, 'best_hard': best_hard, 'best_soft': best_soft})
+            if keep_going is False:
+                break
+
+    return Result(_decode(problem, best_assignment), best_hard, best_soft, iteration, time.monotonic() - started)
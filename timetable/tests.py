@@ -0,0 +1,144 @@
+import jdatetime
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from account.models import Course, Department
+
+from . import solver
+from .loader import build_problem, load_assignment, save_assignment
+from .models import Cohort, Room, TimetableEntry
+
+
+def solve(problem, **kwargs):
+    kwargs.setdefault('seed', 7)
+    kwargs.setdefault('time_budget', 30)
+    kwargs.setdefault('patience', 500)
+    return solver.solve(problem, **kwargs)
+
+
+class SolverTests(SimpleTestCase):
+
+    def assertValid(self, problem, result):
+        """
+        بررسی مستقل قیود سخت روی خروجی
+        """
+        self.assertEqual(set(result.assignment), {event.id for event in problem.events})
+        capacity = {room.id: room.capacity for room in problem.rooms}
+        used = set()
+        for event in problem.events:
+            slot, room, professor = result.assignment[event.id]
+            self.assertLess(slot, problem.slots)
+            self.assertLessEqual(event.size, capacity[room])
+            self.assertNotIn(slot, problem.busy_rooms.get(room, ()))
+            keys = [('room', room), ('course', event.course)] + [('group', group) for group in event.groups]
+            if event.professors:
+                self.assertIn(professor, event.professors)
+                self.assertNotIn(slot, problem.unavailable.get(professor, ()))
+                self.assertNotIn(slot, problem.busy_professors.get(professor, ()))
+                keys.append(('professor', professor))
+            for group in event.groups:
+                self.assertNotIn(slot, problem.busy_groups.get(group, ()))
+            for key in keys:
+                self.assertNotIn((key, slot), used, event.id)
+                used.add((key, slot))
+
+    def problem(self, **kwargs):
+        events = [
+            solver.Event('A-0', 'A', ('p1',), ('g1',), 30),
+            solver.Event('A-1', 'A', ('p1',), ('g1',), 30),
+            solver.Event('B-0', 'B', ('p1', 'p2'), ('g1', 'g2'), 50),
+            solver.Event('C-0', 'C', ('p2',), ('g2',), 20),
+            solver.Event('D-0', 'D', ('p3',), (), 10),
+            solver.Event('E-0', 'E', (), ('g2',), 20),
+        ]
+        rooms = [solver.Room('R1', 60), solver.Room('R2', 30)]
+        return solver.Problem(events, rooms, days=2, periods=3, **kwargs)
+
+    def test_feasible_instance(self):
+        problem = self.problem()
+        result = solve(problem)
+        self.assertTrue(result.feasible)
+        self.assertValid(problem, result)
+
+    def test_same_seed_same_timetable(self):
+        self.assertEqual(solve(self.problem()).assignment, solve(self.problem()).assignment)
+
+    def test_respects_fixed_occupancy_and_unavailability(self):
+        # فقط یک کلاس و چهار خانه زمانی: خانه ۰ کلاس، خانه‌های ۱ و ۲ برای p1، خانه ۲ برای p2 و خانه ۳ برای g1 پر است
+        events = [solver.Event('A-0', 'A', ('p1',)), solver.Event('B-0', 'B', ('p2',), ('g1',))]
+        problem = solver.Problem(events, [solver.Room('R1')], days=2, periods=2,
+                                 unavailable={'p1': {1, 2}}, busy_rooms={'R1': {0}}, busy_professors={'p2': {2}},
+                                 busy_groups={'g1': {3}})
+        result = solve(problem)
+        self.assertTrue(result.feasible)
+        self.assertValid(problem, result)
+        self.assertEqual({event_id: option[0] for event_id, option in result.assignment.items()},
+                         {'A-0': 3, 'B-0': 1})
+
+    def test_infeasible_instance_reports_hard_conflicts(self):
+        events = [solver.Event(f'A-{i}', 'A', groups=('g1',)) for i in range(3)]
+        result = solve(solver.Problem(events, [solver.Room('R1')], days=1, periods=2), time_budget=0.5)
+        self.assertFalse(result.feasible)
+        self.assertGreater(result.hard, 0)
+
+    def test_resolve_keeps_unchanged_events(self):
+        problem = self.problem()
+        first = solve(problem)
+        problem.events.append(solver.Event('F-0', 'F', ('p3',), ('g1',), 10))
+        second = solve(problem, previous=first.assignment, seed=11)
+        self.assertTrue(second.feasible)
+        self.assertValid(problem, second)
+        for event_id, option in first.assignment.items():
+            self.assertEqual(second.assignment[event_id], option, event_id)
+
+    def test_previous_options_that_no_longer_fit_are_dropped(self):
+        problem = self.problem()
+        previous = {'A-0': (99, 'R1', 'p1'), 'C-0': (0, 'R9', 'p2'), 'D-0': (0, 'R1', 'p9')}
+        result = solve(problem, previous=previous)
+        self.assertTrue(result.feasible)
+        self.assertValid(problem, result)
+
+    def test_empty_and_invalid_problems(self):
+        self.assertEqual(solve(solver.Problem([], [], 0, 0)).assignment, {})
+        with self.assertRaises(ValueError):
+            solve(solver.Problem([solver.Event('A-0', 'A')], [], 1, 1))
+
+
+@override_settings(TIMETABLE_DAYS=2, TIMETABLE_PERIODS=2)
+class DepartmentTimetableTests(TestCase):
+    TERM = '14031'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.departments = []
+        for code in ('D1', 'D2'):
+            department = Department(code=code, name=code, established_Date=jdatetime.date(1360, 1, 1))
+            department.faculty = department
+            department.save()
+            cls.departments.append(department)
+        course = Course.objects.create(code='1000001', name="ریاضی", units=3, department=cls.departments[0])
+        Cohort.objects.create(name="ورودی ۱۴۰۳", department=cls.departments[0], size=30).courses.add(course)
+        Course.objects.create(code='2000001', name="فیزیک", units=1, department=cls.departments[1])
+        Room.objects.create(code='R1', capacity=40)
+        Room.objects.create(code='R2', capacity=40)
+        # جلسه ثابت دپارتمان دوم در خانه ۰ کلاس R1
+        TimetableEntry.objects.create(term=cls.TERM, course_id='2000001', room_id='R1', day=0, period=1)
+
+    def test_department_save_keeps_other_departments(self):
+        department = self.departments[0]
+        problem = build_problem(department, self.TERM)
+        self.assertEqual(problem.busy_rooms, {'R1': {0}})
+        # رکوردی از نیمسال دیگر نباید حذف یا اشغال شود
+        TimetableEntry.objects.create(term='14032', course_id='1000001', room_id='R2', day=1, period=2)
+        assignment = {'1000001-0': (0, 'R2', None), '1000001-1': (1, 'R1', None)}
+
+        self.assertEqual(save_assignment(self.TERM, problem, assignment, department), 2)
+        self.assertEqual(save_assignment(self.TERM, problem, assignment, department), 2)
+        self.assertEqual(load_assignment(self.TERM), {**assignment, '2000001-0': (0, 'R1', None)})
+        self.assertEqual(TimetableEntry.objects.filter(term='14032').count(), 1)
+
+    def test_whole_term_save_replaces_everything(self):
+        problem = build_problem()
+        self.assertEqual(problem.busy_rooms, {})
+        result = solve(problem)
+        save_assignment(self.TERM, problem, result.assignment)
+        self.assertEqual(load_assignment(self.TERM), result.assignment)